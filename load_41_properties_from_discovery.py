@@ -122,11 +122,14 @@ def load_all_discovered_properties():
                     INSERT INTO underwriting_data (
                         property_id, property_name, deal_stage,
                         file_path, extraction_timestamp,
-                        file_size_mb, file_modified_date
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s
+                        file_size_mb, file_modified_date,
+                        property_city, property_state, market, submarket, county
                     )
-                    RETURNING extraction_id;
+                    SELECT %s, %s, %s, %s, %s, %s, %s,
+                        p.property_city, p.property_state, p.market, p.submarket, p.county
+                    FROM properties p
+                    WHERE p.property_id = %s
+                    RETURNING extraction_id, deal_stage, extraction_timestamp;
                 """, (
                     property_id,
                     property_name,
@@ -134,26 +137,29 @@ def load_all_discovered_properties():
                     file_data.get('file_path', ''),
                     datetime.now(),
                     file_data.get('size_mb', 0),
-                    datetime.fromisoformat(file_data.get('last_modified', '').replace('Z', '+00:00')) if file_data.get('last_modified') else None
+                    datetime.fromisoformat(file_data.get('last_modified', '').replace('Z', '+00:00')) if file_data.get('last_modified') else None,
+                    property_id
                 ))
                 
-                extraction_id = cursor.fetchone()[0]
+                extraction_id, stored_stage, extraction_timestamp = cursor.fetchone()
                 
                 # 3. Add metadata
                 cursor.execute("""
                     INSERT INTO extraction_metadata (
                         extraction_id,
-                        total_fields_attempted,
+                        deal_stage,
+                        extraction_timestamp,
                         successful_extractions,
                         failed_extractions,
                         error_count,
                         warnings_count
-                    ) VALUES (%s, %s, %s, %s, %s, %s);
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s);
                 """, (
                     extraction_id,
+                    stored_stage,
+                    extraction_timestamp,
                     0,  # No fields extracted yet
                     0,
-                    0,
                     1,  # Mark as needing extraction
                     0
                 ))
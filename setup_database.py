@@ -205,7 +205,8 @@ def load_sample_data():
             extraction_id = data_loader.load_extraction_data(
                 extraction_data, 
                 "active_uw_review", 
-                metadata
+                metadata,
+                refresh_views=True
             )
             
             print(f"    ✅ Loaded extraction: {extraction_id}")
@@ -0,0 +1,212 @@
+"""
+PostgreSQL Binary COPY Writer for B&R Capital Dashboard
+
+Encodes rows into the PostgreSQL binary COPY format so numeric-heavy
+tables can be loaded with COPY ... FROM STDIN WITH (FORMAT BINARY)
+without the float -> text -> numeric round trip of text COPY or INSERT.
+
+Format reference: https://www.postgresql.org/docs/current/sql-copy.html
+"""
+
+import io
+import math
+import struct
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+# 11-byte signature, int32 flags, int32 header extension length
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('!h', -1)
+
+_NULL = struct.pack('!i', -1)
+_PG_EPOCH_DATE = date(2000, 1, 1)
+_PG_EPOCH_DATETIME = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+# Numeric sign flags
+_NUMERIC_POS = 0x0000
+_NUMERIC_NEG = 0x4000
+_NUMERIC_NAN = 0xC000
+
+
+def _encode_int2(value: Any) -> bytes:
+    return struct.pack('!h', int(value))
+
+
+def _encode_int4(value: Any) -> bytes:
+    return struct.pack('!i', int(value))
+
+
+def _encode_int8(value: Any) -> bytes:
+    return struct.pack('!q', int(value))
+
+
+def _encode_float4(value: Any) -> bytes:
+    return struct.pack('!f', float(value))
+
+
+def _encode_float8(value: Any) -> bytes:
+    return struct.pack('!d', float(value))
+
+
+def _encode_text(value: Any) -> bytes:
+    return str(value).encode('utf-8')
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode an already serialized JSON document (jsonb binary format version 1)"""
+    return b'\x01' + value.encode('utf-8')
+
+
+def _encode_uuid(value: Any) -> bytes:
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(str(value))
+    return value.bytes
+
+
+def _encode_date(value: Any) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    elif isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return struct.pack('!i', (value - _PG_EPOCH_DATE).days)
+
+
+def _encode_timestamptz(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _PG_EPOCH_DATETIME
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack('!q', micros)
+
+
+def _encode_numeric(value: Any) -> bytes:
+    """Encode a value as PostgreSQL NUMERIC (base-10000 digit groups)"""
+    if isinstance(value, float) and math.isnan(value):
+        return struct.pack('!hhHh', 0, 0, _NUMERIC_NAN, 0)
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    if value.is_nan():
+        return struct.pack('!hhHh', 0, 0, _NUMERIC_NAN, 0)
+    if value.is_infinite():
+        raise ValueError(f"Cannot store infinite value {value} in NUMERIC column")
+
+    sign, digits, exponent = value.as_tuple()
+    digit_str = ''.join(map(str, digits))
+    dscale = max(0, -exponent)
+
+    # Split into integer and fractional digit strings around the decimal point
+    if exponent >= 0:
+        int_part, frac_part = digit_str + '0' * exponent, ''
+    elif len(digit_str) <= -exponent:
+        int_part, frac_part = '', digit_str.rjust(-exponent, '0')
+    else:
+        int_part, frac_part = digit_str[:exponent], digit_str[exponent:]
+
+    # Pad to whole base-10000 groups aligned on the decimal point
+    int_part = int_part.rjust(-(-len(int_part) // 4) * 4, '0')
+    frac_part = frac_part.ljust(-(-len(frac_part) // 4) * 4, '0')
+    groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+
+    # Strip leading and trailing zero groups
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+
+    if not groups:
+        return struct.pack('!hhHh', 0, 0, _NUMERIC_POS, dscale)
+
+    header = struct.pack('!hhHh', len(groups), weight,
+                         _NUMERIC_NEG if sign else _NUMERIC_POS, dscale)
+    return header + struct.pack(f'!{len(groups)}H', *groups)
+
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    'int2': _encode_int2,
+    'int4': _encode_int4,
+    'int8': _encode_int8,
+    'float4': _encode_float4,
+    'float8': _encode_float8,
+    'numeric': _encode_numeric,
+    'text': _encode_text,
+    'jsonb': _encode_jsonb,
+    'uuid': _encode_uuid,
+    'date': _encode_date,
+    'timestamptz': _encode_timestamptz,
+}
+
+
+def write_binary_rows(buffer: io.BytesIO, column_types: Sequence[str],
+                      rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Write rows in PostgreSQL binary COPY format, including header and trailer
+
+    Args:
+        buffer: Binary buffer to write into
+        column_types: Type name per column (keys of ENCODERS)
+        rows: Row value sequences, None is written as NULL
+
+    Returns:
+        Number of rows written
+    """
+    encoders = [ENCODERS[column_type] for column_type in column_types]
+    field_count = struct.pack('!h', len(encoders))
+    write = buffer.write
+
+    write(PGCOPY_HEADER)
+    row_count = 0
+    for row in rows:
+        write(field_count)
+        for encode, value in zip(encoders, row):
+            if value is None:
+                write(_NULL)
+            else:
+                encoded = encode(value)
+                write(struct.pack('!i', len(encoded)))
+                write(encoded)
+        row_count += 1
+    write(PGCOPY_TRAILER)
+
+    return row_count
+
+
+def copy_rows_binary(cursor, table: str, columns: Sequence[str],
+                     column_types: Sequence[str], rows: Iterable[Sequence[Any]],
+                     buffer: Optional[io.BytesIO] = None) -> int:
+    """
+    Load rows into a table with COPY ... FROM STDIN WITH (FORMAT BINARY)
+
+    Args:
+        cursor: psycopg2 cursor
+        table: Target table name
+        columns: Target column names, in row order
+        column_types: Binary type per column (keys of ENCODERS)
+        rows: Row value sequences
+        buffer: Reusable buffer, reset in place before writing
+
+    Returns:
+        Number of rows copied
+    """
+    if buffer is None:
+        buffer = io.BytesIO()
+    else:
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    row_count = write_binary_rows(buffer, column_types, rows)
+    if row_count == 0:
+        return 0
+
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT BINARY)",
+        buffer
+    )
+    return row_count
@@ -7,8 +7,11 @@ database operations for the comprehensive underwriting model data.
 
 import os
 import logging
+import threading
+import weakref
 import psycopg2
 from psycopg2 import pool
+from psycopg2.extras import register_uuid
 from contextlib import contextmanager
 from typing import Optional, Dict, Any
 import structlog
@@ -16,6 +19,15 @@ import structlog
 # Configure logging
 logger = structlog.get_logger().bind(component="DatabaseConnection")
 
+# Settings applied to every pooled session. Identically partitioned tables
+# (underwriting_data and its child tables) are only joined partition-wise
+# when the planner is allowed to, and it is off by default; setting it per
+# session needs no database ownership, unlike ALTER DATABASE ... SET
+SESSION_OPTIONS = "-c enable_partitionwise_join=on"
+
+# Adapt uuid.UUID parameters natively and return UUID columns as uuid.UUID
+register_uuid()
+
 class DatabaseConfig:
     """Database configuration management"""
     
@@ -47,7 +59,8 @@ class DatabaseConfig:
             'database': self.database_name,
             'user': self.username,
             'password': self.password,
-            'connect_timeout': self.connection_timeout
+            'connect_timeout': self.connection_timeout,
+            'options': SESSION_OPTIONS
         }
 
 class DatabaseConnectionManager:
@@ -81,13 +94,22 @@ class DatabaseConnectionManager:
             raise
     
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
+    def get_connection(self, autocommit=False):
+        """
+        Context manager for database connections
+        
+        Args:
+            autocommit: Run without an implicit transaction, e.g. for
+                CREATE DATABASE; the connection is reset before it returns
+                to the pool
+        """
         connection = None
         try:
             # Get connection from pool
             connection = self.connection_pool.getconn()
-            logger.debug("database_connection_acquired")
+            if autocommit:
+                connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            logger.debug("database_connection_acquired", autocommit=autocommit)
             yield connection
             
         except Exception as e:
@@ -98,15 +120,24 @@ class DatabaseConnectionManager:
             
         finally:
             if connection:
+                if autocommit and not connection.closed:
+                    connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_DEFAULT)
                 # Return connection to pool
                 self.connection_pool.putconn(connection)
                 logger.debug("database_connection_released")
     
     @contextmanager
-    def get_cursor(self, commit=True):
-        """Context manager for database cursors"""
+    def get_cursor(self, commit=True, name=None, cursor_factory=None):
+        """
+        Context manager for database cursors
+        
+        Args:
+            commit: Commit the transaction when the block exits cleanly
+            name: Create a named server-side cursor that streams results
+            cursor_factory: psycopg2 cursor class, e.g. RealDictCursor
+        """
         with self.get_connection() as connection:
-            cursor = connection.cursor()
+            cursor = connection.cursor(name=name, cursor_factory=cursor_factory)
             try:
                 yield cursor
                 if commit:
@@ -185,20 +216,71 @@ def get_database_manager() -> DatabaseConnectionManager:
     return db_manager
 
 def initialize_database(config: Optional[DatabaseConfig] = None):
-    """Initialize the database connection"""
+    """
+    Initialize the database connection
+    
+    The current pool is kept when it already connects with the same
+    parameters; otherwise it is closed once its replacement is up, so
+    switching databases does not leak pooled connections.
+    """
     global db_manager
+    config = config or DatabaseConfig()
+    previous = db_manager
+    if previous is not None and previous.config.get_connection_params() == config.get_connection_params():
+        return previous
+    
     db_manager = DatabaseConnectionManager(config)
+    if previous is not None:
+        previous.close_all_connections()
     return db_manager
 
 # Convenience functions
-def get_connection():
+def get_connection(autocommit=False):
     """Get a database connection"""
-    return get_database_manager().get_connection()
+    return get_database_manager().get_connection(autocommit)
 
-def get_cursor(commit=True):
+def get_cursor(commit=True, name=None, cursor_factory=None):
     """Get a database cursor"""
-    return get_database_manager().get_cursor(commit)
+    return get_database_manager().get_cursor(commit, name, cursor_factory)
 
 def test_connection() -> bool:
     """Test database connectivity"""
-    return get_database_manager().test_connection()
\ No newline at end of file
+    return get_database_manager().test_connection()
+
+# Prepared statements kept per connection before they are all deallocated
+MAX_PREPARED_STATEMENTS = 100
+
+# Names of server-side prepared statements already created on each connection
+_prepared_statements = weakref.WeakKeyDictionary()
+_prepared_statements_lock = threading.Lock()
+
+def execute_prepared(cursor, name: str, sql: str, params):
+    """
+    Execute a statement through a server-side prepared statement
+    
+    The statement is PREPAREd the first time it is used on a connection and
+    EXECUTEd afterwards, so PostgreSQL skips parse and planning on every
+    later call. `sql` uses psycopg2 %s placeholders and must not contain a
+    literal percent sign. Once a connection holds MAX_PREPARED_STATEMENTS,
+    they are deallocated so long-lived pooled connections stay bounded.
+    """
+    connection = cursor.connection
+    with _prepared_statements_lock:
+        prepared = _prepared_statements.setdefault(connection, set())
+    
+    if name not in prepared:
+        if len(prepared) >= MAX_PREPARED_STATEMENTS:
+            cursor.execute("DEALLOCATE ALL")
+            prepared.clear()
+            logger.debug("prepared_statements_deallocated", limit=MAX_PREPARED_STATEMENTS)
+        
+        parts = sql.split('%s')
+        statement = parts[0] + ''.join(f'${n}{part}' for n, part in enumerate(parts[1:], 1))
+        cursor.execute(f"PREPARE {name} AS {statement}")
+        prepared.add(name)
+        logger.debug("prepared_statement_created", name=name)
+    
+    if params:
+        cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
\ No newline at end of file
@@ -12,25 +12,217 @@ Features:
 - Comprehensive error handling
 """
 
+import io
 import json
+import re
 import uuid
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from functools import cached_property
+from itertools import islice, product
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import structlog
 import pandas as pd
-from .connection import get_cursor, get_connection
-from .schema import SchemaManager
+from psycopg2.extras import RealDictCursor, execute_values
+from .connection import get_cursor, get_connection, execute_prepared
+from .schema import CASHFLOW_METRICS, PROPERTY_GEOGRAPHY_COLUMNS, SchemaManager
+from .schema_fields import (
+    HOT_FIELD_SPEC, JSONB_FIELD_KEYS, UNDERWRITING_COLUMNS, UNDERWRITING_COLUMN_LIST,
+    UNDERWRITING_FIELD_MAPPING
+)
+from .ids import new_uuids
+from .binary_copy import copy_rows_binary
+
+try:
+    import ijson
+except ImportError:  # Fall back to loading the whole file with json
+    ijson = None
 
 logger = structlog.get_logger().bind(component="DataLoader")
 
+# Comparable field suffixes in column order (column name is 'comp_' + suffix)
+RENT_COMP_FIELDS = (
+    'name', 'address', 'city', 'distance', 'units', 'year_built', 'rent_psf', 'total_rent'
+)
+SALES_COMP_FIELDS = (
+    'name', 'address', 'city', 'units', 'year_built', 'price', 'price_per_unit',
+    'cap_rate', 'sale_date'
+)
+MAX_COMPARABLES = 20
+
+# Comparable field patterns, e.g. RENT_COMP_3_RENT_PSF -> (3, 'RENT_PSF')
+_RENT_COMP_RE = re.compile(
+    rf"^RENT_COMP_(\d+)_({'|'.join(field.upper() for field in RENT_COMP_FIELDS)})$"
+)
+_SALES_COMP_RE = re.compile(
+    rf"^SALES_COMP_(\d+)_({'|'.join(field.upper() for field in SALES_COMP_FIELDS)})$"
+)
+
+# jsonb_to_recordset column types for comparable fields. Integer columns are
+# read as numeric so JSON values like 1985.0 are rounded by the INSERT's
+# assignment cast instead of failing integer input.
+_COMP_RECORD_TYPES = {
+    'name': 'text', 'address': 'text', 'city': 'text', 'distance': 'numeric',
+    'units': 'numeric', 'year_built': 'numeric', 'rent_psf': 'numeric',
+    'total_rent': 'numeric', 'price': 'numeric', 'price_per_unit': 'numeric',
+    'cap_rate': 'numeric', 'sale_date': 'date'
+}
+
+def _comparables_insert_sql(table: str, fields: Sequence[str]) -> str:
+    """All of an extraction's comparables in one statement with a single JSON array parameter"""
+    return f"""
+    INSERT INTO {table} (
+        extraction_id, deal_stage, extraction_timestamp, property_id, comp_number,
+        {', '.join('comp_' + field for field in fields)}
+    )
+    SELECT %s::uuid, %s::deal_stage_enum, %s::timestamptz, %s::uuid, t.comp_number,
+        {', '.join('t.' + field for field in fields)}
+    FROM jsonb_to_recordset(%s::jsonb) AS t(
+        comp_number integer, {', '.join(f'{field} {_COMP_RECORD_TYPES[field]}' for field in fields)}
+    )
+"""
+
+_RENT_COMP_INSERT_SQL = _comparables_insert_sql('rent_comparables', RENT_COMP_FIELDS)
+_SALES_COMP_INSERT_SQL = _comparables_insert_sql('sales_comparables', SALES_COMP_FIELDS)
+
+# Annual cashflow extraction keys per year, e.g. 'NET_OPERATING_INCOME_YEAR_3',
+# in metric_id order
+CASHFLOW_FIELDS = tuple(metric.upper() for metric in CASHFLOW_METRICS)
+_CASHFLOW_KEYS = {
+    year: tuple(f"{field}_YEAR_{year}" for field in CASHFLOW_FIELDS)
+    for year in range(1, 6)  # Years 1-5
+}
+
+# Column order and binary COPY types for annual_cashflows; an enum's binary
+# form is its label, so deal_stage is sent as text
+ANNUAL_CASHFLOW_COLUMNS = (
+    'extraction_id', 'deal_stage', 'extraction_timestamp', 'property_id',
+    'year_number', 'metric_id', 'value'
+)
+ANNUAL_CASHFLOW_TYPES = ('uuid', 'text', 'timestamptz', 'uuid', 'int4', 'int2', 'float8')
+
+# Binary COPY types of the underwriting_data columns; the enum and varchar
+# columns take their text form
+_UNDERWRITING_COPY_TYPES = {
+    'extraction_id': 'uuid', 'property_id': 'uuid', 'property_name': 'text',
+    'deal_stage': 'text', 'file_path': 'text', 'extraction_timestamp': 'timestamptz',
+    'file_modified_date': 'timestamptz', 'file_size_mb': 'numeric',
+    'units': 'int4', 'year_built': 'int4', 'purchase_price': 'numeric', 'loan_amount': 'numeric',
+    'effective_gross_income': 'float8', 'total_operating_expenses': 'float8',
+    'net_operating_income': 'float8', 'last_sale_cap_rate': 'float4', 'exit_cap_rate': 'float4',
+    'levered_returns_irr': 'float4', 'levered_returns_moic': 'float4', 'fields': 'jsonb',
+}
+
+# Column order and binary COPY types for underwriting_data_stage
+UNDERWRITING_STAGE_COLUMNS = ('batch_id',) + UNDERWRITING_COLUMNS
+UNDERWRITING_STAGE_TYPES = ('uuid',) + tuple(_UNDERWRITING_COPY_TYPES[column] for column in UNDERWRITING_COLUMNS)
+
+# Property upsert: returns the new or existing property_id, and the stored
+# geography copied onto the underwriting row, in one statement.
+# xmax = 0 only for freshly inserted rows, which tells us whether the
+# property is new without a separate SELECT.
+_PROPERTY_UPSERT_SQL = f"""
+    INSERT INTO properties (
+        property_id, property_name, property_city, property_state,
+        property_address, market, submarket, county
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (property_name)
+    DO UPDATE SET property_name = EXCLUDED.property_name
+    RETURNING property_id, (xmax = 0) AS inserted, {', '.join(PROPERTY_GEOGRAPHY_COLUMNS)}
+"""
+
+# Property upsert for many properties at once (execute_values); names must be unique
+_PROPERTY_BATCH_UPSERT_SQL = """
+    INSERT INTO properties (
+        property_id, property_name, property_city, property_state,
+        property_address, market, submarket, county
+    ) VALUES %s
+    ON CONFLICT (property_name)
+    DO UPDATE SET property_name = EXCLUDED.property_name
+    RETURNING property_name, property_id, (xmax = 0) AS inserted
+"""
+
+# Strings treated as missing values (compared case-insensitively)
+_NULL_STRINGS = ('', 'n/a', 'na', 'null')
+
+# Every capitalization of _NULL_STRINGS, e.g. 'nA' and 'NuLL', so the
+# vectorized replace in _prepare_underwriting_batch needs no lowercasing pass
+_NULL_STRING_VARIANTS = tuple(sorted({
+    ''.join(chars)
+    for null_string in _NULL_STRINGS
+    for chars in product(*({char.lower(), char.upper()} for char in null_string))
+}))
+
+# Results per chunk when preparing batch values with pandas
+BATCH_CHUNK_SIZE = 500
+
+# Rows fetched per server round-trip when streaming property history
+HISTORY_FETCH_SIZE = 1000
+
+# total_fields_attempted is generated from the two counters
+EXTRACTION_METADATA_COLUMNS = (
+    'extraction_id', 'deal_stage', 'extraction_timestamp', 'successful_extractions',
+    'failed_extractions', 'extraction_duration_ms', 'error_count', 'warnings_count'
+)
+
+# Property upsert + underwriting insert (+ metadata insert) as one writable CTE.
+# property_id and the geography are taken from the upsert, so they are not
+# parameters; property_id is the second column.
+# The stored extraction_timestamp is returned so child rows reference the
+# exact underwriting_data key.
+_UNDERWRITING_CTE_SQL = f"""
+    WITH props AS ({_PROPERTY_UPSERT_SQL}),
+    uw AS (
+        INSERT INTO underwriting_data ({UNDERWRITING_COLUMN_LIST}, {', '.join(PROPERTY_GEOGRAPHY_COLUMNS)})
+        VALUES (%s, (SELECT property_id FROM props), {', '.join(['%s'] * (len(UNDERWRITING_COLUMNS) - 2))},
+                {', '.join(f'(SELECT {column} FROM props)' for column in PROPERTY_GEOGRAPHY_COLUMNS)})
+        RETURNING extraction_id, deal_stage, extraction_timestamp
+    ){{metadata_cte}}
+    SELECT props.property_id, props.inserted, uw.extraction_timestamp FROM props, uw
+"""
+_METADATA_CTE_SQL = f""",
+    meta AS (
+        INSERT INTO extraction_metadata ({', '.join(EXTRACTION_METADATA_COLUMNS)})
+        SELECT uw.extraction_id, uw.deal_stage, uw.extraction_timestamp,
+            {', '.join(['%s'] * (len(EXTRACTION_METADATA_COLUMNS) - 3))} FROM uw
+    )"""
+_UNDERWRITING_INSERT_SQL = _UNDERWRITING_CTE_SQL.format(metadata_cte='')
+_METADATA_BATCH_INSERT_SQL = f"INSERT INTO extraction_metadata ({', '.join(EXTRACTION_METADATA_COLUMNS)}) VALUES %s"
+_UNDERWRITING_WITH_METADATA_INSERT_SQL = _UNDERWRITING_CTE_SQL.format(metadata_cte=_METADATA_CTE_SQL)
+
 class DataLoader:
     """Loads extracted underwriting data into the database"""
     
     def __init__(self):
-        self.schema_manager = SchemaManager()
+        # COPY buffer reused across extractions instead of reallocated per flush
+        self._cashflow_buffer = io.BytesIO()
+        # Month _ensure_partitions last ran in
+        self._partitions_month: Optional[date] = None
+    
+    @cached_property
+    def schema_manager(self) -> SchemaManager:
+        """Schema manager, created on first use so plain data loading skips it"""
+        return SchemaManager()
+    
+    def _ensure_partitions(self):
+        """Create upcoming monthly partitions, at most once per calendar month per loader"""
+        month = datetime.now(timezone.utc).date().replace(day=1)
+        if self._partitions_month == month:
+            return
         
+        try:
+            self.schema_manager.ensure_future_partitions()
+        except Exception as e:
+            # Rows still land in the DEFAULT partition; retried on the next load
+            logger.warning("partition_maintenance_failed", error=str(e))
+            return
+        self._partitions_month = month
+    
     def load_extraction_data(self, extraction_data: Dict[str, Any], 
-                           deal_stage: str, metadata: Optional[Dict] = None) -> str:
+                           deal_stage: str, metadata: Optional[Dict] = None,
+                           bulk: bool = False,
+                           field_values: Optional[Sequence[Any]] = None,
+                           refresh_views: bool = False) -> str:
         """
         Load a single extraction into the database
         
@@ -38,28 +230,41 @@ class DataLoader:
             extraction_data: The extracted data dictionary
             deal_stage: The deal stage (e.g., 'active_uw_review')
             metadata: Optional metadata about the extraction
+            bulk: Commit without waiting for the WAL flush (batch loads)
+            field_values: Pre-normalized underwriting field values (batch loads)
+            refresh_views: Refresh the materialized views once committed. Off
+                by default: callers loading many extractions refresh once per batch
             
         Returns:
             extraction_id: UUID of the created extraction record
         """
+        self._ensure_partitions()
+        
         try:
+            # Generate both candidate keys with one call
+            new_property_id, extraction_id = new_uuids(2)
+            
             with get_cursor() as cursor:
-                # 1. Register or get property
-                property_id = self._register_property(cursor, extraction_data)
+                if bulk:
+                    # A crash may lose the last few commits but never corrupts
+                    # data; a batch can simply be reloaded
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
                 
-                # 2. Insert main underwriting data
-                extraction_id = self._insert_underwriting_data(
-                    cursor, property_id, extraction_data, deal_stage, metadata
+                # 1. Register property, insert main underwriting data and
+                #    extraction metadata in a single statement
+                property_id, extraction_key = self._insert_underwriting_data(
+                    cursor, extraction_id, new_property_id, extraction_data, deal_stage, metadata,
+                    field_values
                 )
                 
-                # 3. Insert related data
-                self._insert_annual_cashflows(cursor, extraction_id, property_id, extraction_data)
-                self._insert_rent_comparables(cursor, extraction_id, property_id, extraction_data)
-                self._insert_sales_comparables(cursor, extraction_id, property_id, extraction_data)
+                # 2. Insert related data
+                self._insert_annual_cashflows(cursor, extraction_key, property_id, extraction_data)
+                self._insert_rent_comparables(cursor, extraction_key, property_id, extraction_data)
+                self._insert_sales_comparables(cursor, extraction_key, property_id, extraction_data)
                 
-                # 4. Insert extraction metadata
-                if metadata:
-                    self._insert_extraction_metadata(cursor, extraction_id, metadata)
+                # 3. Version numbering and latest flag for the property, in
+                #    the same transaction so no committed row is left unversioned
+                self._finalize_extractions(cursor, [extraction_id])
                 
                 logger.info(
                     "extraction_data_loaded",
@@ -69,8 +274,6 @@ class DataLoader:
                     deal_stage=deal_stage
                 )
                 
-                return extraction_id
-                
         except Exception as e:
             logger.error(
                 "extraction_data_load_failed",
@@ -79,31 +282,23 @@ class DataLoader:
                 deal_stage=deal_stage
             )
             raise
+        
+        # After commit, so the refresh sees the new rows; the extraction is
+        # loaded even if the refresh fails
+        if refresh_views:
+            self.schema_manager.refresh_materialized_views()
+        
+        return str(extraction_id)
     
-    def _register_property(self, cursor, extraction_data: Dict[str, Any]) -> str:
-        """Register a property or get existing property ID"""
+    def _property_params(self, extraction_data: Dict[str, Any],
+                         new_property_id: uuid.UUID) -> List[Any]:
+        """Parameters for the property upsert"""
         property_name = extraction_data.get('PROPERTY_NAME')
         if not property_name:
             raise ValueError("PROPERTY_NAME is required")
         
-        # Check if property exists
-        cursor.execute("""
-            SELECT property_id FROM properties WHERE property_name = %s
-        """, (property_name,))
-        
-        result = cursor.fetchone()
-        if result:
-            return result[0]
-        
-        # Create new property
-        property_id = str(uuid.uuid4())
-        cursor.execute("""
-            INSERT INTO properties (
-                property_id, property_name, property_city, property_state,
-                property_address, market, submarket, county
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            property_id,
+        return [
+            new_property_id,
             property_name,
             extraction_data.get('PROPERTY_CITY'),
             extraction_data.get('PROPERTY_STATE'),
@@ -111,79 +306,58 @@ class DataLoader:
             extraction_data.get('MARKET'),
             extraction_data.get('SUBMARKET'),
             extraction_data.get('COUNTY')
-        ))
-        
-        logger.info("property_registered", property_id=property_id, property_name=property_name)
-        return property_id
+        ]
+    
+    def _finalize_extractions(self, cursor, extraction_ids: Sequence[Any]):
+        """Number versions and flag the latest one for the properties of new extractions"""
+        cursor.execute(
+            "SELECT finalize_extraction_batch(%s::uuid[])",
+            ([str(extraction_id) for extraction_id in extraction_ids],)
+        )
+        logger.debug("extractions_finalized", count=len(extraction_ids),
+                     updated_rows=cursor.fetchone()[0])
     
-    def _insert_underwriting_data(self, cursor, property_id: str, 
+    def _insert_underwriting_data(self, cursor, extraction_id: uuid.UUID, new_property_id: uuid.UUID,
                                  extraction_data: Dict[str, Any], 
-                                 deal_stage: str, metadata: Optional[Dict]) -> str:
-        """Insert main underwriting data"""
-        extraction_id = str(uuid.uuid4())
+                                 deal_stage: str, metadata: Optional[Dict],
+                                 field_values: Optional[Sequence[Any]] = None) -> Tuple[uuid.UUID, Tuple[Any, ...]]:
+        """
+        Register the property and insert main underwriting data and extraction
+        metadata with one writable CTE
         
+        Returns:
+            property_id: UUID of the new or existing property
+            extraction_key: (extraction_id, deal_stage, extraction_timestamp),
+                the underwriting_data key child rows reference
+        """
         # Convert deal stage to enum format
         deal_stage_enum = self._convert_deal_stage(deal_stage)
         
         # Prepare data with type conversion
-        data_values = self._prepare_underwriting_values(extraction_data, metadata)
+        data_values = self._prepare_underwriting_values(extraction_data, metadata, field_values)
         
-        cursor.execute("""
-            INSERT INTO underwriting_data (
-                extraction_id, property_id, property_name, deal_stage,
-                file_path, extraction_timestamp, file_modified_date, file_size_mb,
-                
-                -- General Assumptions
-                year_built, year_renovated, location_quality, building_quality,
-                units, avg_square_feet, parking_spaces_covered, parking_spaces_uncovered,
-                individually_metered, current_owner, last_sale_date, last_sale_price,
-                last_sale_price_per_unit, last_sale_cap_rate, building_height,
-                building_type, project_type, number_of_buildings, building_zoning,
-                land_area, parcel_number, property_latitude, property_longitude,
-                property_address_field, property_zip,
-                
-                -- Exit Assumptions
-                exit_period_months, exit_cap_rate, sales_transaction_costs,
-                
-                -- NOI Assumptions
-                empirical_rent, rent_psf, gross_potential_rental_income,
-                concessions, loss_to_lease, vacancy_loss, bad_debts, other_loss,
-                property_management_fee, net_rental_income, parking_income,
-                laundry_income, other_income, effective_gross_income,
-                
-                -- Operating Expenses
-                advertising_marketing, management_fee, payroll, repairs_maintenance,
-                contract_services, turnover, utilities, insurance, real_estate_taxes,
-                other_expenses, total_operating_expenses, net_operating_income,
-                
-                -- Debt and Equity
-                purchase_price, hard_costs_budget, soft_costs_budget,
-                total_hard_costs, total_soft_costs, total_acquisition_budget,
-                loan_amount, loan_to_cost, loan_to_value,
-                equity_lp_capital, equity_gp_capital,
-                
-                -- Return Metrics
-                t12_return_on_pp, t12_return_on_cost, levered_returns_irr,
-                levered_returns_moic, basis_unit_at_close, basis_unit_at_exit
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s
-            )
-        """, [
-            extraction_id, property_id, extraction_data.get('PROPERTY_NAME'), deal_stage_enum,
+        params = self._property_params(extraction_data, new_property_id) + [
+            extraction_id, extraction_data.get('PROPERTY_NAME'), deal_stage_enum,
             data_values['file_path'], data_values['extraction_timestamp'], 
             data_values['file_modified_date'], data_values['file_size_mb']
-        ] + data_values['field_values'])
+        ] + self._underwriting_field_params(data_values['field_values'])
         
-        return extraction_id
+        if metadata:
+            execute_prepared(cursor, 'dl_underwriting_with_metadata_insert',
+                             _UNDERWRITING_WITH_METADATA_INSERT_SQL,
+                             params + self._extraction_metadata_values(metadata))
+        else:
+            execute_prepared(cursor, 'dl_underwriting_insert', _UNDERWRITING_INSERT_SQL, params)
+        
+        property_id, inserted, extraction_timestamp = cursor.fetchone()
+        if inserted:
+            logger.info("property_registered", property_id=property_id,
+                        property_name=extraction_data.get('PROPERTY_NAME'))
+        return property_id, (extraction_id, deal_stage_enum, extraction_timestamp)
     
     def _prepare_underwriting_values(self, extraction_data: Dict[str, Any], 
-                                   metadata: Optional[Dict]) -> Dict[str, Any]:
+                                   metadata: Optional[Dict],
+                                   field_values: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
         """Prepare and convert values for database insertion"""
         
         # Extract metadata
@@ -203,213 +377,151 @@ class DataLoader:
                 file_modified_date = datetime.fromisoformat(file_modified_date.replace('Z', '+00:00'))
             file_size_mb = metadata.get('_file_size_mb')
         
-        # Define field mapping and convert values
-        field_mapping = [
-            # General Assumptions (24 fields)
-            'YEAR_BUILT', 'YEAR_RENOVATED', 'LOCATION_QUALITY', 'BUILDING_QUALITY',
-            'UNITS', 'AVG_SQUARE_FEET', 'NUMBER_OF_PARKING_SPACES_COVERED', 
-            'NUMBER_OF_PARKING_SPACES_UNCOVERED', 'INDIVIDUALLY_METERED', 'CURRENT_OWNER',
-            'LAST_SALE_DATE', 'LAST_SALE_PRICE', 'LAST_SALE_PRICE_PER_UNIT',
-            'LAST_SALE_CAP_RATE', 'BUILDING_HEIGHT', 'BUILDING_TYPE', 'PROJECT_TYPE',
-            'NUMBER_OF_BUILDINGS', 'BUILDING_ZONING', 'LAND_AREA', 'PARCEL_NUMBER',
-            'PROPERTY_LATITUDE', 'PROPERTY_LONGITUDE', 'PROPERTY_ADDRESS', 'PROPERTY_ZIP',
-            
-            # Exit Assumptions (3 fields)
-            'EXIT_PERIOD_MONTHS', 'EXIT_CAP_RATE', 'SALES_TRANSACTION_COSTS',
-            
-            # NOI Assumptions (14 fields)
-            'EMPIRICAL_RENT', 'RENT_PSF', 'GROSS_POTENTIAL_RENTAL_INCOME',
-            'CONCESSIONS', 'LOSS_TO_LEASE', 'VACANCY_LOSS', 'BAD_DEBTS', 'OTHER_LOSS',
-            'PROPERTY_MANAGEMENT_FEE', 'NET_RENTAL_INCOME', 'PARKING_INCOME',
-            'LAUNDRY_INCOME', 'OTHER_INCOME', 'EFFECTIVE_GROSS_INCOME',
-            
-            # Operating Expenses (12 fields)
-            'ADVERTISING_MARKETING', 'MANAGEMENT_FEE', 'PAYROLL', 'REPAIRS_MAINTENANCE',
-            'CONTRACT_SERVICES', 'TURNOVER', 'UTILITIES', 'INSURANCE', 'REAL_ESTATE_TAXES',
-            'OTHER_EXPENSES', 'TOTAL_OPERATING_EXPENSES', 'NET_OPERATING_INCOME',
-            
-            # Debt and Equity (11 fields)
-            'PURCHASE_PRICE', 'HARD_COSTS_BUDGET', 'SOFT_COSTS_BUDGET',
-            'TOTAL_HARD_COSTS', 'TOTAL_SOFT_COSTS', 'TOTAL_ACQUISITION_BUDGET',
-            'LOAN_AMOUNT', 'LOAN_TO_COST', 'LOAN_TO_VALUE',
-            'EQUITY_LP_CAPITAL', 'EQUITY_GP_CAPITAL',
-            
-            # Return Metrics (6 fields)
-            'T12_RETURN_ON_PP', 'T12_RETURN_ON_COST', 'LEVERED_RETURNS_IRR',
-            'LEVERED_RETURNS_MOIC', 'BASIS_UNIT_AT_CLOSE', 'BASIS_UNIT_AT_EXIT'
-        ]
         
+        if field_values is not None:
+            field_values = list(field_values)
+        else:
+            field_values = self._prepare_field_values(extraction_data)
+        
+        return {
+            'file_path': file_path,
+            'extraction_timestamp': extraction_timestamp,
+            'file_modified_date': file_modified_date,
+            'file_size_mb': file_size_mb,
+            'field_values': field_values
+        }
+    
+    def _prepare_field_values(self, extraction_data: Dict[str, Any]) -> List[Any]:
+        """Normalize missing values for a single extraction's underwriting fields"""
         field_values = []
-        for field in field_mapping:
+        for field in UNDERWRITING_FIELD_MAPPING:
             value = extraction_data.get(field)
             
             # Convert to appropriate type
             if pd.isna(value) or value is None or value == '':
                 field_values.append(None)
-            elif isinstance(value, str) and value.lower() in ['n/a', 'na', 'null']:
+            elif isinstance(value, str) and value.lower() in _NULL_STRINGS:
                 field_values.append(None)
             else:
                 field_values.append(value)
         
-        return {
-            'file_path': file_path,
-            'extraction_timestamp': extraction_timestamp,
-            'file_modified_date': file_modified_date,
-            'file_size_mb': file_size_mb,
-            'field_values': field_values
+        return field_values
+    
+    def _underwriting_field_params(self, field_values: Sequence[Any]) -> List[Any]:
+        """
+        Split normalized field values into the typed column values and one
+        `fields` JSON document holding the remaining non-null fields
+        """
+        hot_count = len(HOT_FIELD_SPEC)
+        sparse_fields = {
+            key: value
+            for key, value in zip(JSONB_FIELD_KEYS, field_values[hot_count:])
+            if value is not None
         }
+        return list(field_values[:hot_count]) + [json.dumps(sparse_fields, default=str)]
     
-    def _insert_annual_cashflows(self, cursor, extraction_id: str, property_id: str, 
-                               extraction_data: Dict[str, Any]):
-        """Insert annual cashflow data"""
-        # Look for annual cashflow fields (Year 1-5)
-        cashflow_fields = [
-            'GROSS_POTENTIAL_INCOME', 'VACANCY_LOSS', 'EFFECTIVE_GROSS_INCOME',
-            'OPERATING_EXPENSES', 'NET_OPERATING_INCOME', 'DEBT_SERVICE',
-            'BEFORE_TAX_CASH_FLOW', 'CAPITAL_IMPROVEMENTS', 'TENANT_IMPROVEMENTS',
-            'LEASING_COMMISSIONS'
-        ]
+    def _prepare_underwriting_batch(self, results: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        """
+        Normalize missing values for many extractions at once
         
-        # Extract year-based data (if available)
-        for year in range(1, 6):  # Years 1-5
-            cashflow_data = {}
-            has_data = False
-            
-            for field in cashflow_fields:
-                year_field = f"{field}_YEAR_{year}"
-                if year_field in extraction_data:
-                    cashflow_data[field.lower()] = extraction_data[year_field]
-                    has_data = True
-            
-            if has_data:
-                cursor.execute("""
-                    INSERT INTO annual_cashflows (
-                        extraction_id, property_id, year_number,
-                        gross_potential_income, vacancy_loss, effective_gross_income,
-                        operating_expenses, net_operating_income, debt_service,
-                        before_tax_cash_flow, capital_improvements, tenant_improvements,
-                        leasing_commissions
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    extraction_id, property_id, year,
-                    cashflow_data.get('gross_potential_income'),
-                    cashflow_data.get('vacancy_loss'),
-                    cashflow_data.get('effective_gross_income'),
-                    cashflow_data.get('operating_expenses'),
-                    cashflow_data.get('net_operating_income'),
-                    cashflow_data.get('debt_service'),
-                    cashflow_data.get('before_tax_cash_flow'),
-                    cashflow_data.get('capital_improvements'),
-                    cashflow_data.get('tenant_improvements'),
-                    cashflow_data.get('leasing_commissions')
-                ))
+        Equivalent to calling _prepare_field_values on each result, but the
+        null normalization runs as vectorized pandas operations over the
+        whole batch.
+        
+        Returns:
+            One tuple of field values per result, in UNDERWRITING_FIELD_MAPPING order
+        """
+        if not results:
+            return []
+        
+        # dtype=object keeps the original Python values (no int -> float upcasting)
+        df = pd.DataFrame(results, columns=list(UNDERWRITING_FIELD_MAPPING), dtype=object)
+        
+        df = df.replace(dict.fromkeys(_NULL_STRING_VARIANTS))
+        df = df.where(df.notna(), None)
+        
+        return list(df.itertuples(index=False, name=None))
+    
+    def _insert_annual_cashflows(self, cursor, extraction_key: Tuple[Any, ...], property_id: uuid.UUID,
+                               extraction_data: Dict[str, Any]):
+        """Insert annual cashflow data with a single binary COPY, one row per metric and year"""
+        copy_rows_binary(
+            cursor, 'annual_cashflows', ANNUAL_CASHFLOW_COLUMNS, ANNUAL_CASHFLOW_TYPES,
+            self._annual_cashflow_rows(extraction_key, property_id, extraction_data),
+            buffer=self._cashflow_buffer
+        )
+    
+    def _annual_cashflow_rows(self, extraction_key: Tuple[Any, ...], property_id: uuid.UUID,
+                              extraction_data: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+        """annual_cashflows rows of one extraction; missing metrics get no row"""
+        rows = []
+        for year, year_fields in _CASHFLOW_KEYS.items():
+            for metric_id, year_field in enumerate(year_fields, 1):
+                value = extraction_data.get(year_field)
+                if value is not None:
+                    rows.append((*extraction_key, property_id, year, metric_id, value))
+        return rows
     
-    def _insert_rent_comparables(self, cursor, extraction_id: str, property_id: str,
+    def _insert_rent_comparables(self, cursor, extraction_key: Tuple[Any, ...], property_id: uuid.UUID,
                                extraction_data: Dict[str, Any]):
         """Insert rent comparable data"""
-        # Look for rent comp fields
-        for i in range(1, 21):  # Up to 20 rent comps
-            comp_data = {}
-            has_data = False
-            
-            comp_fields = {
-                f'RENT_COMP_{i}_NAME': 'comp_name',
-                f'RENT_COMP_{i}_ADDRESS': 'comp_address',
-                f'RENT_COMP_{i}_CITY': 'comp_city',
-                f'RENT_COMP_{i}_DISTANCE': 'comp_distance',
-                f'RENT_COMP_{i}_UNITS': 'comp_units',
-                f'RENT_COMP_{i}_YEAR_BUILT': 'comp_year_built',
-                f'RENT_COMP_{i}_RENT_PSF': 'comp_rent_psf',
-                f'RENT_COMP_{i}_TOTAL_RENT': 'comp_total_rent'
-            }
-            
-            for field, db_field in comp_fields.items():
-                if field in extraction_data and extraction_data[field] is not None:
-                    comp_data[db_field] = extraction_data[field]
-                    has_data = True
-            
-            if has_data:
-                cursor.execute("""
-                    INSERT INTO rent_comparables (
-                        extraction_id, property_id, comp_number,
-                        comp_name, comp_address, comp_city, comp_distance,
-                        comp_units, comp_year_built, comp_rent_psf, comp_total_rent
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    extraction_id, property_id, i,
-                    comp_data.get('comp_name'),
-                    comp_data.get('comp_address'),
-                    comp_data.get('comp_city'),
-                    comp_data.get('comp_distance'),
-                    comp_data.get('comp_units'),
-                    comp_data.get('comp_year_built'),
-                    comp_data.get('comp_rent_psf'),
-                    comp_data.get('comp_total_rent')
-                ))
+        self._bulk_insert_comparables(
+            cursor, 'dl_rent_comp_insert', _RENT_COMP_INSERT_SQL, extraction_key, property_id,
+            self._group_comparables(extraction_data, _RENT_COMP_RE)
+        )
     
-    def _insert_sales_comparables(self, cursor, extraction_id: str, property_id: str,
+    def _insert_sales_comparables(self, cursor, extraction_key: Tuple[Any, ...], property_id: uuid.UUID,
                                 extraction_data: Dict[str, Any]):
         """Insert sales comparable data"""
-        # Look for sales comp fields
-        for i in range(1, 21):  # Up to 20 sales comps
-            comp_data = {}
-            has_data = False
-            
-            comp_fields = {
-                f'SALES_COMP_{i}_NAME': 'comp_name',
-                f'SALES_COMP_{i}_ADDRESS': 'comp_address',
-                f'SALES_COMP_{i}_CITY': 'comp_city',
-                f'SALES_COMP_{i}_UNITS': 'comp_units',
-                f'SALES_COMP_{i}_YEAR_BUILT': 'comp_year_built',
-                f'SALES_COMP_{i}_PRICE': 'comp_price',
-                f'SALES_COMP_{i}_PRICE_PER_UNIT': 'comp_price_per_unit',
-                f'SALES_COMP_{i}_CAP_RATE': 'comp_cap_rate',
-                f'SALES_COMP_{i}_SALE_DATE': 'comp_sale_date'
-            }
-            
-            for field, db_field in comp_fields.items():
-                if field in extraction_data and extraction_data[field] is not None:
-                    comp_data[db_field] = extraction_data[field]
-                    has_data = True
-            
-            if has_data:
-                cursor.execute("""
-                    INSERT INTO sales_comparables (
-                        extraction_id, property_id, comp_number,
-                        comp_name, comp_address, comp_city, comp_units,
-                        comp_year_built, comp_price, comp_price_per_unit,
-                        comp_cap_rate, comp_sale_date
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    extraction_id, property_id, i,
-                    comp_data.get('comp_name'),
-                    comp_data.get('comp_address'),
-                    comp_data.get('comp_city'),
-                    comp_data.get('comp_units'),
-                    comp_data.get('comp_year_built'),
-                    comp_data.get('comp_price'),
-                    comp_data.get('comp_price_per_unit'),
-                    comp_data.get('comp_cap_rate'),
-                    comp_data.get('comp_sale_date')
-                ))
+        self._bulk_insert_comparables(
+            cursor, 'dl_sales_comp_insert', _SALES_COMP_INSERT_SQL, extraction_key, property_id,
+            self._group_comparables(extraction_data, _SALES_COMP_RE)
+        )
     
-    def _insert_extraction_metadata(self, cursor, extraction_id: str, metadata: Dict[str, Any]):
-        """Insert extraction metadata"""
-        cursor.execute("""
-            INSERT INTO extraction_metadata (
-                extraction_id, total_fields_attempted, successful_extractions,
-                failed_extractions, extraction_duration_seconds, error_count,
-                warnings_count
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            extraction_id,
-            metadata.get('total_fields', 0),
+    def _bulk_insert_comparables(self, cursor, name: str, sql: str, extraction_key: Tuple[Any, ...],
+                                 property_id: uuid.UUID, comps: Dict[int, Dict[str, Any]]):
+        """
+        Insert every comparable of one extraction with a single prepared statement
+        
+        The rows are sent as one JSON array expanded server-side by
+        jsonb_to_recordset, so the statement has five parameters no matter
+        how many comparables there are.
+        """
+        if not comps:
+            return
+        
+        rows = [
+            # NaN is not valid JSON; store it as NULL
+            {'comp_number': comp_number,
+             **{field: value for field, value in comp_data.items() if value == value}}
+            for comp_number, comp_data in comps.items()
+        ]
+        execute_prepared(cursor, name, sql, (*extraction_key, property_id, json.dumps(rows, default=str)))
+    
+    def _group_comparables(self, extraction_data: Dict[str, Any],
+                           pattern: re.Pattern) -> Dict[int, Dict[str, Any]]:
+        """Group comparable fields by comp number in a single pass over the data"""
+        comps = defaultdict(dict)
+        for field, value in extraction_data.items():
+            if value is None:
+                continue
+            match = pattern.match(field)
+            if match:
+                comp_number = int(match.group(1))
+                if 1 <= comp_number <= MAX_COMPARABLES:
+                    comps[comp_number][match.group(2).lower()] = value
+        
+        return dict(sorted(comps.items()))
+    
+    def _extraction_metadata_values(self, metadata: Dict[str, Any]) -> List[Any]:
+        """Extraction metadata values, excluding the extraction key columns"""
+        return [
             metadata.get('successful', 0),
             metadata.get('total_fields', 0) - metadata.get('successful', 0),
-            metadata.get('duration_seconds', 0),
+            round((metadata.get('duration_seconds') or 0) * 1000),
             len(metadata.get('errors', [])),
             len(metadata.get('warnings', []))
-        ))
+        ]
     
     def _convert_deal_stage(self, deal_stage: str) -> str:
         """Convert deal stage to database enum format"""
@@ -435,21 +547,146 @@ class DataLoader:
             List of extraction IDs that were loaded
         """
         logger.info("loading_batch_extraction_results", file=batch_results_file)
-        
-        with open(batch_results_file, 'r') as f:
-            batch_data = json.load(f)
+        self._ensure_partitions()
         
         extraction_ids = []
+        total_attempted = 0
+        
+        with open(batch_results_file, 'rb') as f:
+            results = self._iter_batch_results(f)
+            while True:
+                chunk = list(islice(results, BATCH_CHUNK_SIZE))
+                if not chunk:
+                    break
+                total_attempted += len(chunk)
+                
+                # Normalize the whole chunk's underwriting fields at once
+                chunk_field_values = self._prepare_underwriting_batch(chunk)
+                
+                try:
+                    chunk_ids = self._load_chunk_staged(chunk, chunk_field_values)
+                except Exception as e:
+                    # Retry one extraction at a time, so only the bad ones are skipped
+                    logger.warning("staged_chunk_load_failed", error=str(e), chunk_size=len(chunk))
+                    chunk_ids = self._load_chunk_rows(chunk, chunk_field_values)
+                
+                extraction_ids.extend(chunk_ids)
+        
+        logger.info(
+            "batch_extraction_results_loaded",
+            total_loaded=len(extraction_ids),
+            total_attempted=total_attempted
+        )
         
-        for result in batch_data.get('results', []):
+        # Once per batch rather than per extraction
+        if extraction_ids:
+            self.schema_manager.refresh_materialized_views()
+        
+        return extraction_ids
+    
+    def _load_chunk_staged(self, chunk: List[Dict[str, Any]],
+                           chunk_field_values: List[Tuple[Any, ...]]) -> List[str]:
+        """
+        Load a chunk of batch results in one transaction through the staging table
+        
+        Properties are upserted with one statement, the underwriting rows
+        are binary COPYed into the unlogged underwriting_data_stage table and
+        moved into underwriting_data by promote_staging, which also numbers
+        their versions, and the chunk's cashflows go out in a single COPY.
+        
+        Returns:
+            Extraction IDs in chunk order
+        """
+        batch_id, *new_ids = new_uuids(1 + 2 * len(chunk))
+        extraction_ids, new_property_ids = new_ids[:len(chunk)], new_ids[len(chunk):]
+        
+        with get_cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = OFF")
+            
+            # 1. Register every property of the chunk
+            property_params = {}
+            for result, new_property_id in zip(chunk, new_property_ids):
+                params = self._property_params(result, new_property_id)
+                property_params.setdefault(params[1], params)
+            
+            property_ids = {}
+            for property_name, property_id, inserted in execute_values(
+                cursor, _PROPERTY_BATCH_UPSERT_SQL, list(property_params.values()), fetch=True
+            ):
+                property_ids[property_name] = property_id
+                if inserted:
+                    logger.info("property_registered", property_id=property_id,
+                                property_name=property_name)
+            
+            # 2. Stage and promote the underwriting rows. Timestamps are made
+            #    timezone-aware so every child row carries the exact stored key
+            stage_rows, extractions = [], []
+            for result, field_values, extraction_id in zip(chunk, chunk_field_values, extraction_ids):
+                deal_stage = self._convert_deal_stage(result.get('_deal_stage', 'active_uw_review'))
+                metadata = result.get('_extraction_metadata', {})
+                values = self._prepare_underwriting_values(result, metadata, field_values)
+                extraction_timestamp = values['extraction_timestamp'].astimezone()
+                property_name = result.get('PROPERTY_NAME')
+                
+                stage_rows.append((
+                    batch_id, extraction_id, property_ids[property_name], property_name, deal_stage,
+                    values['file_path'], extraction_timestamp, values['file_modified_date'],
+                    values['file_size_mb'], *self._underwriting_field_params(values['field_values'])
+                ))
+                extractions.append(((extraction_id, deal_stage, extraction_timestamp),
+                                    property_ids[property_name], result, metadata))
+            
+            copy_rows_binary(cursor, 'underwriting_data_stage', UNDERWRITING_STAGE_COLUMNS,
+                             UNDERWRITING_STAGE_TYPES, stage_rows)
+            cursor.execute("SELECT promote_staging(%s)", (batch_id,))
+            
+            # 3. Related data
+            metadata_rows = [
+                (*extraction_key, *self._extraction_metadata_values(metadata))
+                for extraction_key, _, _, metadata in extractions if metadata
+            ]
+            if metadata_rows:
+                execute_values(cursor, _METADATA_BATCH_INSERT_SQL, metadata_rows)
+            
+            copy_rows_binary(
+                cursor, 'annual_cashflows', ANNUAL_CASHFLOW_COLUMNS, ANNUAL_CASHFLOW_TYPES,
+                [row for extraction_key, property_id, result, _ in extractions
+                 for row in self._annual_cashflow_rows(extraction_key, property_id, result)],
+                buffer=self._cashflow_buffer
+            )
+            
+            for extraction_key, property_id, result, _ in extractions:
+                self._insert_rent_comparables(cursor, extraction_key, property_id, result)
+                self._insert_sales_comparables(cursor, extraction_key, property_id, result)
+        
+        logger.info("staged_chunk_loaded", batch_id=batch_id, count=len(chunk))
+        return [str(extraction_id) for extraction_id in extraction_ids]
+    
+    def _load_chunk_rows(self, chunk: List[Dict[str, Any]],
+                         chunk_field_values: List[Tuple[Any, ...]]) -> List[str]:
+        """
+        Load a chunk of batch results one extraction per transaction
+        
+        Slower than _load_chunk_staged, but an extraction that fails is
+        logged and skipped without losing the rest of the chunk.
+        
+        Returns:
+            Extraction IDs of the extractions that loaded
+        """
+        chunk_ids = []
+        
+        for result, field_values in zip(chunk, chunk_field_values):
             try:
                 # Extract deal stage from file metadata
                 deal_stage = result.get('_deal_stage', 'active_uw_review')
                 metadata = result.get('_extraction_metadata', {})
                 
                 # Load the extraction
-                extraction_id = self.load_extraction_data(result, deal_stage, metadata)
-                extraction_ids.append(extraction_id)
+                extraction_id = self.load_extraction_data(
+                    result, deal_stage, metadata,
+                    bulk=True, field_values=field_values
+                )
+                chunk_ids.append(extraction_id)
                 
             except Exception as e:
                 logger.error(
@@ -459,33 +696,41 @@ class DataLoader:
                 )
                 continue
         
-        logger.info(
-            "batch_extraction_results_loaded",
-            total_loaded=len(extraction_ids),
-            total_attempted=len(batch_data.get('results', []))
-        )
+        return chunk_ids
+    
+    def _iter_batch_results(self, f):
+        """Yield batch results one at a time without parsing the whole file"""
+        if ijson is None:
+            yield from json.load(f).get('results', [])
+            return
         
-        return extraction_ids
+        # use_float keeps numbers as float instead of Decimal, matching json.load
+        yield from ijson.items(f, 'results.item', use_float=True)
     
     def get_property_history(self, property_name: str) -> List[Dict[str, Any]]:
         """Get version history for a property"""
-        with get_cursor() as cursor:
+        # Named cursor streams rows from the server in itersize chunks. The
+        # name resolves to one property_id, so this ordering is
+        # idx_uw_property_ts order and needs no sort
+        with get_cursor(name='property_history', cursor_factory=RealDictCursor) as cursor:
+            cursor.itersize = HISTORY_FETCH_SIZE
             cursor.execute("""
                 SELECT 
                     extraction_id, version_number, extraction_timestamp,
                     deal_stage, purchase_price, levered_returns_irr,
                     net_operating_income, file_path
                 FROM underwriting_data
-                WHERE property_name = %s
+                WHERE property_id = (
+                    SELECT property_id FROM properties WHERE property_name = %s
+                )
                 ORDER BY extraction_timestamp DESC
             """, (property_name,))
             
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            return list(cursor)
     
     def get_latest_data_summary(self) -> Dict[str, Any]:
         """Get summary of latest data in the database"""
-        with get_cursor() as cursor:
+        with get_cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute("""
                 SELECT 
                     COUNT(*) as total_properties,
@@ -496,11 +741,4 @@ class DataLoader:
                 FROM latest_underwriting_data
             """)
             
-            result = cursor.fetchone()
-            return {
-                'total_properties': result[0],
-                'stages_count': result[1],
-                'latest_extraction': result[2],
-                'total_units': result[3],
-                'avg_purchase_price': result[4]
-            }
\ No newline at end of file
+            return dict(cursor.fetchone())
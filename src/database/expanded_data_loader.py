@@ -4,122 +4,429 @@ Handles all extracted fields with proper categorization and storage
 """
 
 import json
-import uuid
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
 import structlog
+import numpy as np
 import pandas as pd
-from .connection import get_cursor
-from .expanded_schema import ExpandedSchemaManager
+from psycopg2.extras import Json, execute_values
+from .binary_copy import copy_rows_binary
+from .connection import get_cursor, execute_prepared
+from .expanded_schema import (
+    ExpandedSchemaManager, PROPERTY_LOOKUP_COLUMNS, STAGED_TABLES, STAGE_SUFFIX,
+    UNIT_MIX_RENT_FIELDS, UNIT_MIX_TOTAL_BEDS_COLUMNS, UNIT_MIX_TOTAL_BEDS_FIELDS
+)
+from .ids import new_uuid7s
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
 logger = structlog.get_logger().bind(component="ExpandedDataLoader")
 
+def _dumps(obj: Any) -> str:
+    """Serialize a JSONB payload, with orjson when it is installed"""
+    if orjson is None:
+        return json.dumps(obj)
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+# Day zero of Excel's 1900 date system (serial 60 is the nonexistent 1900-02-29)
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+def _isnull(value: Any, _float=float) -> bool:
+    """Null check for scalar extraction values, without pd.isna dispatch for plain types"""
+    if value is None:
+        return True
+    if type(value) is _float:
+        return value != value
+    if isinstance(value, np.generic) or value is pd.NaT or value is pd.NA:
+        return bool(pd.isna(value))
+    return False
+
+def _as_number(value: Any) -> Optional[float]:
+    """Return a numeric extraction value as a number, None if it is not numeric"""
+    if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _as_date(value: Any) -> Optional[date]:
+    """Return an Excel serial day number or date string as a date, None if it is not a date"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        number = _as_number(value)
+        if number is not None:
+            return _EXCEL_EPOCH + timedelta(days=int(number))
+        return pd.to_datetime(value).date()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+@dataclass(frozen=True)
+class CategorySpec:
+    """How ExpandedDataLoader._load_category writes one mapped field category"""
+    bucket: str                          # _bucketize bucket holding the mapped columns
+    table: Optional[str] = None          # Flat table for the mapped columns; None stores it all as JSONB
+    extra_bucket: Optional[str] = None   # Pattern bucket stored in miscellaneous_data alongside
+    misc_key: Optional[str] = None       # field_data key for the miscellaneous_data payload
+
+# Extractions written per transaction by ExpandedDataLoader.load_many
+LOAD_MANY_CHUNK_SIZE = 10_000
+
+# Concurrent transactions used by ExpandedDataLoader.load_complete_extractions_parallel
+PARALLEL_LOAD_WORKERS = 4
+
+# Buckets produced by ExpandedDataLoader._bucketize
+BUCKET_CATEGORIES = (
+    'property', 'unit_mix', 'rent_comps', 'sales_comps', 'projections',
+    'financing', 'equity', 'returns', 'expenses', 'capex', 'income', 'rent', 'misc'
+)
+
+# Property Information Fields (47 fields)
+PROPERTY_FIELDS = MappingProxyType({
+    'PROPERTY_NAME': 'property_name',
+    'PROPERTY_CITY': 'property_city', 
+    'PROPERTY_STATE': 'property_state',
+    'PROPERTY_ADDRESS': 'property_address',
+    'PROPERTY_ZIP': 'property_zip',
+    'PROPERTY_LATITUDE': 'property_latitude',
+    'PROPERTY_LONGITUDE': 'property_longitude',
+    'YEAR_BUILT': 'year_built',
+    'YEAR_RENOVATED': 'year_renovated',
+    'BUILDING_TYPE': 'building_type',
+    'BUILDING_QUALITY': 'building_quality',
+    'LOCATION_QUALITY': 'location_quality',
+    'BUILDING_HEIGHT': 'building_height',
+    'NUMBER_OF_BUILDINGS': 'number_of_buildings',
+    'BUILDING_ZONING': 'building_zoning',
+    'LAND_AREA': 'land_area',
+    'PARCEL_NUMBER': 'parcel_number',
+    'UNITS': 'units',
+    'AVG_SQUARE_FEET': 'avg_square_feet',
+    'NUMBER_OF_PARKING_SPACES_COVERED': 'parking_spaces_covered',
+    'NUMBER_OF_PARKING_SPACES_UNCOVERED': 'parking_spaces_uncovered',
+    'INDIVIDUALLY_METERED': 'individually_metered',
+    'MARKET': 'market',
+    'SUBMARKET': 'submarket',
+    'COUNTY': 'county',
+    'CURRENT_OWNER': 'current_owner',
+    'LAST_SALE_DATE': 'last_sale_date',
+    'LAST_SALE_PRICE': 'last_sale_price',
+    'LAST_SALE_PRICE_PER_UNIT': 'last_sale_price_per_unit',
+    'LAST_SALE_CAP_RATE': 'last_sale_cap_rate',
+    'PROJECT_TYPE': 'project_type'
+})
+
+# Unit Mix Fields (52 fields) - Pattern-based extraction
+UNIT_MIX_PATTERNS = ('STUDIO_', '1_BED_', '2_BED_', '3_BED_', '4_BED_')
+
+# Income Fields (108 fields)
+INCOME_FIELDS = MappingProxyType({
+    'GROSS_POTENTIAL_RENTAL_INCOME': 'gross_potential_rental_income',
+    'NET_RENTAL_INCOME': 'net_rental_income', 
+    'EFFECTIVE_GROSS_INCOME': 'effective_gross_income',
+    'CONCESSIONS': 'concessions',
+    'LOSS_TO_LEASE': 'loss_to_lease',
+    'VACANCY_LOSS': 'vacancy_loss',
+    'BAD_DEBTS': 'bad_debts',
+    'OTHER_LOSS': 'other_loss',
+    'PARKING_INCOME': 'parking_income',
+    'LAUNDRY_INCOME': 'laundry_income',
+    'OTHER_INCOME': 'other_income',
+    'EMPIRICAL_RENT': 'empirical_rent',
+    'RENT_PSF': 'rent_per_sf'
+})
+
+# Operating Expenses Fields (83 fields)
+EXPENSE_FIELDS = MappingProxyType({
+    'ADVERTISING_MARKETING': 'advertising_marketing',
+    'MANAGEMENT_FEE': 'management_fee',
+    'PAYROLL': 'payroll',
+    'REPAIRS_MAINTENANCE': 'repairs_maintenance',
+    'CONTRACT_SERVICES': 'contract_services',
+    'TURNOVER': 'turnover',
+    'UTILITIES': 'utilities',
+    'INSURANCE': 'insurance',
+    'REAL_ESTATE_TAXES': 'real_estate_taxes',
+    'OTHER_EXPENSES': 'other_expenses',
+    'TOTAL_OPERATING_EXPENSES': 'total_operating_expenses'
+})
+
+# Financing Fields (68 fields)
+FINANCING_FIELDS = MappingProxyType({
+    'LOAN_AMOUNT': 'loan_amount',
+    'LOAN_TO_COST': 'loan_to_cost',
+    'LOAN_TO_VALUE': 'loan_to_value',
+    'EQUITY_LP_CAPITAL': 'equity_lp_capital',
+    'EQUITY_GP_CAPITAL': 'equity_gp_capital'
+})
+
+# Returns Fields (19 fields)
+RETURNS_FIELDS = MappingProxyType({
+    'LEVERED_RETURNS_IRR': 'levered_returns_irr',
+    'LEVERED_RETURNS_MOIC': 'levered_returns_moic',
+    'T12_RETURN_ON_PP': 't12_return_on_pp',
+    'T12_RETURN_ON_COST': 't12_return_on_cost',
+    'BASIS_UNIT_AT_CLOSE': 'basis_unit_at_close',
+    'BASIS_UNIT_AT_EXIT': 'basis_unit_at_exit',
+    'EXIT_PERIOD_MONTHS': 'exit_period_months',
+    'EXIT_CAP_RATE': 'exit_cap_rate',
+    'SALES_TRANSACTION_COSTS': 'sales_transaction_costs'
+})
+
+# Property columns stored as numbers; everything else is stored as text
+PROPERTY_NUMERIC_COLUMNS = frozenset([
+    'property_latitude', 'property_longitude', 'year_built', 'year_renovated',
+    'building_height', 'number_of_buildings', 'land_area', 'units', 'avg_square_feet',
+    'parking_spaces_covered', 'parking_spaces_uncovered',
+    'last_sale_price', 'last_sale_price_per_unit', 'last_sale_cap_rate'
+])
+
+# Ratio and multiple columns declared REAL rather than NUMERIC
+REAL_COLUMNS = frozenset([
+    'last_sale_cap_rate', 'levered_returns_irr', 'levered_returns_moic',
+    't12_return_on_pp', 't12_return_on_cost', 'exit_cap_rate', 'sales_transaction_costs',
+    'concessions', 'loss_to_lease', 'vacancy_loss', 'bad_debts', 'other_loss'
+])
+
+# Property columns stored as DATE; the workbooks hold them as Excel serial numbers
+PROPERTY_DATE_COLUMNS = frozenset(['last_sale_date'])
+
+# Numeric property columns declared INTEGER rather than NUMERIC
+PROPERTY_INTEGER_COLUMNS = frozenset([
+    'year_built', 'year_renovated', 'units', 'parking_spaces_covered', 'parking_spaces_uncovered'
+])
+
+# Returns the lookup_id of every (attribute, name) pair, adding missing ones.
+# DO UPDATE (not DO NOTHING) so rows committed by a concurrent load are
+# still returned; sorted input keeps concurrent loads from deadlocking.
+_LOOKUP_UPSERT_SQL = """
+    INSERT INTO property_lookup_values (attribute, name)
+    SELECT * FROM unnest(%s::text[], %s::text[]) ORDER BY 1, 2
+    ON CONFLICT (attribute, name) DO UPDATE SET name = EXCLUDED.name
+    RETURNING attribute, name, lookup_id
+"""
+
+# miscellaneous_data columns written by ExpandedDataLoader._copy_misc_rows
+MISC_COPY_COLUMNS = ('misc_id', 'extraction_id', 'property_pk', 'field_data')
+MISC_COPY_TYPES = ('uuid', 'uuid', 'int8', 'jsonb')
+
+# Mapped categories written by ExpandedDataLoader._load_category, in load order
+CATEGORY_SPECS = (
+    CategorySpec('financing', extra_bucket='equity', misc_key='financing'),
+    CategorySpec('returns', table='investment_returns'),
+    CategorySpec('expenses', table='operating_expenses', extra_bucket='capex', misc_key='capex'),
+    CategorySpec('income', table='income_data', extra_bucket='rent', misc_key='additional_rent_data'),
+)
+
+# field name -> (bucket, key) pairs, shared by every ExpandedDataLoader so
+# each name is classified once per process; routes depend only on the
+# module-level mappings above
+_ROUTE_CACHE: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+
+def _with_stage_tables(tables: Dict[str, Any]) -> MappingProxyType:
+    """Freeze a per-table mapping, adding the STAGED_TABLES staging copies' entries"""
+    return MappingProxyType({
+        **tables,
+        **{table + STAGE_SUFFIX: value for table, value in tables.items() if table in STAGED_TABLES},
+    })
+
+# Insert column order per flat table; rows always cover every mapped column
+# and absent values are sent as NULL. Staging copies share their table's columns
+TABLE_COLUMNS = _with_stage_tables({
+    'properties_expanded': ('property_pk', 'property_id', 'extraction_id') + tuple(
+        f'{column}_id' if column in PROPERTY_LOOKUP_COLUMNS else column
+        for column in PROPERTY_FIELDS.values()
+    ),
+    'unit_mix_data': ('unit_mix_id', 'extraction_id', 'property_pk', *UNIT_MIX_TOTAL_BEDS_COLUMNS,
+                      'avg_rent_by_br', 'unit_mix_data'),
+    'investment_returns': ('returns_id', 'extraction_id', 'property_pk', *RETURNS_FIELDS.values()),
+    'operating_expenses': ('expenses_id', 'extraction_id', 'property_pk', *EXPENSE_FIELDS.values()),
+    'income_data': ('income_id', 'extraction_id', 'property_pk', *INCOME_FIELDS.values()),
+})
+
+_INSERT_SQL = MappingProxyType({
+    table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+    for table, columns in TABLE_COLUMNS.items()
+})
+# Single-row form, run as a server-side prepared statement
+_SINGLE_INSERT_SQL = MappingProxyType({
+    table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    for table, columns in TABLE_COLUMNS.items()
+})
+
+# Binary COPY type per TABLE_COLUMNS column (see binary_copy.ENCODERS), for the flat tables
+TABLE_COPY_TYPES = _with_stage_tables({
+    'properties_expanded': ('int8', 'uuid', 'uuid') + tuple(
+        'int2' if column in PROPERTY_LOOKUP_COLUMNS
+        else 'int4' if column in PROPERTY_INTEGER_COLUMNS
+        else 'date' if column in PROPERTY_DATE_COLUMNS
+        else 'float4' if column in REAL_COLUMNS
+        else 'numeric' if column in PROPERTY_NUMERIC_COLUMNS
+        else 'text'
+        for column in PROPERTY_FIELDS.values()
+    ),
+    **{
+        table: ('uuid', 'uuid', 'int8') + tuple(
+            'float4' if column in REAL_COLUMNS else 'numeric' for column in mapping.values()
+        )
+        for table, mapping in (('investment_returns', RETURNS_FIELDS),
+                               ('operating_expenses', EXPENSE_FIELDS),
+                               ('income_data', INCOME_FIELDS))
+    },
+})
+
 class ExpandedDataLoader:
     """Loads all 1,140 extracted fields into categorized database tables"""
     
+    __slots__ = (
+        'schema_manager',
+        'property_fields', 'unit_mix_patterns', 'income_fields', 'expense_fields',
+        'financing_fields', 'returns_fields',
+        '_field_to_category', '_unit_mix_prefixes', '_route_cache', '_property_numeric_cols',
+        '_specs', '_property_db_cols', '_property_numeric_list', '_property_date_cols',
+        '_property_text_cols',
+        '_property_lookup_positions',
+        '_row_getters', '_table_columns', '_insert_sql', '_single_insert_sql', '_copy_types',
+    )
+    
     def __init__(self):
         self.schema_manager = ExpandedSchemaManager()
         
         # Define field mappings for each category
         self._init_field_mappings()
-    
-    def _init_field_mappings(self):
-        """Initialize field mappings for each table"""
         
-        # Property Information Fields (47 fields)
-        self.property_fields = {
-            'PROPERTY_NAME': 'property_name',
-            'PROPERTY_CITY': 'property_city', 
-            'PROPERTY_STATE': 'property_state',
-            'PROPERTY_ADDRESS': 'property_address',
-            'PROPERTY_ZIP': 'property_zip',
-            'PROPERTY_LATITUDE': 'property_latitude',
-            'PROPERTY_LONGITUDE': 'property_longitude',
-            'YEAR_BUILT': 'year_built',
-            'YEAR_RENOVATED': 'year_renovated',
-            'BUILDING_TYPE': 'building_type',
-            'BUILDING_QUALITY': 'building_quality',
-            'LOCATION_QUALITY': 'location_quality',
-            'BUILDING_HEIGHT': 'building_height',
-            'NUMBER_OF_BUILDINGS': 'number_of_buildings',
-            'BUILDING_ZONING': 'building_zoning',
-            'LAND_AREA': 'land_area',
-            'PARCEL_NUMBER': 'parcel_number',
-            'UNITS': 'units',
-            'AVG_SQUARE_FEET': 'avg_square_feet',
-            'NUMBER_OF_PARKING_SPACES_COVERED': 'parking_spaces_covered',
-            'NUMBER_OF_PARKING_SPACES_UNCOVERED': 'parking_spaces_uncovered',
-            'INDIVIDUALLY_METERED': 'individually_metered',
-            'MARKET': 'market',
-            'SUBMARKET': 'submarket',
-            'COUNTY': 'county',
-            'CURRENT_OWNER': 'current_owner',
-            'LAST_SALE_DATE': 'last_sale_date',
-            'LAST_SALE_PRICE': 'last_sale_price',
-            'LAST_SALE_PRICE_PER_UNIT': 'last_sale_price_per_unit',
-            'LAST_SALE_CAP_RATE': 'last_sale_cap_rate',
-            'PROJECT_TYPE': 'project_type'
+        # Per-category (defaults, getter) pairs that turn a bucket into a full column tuple
+        self._row_getters = {
+            category: (dict.fromkeys(mapping.values()), itemgetter(*mapping.values()))
+            for category, mapping in (('property', self.property_fields),
+                                      ('returns', self.returns_fields),
+                                      ('expenses', self.expense_fields),
+                                      ('income', self.income_fields))
         }
         
-        # Unit Mix Fields (52 fields) - Pattern-based extraction
-        self.unit_mix_patterns = ['1_BED_', '2_BED_', '3_BED_', '4_BED_']
-        
-        # Income Fields (108 fields)
-        self.income_fields = {
-            'GROSS_POTENTIAL_RENTAL_INCOME': 'gross_potential_rental_income',
-            'NET_RENTAL_INCOME': 'net_rental_income', 
-            'EFFECTIVE_GROSS_INCOME': 'effective_gross_income',
-            'CONCESSIONS': 'concessions',
-            'LOSS_TO_LEASE': 'loss_to_lease',
-            'VACANCY_LOSS': 'vacancy_loss',
-            'BAD_DEBTS': 'bad_debts',
-            'OTHER_LOSS': 'other_loss',
-            'PARKING_INCOME': 'parking_income',
-            'LAUNDRY_INCOME': 'laundry_income',
-            'OTHER_INCOME': 'other_income',
-            'EMPIRICAL_RENT': 'empirical_rent',
-            'RENT_PSF': 'rent_per_sf'
-        }
+        # Column lists, statements and COPY types are built once at import
+        self._table_columns = TABLE_COLUMNS
+        self._insert_sql = _INSERT_SQL
+        self._single_insert_sql = _SINGLE_INSERT_SQL
+        self._copy_types = TABLE_COPY_TYPES
+    
+    def _init_field_mappings(self):
+        """Initialize field mappings for each table"""
         
-        # Operating Expenses Fields (83 fields)
-        self.expense_fields = {
-            'ADVERTISING_MARKETING': 'advertising_marketing',
-            'MANAGEMENT_FEE': 'management_fee',
-            'PAYROLL': 'payroll',
-            'REPAIRS_MAINTENANCE': 'repairs_maintenance',
-            'CONTRACT_SERVICES': 'contract_services',
-            'TURNOVER': 'turnover',
-            'UTILITIES': 'utilities',
-            'INSURANCE': 'insurance',
-            'REAL_ESTATE_TAXES': 'real_estate_taxes',
-            'OTHER_EXPENSES': 'other_expenses',
-            'TOTAL_OPERATING_EXPENSES': 'total_operating_expenses'
-        }
+        self.property_fields = PROPERTY_FIELDS
+        self.unit_mix_patterns = UNIT_MIX_PATTERNS
+        self.income_fields = INCOME_FIELDS
+        self.expense_fields = EXPENSE_FIELDS
+        self.financing_fields = FINANCING_FIELDS
+        self.returns_fields = RETURNS_FIELDS
+
+        # Reverse lookup: extract field -> (category, db_field) for exact-match fields
+        self._field_to_category = {}
+        for category, mapping in (('property', self.property_fields),
+                                  ('income', self.income_fields),
+                                  ('expenses', self.expense_fields),
+                                  ('financing', self.financing_fields),
+                                  ('returns', self.returns_fields)):
+            for extract_field, db_field in mapping.items():
+                self._field_to_category[extract_field] = (category, db_field)
+
+        self._unit_mix_prefixes = self.unit_mix_patterns
         
-        # Financing Fields (68 fields)
-        self.financing_fields = {
-            'LOAN_AMOUNT': 'loan_amount',
-            'LOAN_TO_COST': 'loan_to_cost',
-            'LOAN_TO_VALUE': 'loan_to_value',
-            'EQUITY_LP_CAPITAL': 'equity_lp_capital',
-            'EQUITY_GP_CAPITAL': 'equity_gp_capital'
-        }
+        # field name -> (bucket, key) pairs, filled in by _field_routes
+        self._route_cache = _ROUTE_CACHE
+
+        self._property_numeric_cols = PROPERTY_NUMERIC_COLUMNS
+        self._specs = CATEGORY_SPECS
+        
+        self._property_db_cols = tuple(self.property_fields.values())
+        self._property_numeric_list = [c for c in self._property_db_cols if c in self._property_numeric_cols]
+        self._property_date_cols = [c for c in self._property_db_cols if c in PROPERTY_DATE_COLUMNS]
+        self._property_text_cols = [c for c in self._property_db_cols
+                                    if c not in self._property_numeric_cols and c not in PROPERTY_DATE_COLUMNS]
+        # (row position, column) of lookup columns in a properties_expanded row
+        self._property_lookup_positions = [
+            (position, column) for position, column in enumerate(self._property_db_cols, 3)
+            if column in PROPERTY_LOOKUP_COLUMNS
+        ]
+
+    def _field_routes(self, field_name: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Return the (bucket, key) pairs a field is stored under
         
-        # Returns Fields (19 fields)
-        self.returns_fields = {
-            'LEVERED_RETURNS_IRR': 'levered_returns_irr',
-            'LEVERED_RETURNS_MOIC': 'levered_returns_moic',
-            'T12_RETURN_ON_PP': 't12_return_on_pp',
-            'T12_RETURN_ON_COST': 't12_return_on_cost',
-            'BASIS_UNIT_AT_CLOSE': 'basis_unit_at_close',
-            'BASIS_UNIT_AT_EXIT': 'basis_unit_at_exit',
-            'EXIT_PERIOD_MONTHS': 'exit_period_months',
-            'EXIT_CAP_RATE': 'exit_cap_rate',
-            'SALES_TRANSACTION_COSTS': 'sales_transaction_costs'
-        }
+        Field names repeat across extractions, so each name is classified
+        once and the result is cached for every later extraction. The names
+        come from the fixed cell mapping (about 1,140), so a multi-pattern
+        matcher such as Aho-Corasick would only speed up that one-time pass.
+        """
+        routes = self._route_cache.get(field_name)
+        if routes is not None:
+            return routes
+        
+        routes = []
+        known = self._field_to_category.get(field_name)
+        if known is not None:
+            routes.append(known)
+        if field_name.startswith(self._unit_mix_prefixes):
+            routes.append(('unit_mix', field_name))
+        if 'RENT_COMP' in field_name:
+            routes.append(('rent_comps', field_name))
+        elif 'SALES_COMP' in field_name:
+            routes.append(('sales_comps', field_name))
+        if 'ANNUAL_CF' in field_name or 'YEAR_' in field_name:
+            routes.append(('projections', field_name))
+        if 'EQUITY_CASH_ON_CASH' in field_name:
+            routes.append(('equity', field_name))
+        if 'CAPEX' in field_name:
+            routes.append(('capex', field_name))
+        if 'RENT' in field_name and 'COMP' not in field_name:
+            routes.append(('rent', field_name))
+        if not routes:
+            routes.append(('misc', field_name))
+        
+        routes = tuple(routes)
+        self._route_cache[field_name] = routes
+        return routes
     
+    def _bucketize(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Sort every non-null field of an extraction into its category buckets in one pass
+
+        Exact-match buckets (property, income, expenses, financing, returns) are
+        keyed by db_field, pattern buckets by the extracted field name. A field
+        lands in every bucket whose pattern it matches; 'misc' gets the fields
+        no other bucket claimed. numpy scalars are unwrapped to Python scalars.
+        """
+        buckets = {category: {} for category in BUCKET_CATEGORIES}
+        route_cache = self._route_cache
+
+        for field_name, value in data.items():
+            if _isnull(value):
+                continue
+            if isinstance(value, np.generic):
+                # Plain Python scalars adapt and serialize without numpy dispatch
+                value = value.item()
+
+            routes = route_cache.get(field_name) or self._field_routes(field_name)
+            for category, key in routes:
+                buckets[category][key] = value
+
+        return buckets
+
     def load_complete_extraction_data(self, extraction_data: Dict[str, Any], 
-                                    deal_stage: str, metadata: Optional[Dict] = None) -> str:
+                                    deal_stage: str, metadata: Optional[Dict] = None,
+                                    bulk: bool = False) -> str:
         """
         Load all 1,140 fields into appropriate database tables
         
@@ -127,320 +434,390 @@ class ExpandedDataLoader:
             extraction_data: The complete extracted data dictionary (1,140 fields)
             deal_stage: The deal stage 
             metadata: Optional metadata about the extraction
+            bulk: Commit without waiting for the WAL flush (batch loads)
             
         Returns:
             extraction_id: UUID of the created extraction record
         """
+        return self.load_complete_extractions_batch([extraction_data], deal_stage, metadata, bulk)[0]
+    
+    def load_many(self, extractions: List[Dict[str, Any]], deal_stage: str,
+                  metadata: Optional[Dict] = None,
+                  chunk_size: int = LOAD_MANY_CHUNK_SIZE, staging: bool = False) -> List[str]:
+        """
+        Bulk-load a large number of extractions, one transaction per chunk
+        
+        Property, returns, expenses and income rows are streamed with COPY
+        and each chunk commits with bulk=True; a failed chunk raises and
+        can be reloaded on its own.
+        
+        Args:
+            extractions: Complete extracted data dictionaries (1,140 fields each)
+            deal_stage: The deal stage 
+            metadata: Optional metadata about the extractions
+            chunk_size: Extractions written per transaction
+            staging: Write through the UNLOGGED staging tables (backfills)
+            
+        Returns:
+            extraction_ids: UUIDs of the created extraction records, in input order
+        """
+        extraction_ids = []
+        for start in range(0, len(extractions), chunk_size):
+            extraction_ids.extend(self.load_complete_extractions_batch(
+                extractions[start:start + chunk_size], deal_stage, metadata,
+                bulk=True, use_copy=True, staging=staging
+            ))
+        return extraction_ids
+    
+    def load_complete_extractions_parallel(self, extractions: List[Dict[str, Any]], deal_stage: str,
+                                           metadata: Optional[Dict] = None,
+                                           workers: int = PARALLEL_LOAD_WORKERS) -> List[str]:
+        """
+        Load extractions in parallel transactions on separate pooled connections
+        
+        The input is split into `workers` contiguous chunks and each chunk is
+        loaded with load_complete_extractions_batch(bulk=True) in its own
+        thread. Chunks commit independently: if one fails its error is
+        raised after the others finish, and only that chunk needs reloading.
+        `workers` should not exceed the connection pool size.
+        
+        Args:
+            extractions: Complete extracted data dictionaries (1,140 fields each)
+            deal_stage: The deal stage 
+            metadata: Optional metadata about the extractions
+            workers: Number of concurrent transactions
+            
+        Returns:
+            extraction_ids: UUIDs of the created extraction records, in input order
+        """
+        if not extractions:
+            return []
+        
+        chunk_size = -(-len(extractions) // max(1, workers))
+        chunks = [extractions[start:start + chunk_size]
+                  for start in range(0, len(extractions), chunk_size)]
+        
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(self.load_complete_extractions_batch, chunk, deal_stage, metadata, True)
+                for chunk in chunks
+            ]
+            wait(futures)
+        
+        extraction_ids = []
+        for future in futures:
+            extraction_ids.extend(future.result())
+        return extraction_ids
+    
+    def load_complete_extractions_batch(self, extractions: List[Dict[str, Any]],
+                                        deal_stage: str, metadata: Optional[Dict] = None,
+                                        bulk: bool = False, use_copy: bool = False,
+                                        staging: bool = False) -> List[str]:
+        """
+        Load many extractions with one multi-row INSERT per table
+        
+        All tables are written in a single transaction. With bulk=True the
+        commit does not wait for the WAL flush, so a crash right after
+        returning can lose the batch; callers must be able to reload it.
+        
+        Args:
+            extractions: Complete extracted data dictionaries (1,140 fields each)
+            deal_stage: The deal stage 
+            metadata: Optional metadata about the extractions
+            bulk: Commit without waiting for the WAL flush (batch loads)
+            use_copy: Write the flat category tables with binary COPY instead of INSERT
+            staging: Write the rows to the UNLOGGED <table>_stage tables, then move
+                them into the real tables with one INSERT ... SELECT each. Meant for
+                backfills and re-extractions; staged loads run one at a time.
+            
+        Returns:
+            extraction_ids: UUIDs of the created extraction records, in input order
+        """
+        if not extractions:
+            return []
+        
         try:
-            extraction_id = str(uuid.uuid4())
+            record_ids = new_uuid7s(2 * len(extractions))
+            extraction_ids = record_ids[:len(extractions)]
+            property_ids = record_ids[len(extractions):]
+            all_buckets = [self._bucketize(data) for data in extractions]
+            
+            # (extraction_id, property_pk, field_data) rows for miscellaneous_data,
+            # collected from every category and written with one COPY
+            misc_rows = []
             
             with get_cursor() as cursor:
+                if bulk:
+                    # A crash may lose the last few commits but never corrupts
+                    # data; a batch can simply be reloaded
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+                
+                if staging:
+                    # Serialize staged loads up front; locking at the final
+                    # TRUNCATE instead could deadlock two of them
+                    cursor.execute(
+                        f"LOCK TABLE {', '.join(table + STAGE_SUFFIX for table in STAGED_TABLES)} "
+                        f"IN ACCESS EXCLUSIVE MODE"
+                    )
+                
+                # Child tables reference properties by BIGINT key, so reserve
+                # the keys up front and COPY/INSERT them like any other value
+                property_pks = self._reserve_property_pks(cursor, len(extractions))
+                batch = list(zip(extraction_ids, property_pks, all_buckets))
+                
                 logger.info("loading_complete_extraction_data", 
-                           extraction_id=extraction_id,
-                           total_fields=len(extraction_data))
+                           extractions=len(extractions),
+                           total_fields=sum(len(data) for data in extractions))
                 
                 # 1. Load property information
-                property_id = self._load_property_data(cursor, extraction_id, extraction_data)
+                self._load_property_data(cursor, batch, property_ids, use_copy, staging)
                 
                 # 2. Load unit mix data
-                self._load_unit_mix_data(cursor, extraction_id, property_id, extraction_data)
+                self._load_unit_mix_data(cursor, batch, staging)
                 
                 # 3. Load comparables data  
-                self._load_comparables_data(cursor, extraction_id, property_id, extraction_data)
+                self._load_comparables_data(batch, misc_rows)
                 
                 # 4. Load projections data
-                self._load_projections_data(cursor, extraction_id, property_id, extraction_data)
-                
-                # 5. Load financing data
-                self._load_financing_data(cursor, extraction_id, property_id, extraction_data)
+                self._load_projections_data(batch, misc_rows)
                 
-                # 6. Load returns data
-                self._load_returns_data(cursor, extraction_id, property_id, extraction_data)
+                # 5-8. Load financing, returns, operating expenses and income data
+                for spec in self._specs:
+                    self._load_category(cursor, spec, batch, misc_rows, use_copy, staging)
                 
-                # 7. Load operating expenses
-                self._load_expenses_data(cursor, extraction_id, property_id, extraction_data)
+                # 9. Load miscellaneous data (all remaining fields)
+                self._load_miscellaneous_data(batch, misc_rows)
                 
-                # 8. Load income data
-                self._load_income_data(cursor, extraction_id, property_id, extraction_data)
+                # 10. Write all miscellaneous_data rows
+                self._copy_misc_rows(cursor, misc_rows, staging)
                 
-                # 9. Load miscellaneous data (all remaining fields)
-                self._load_miscellaneous_data(cursor, extraction_id, property_id, extraction_data)
+                if staging:
+                    self._move_staged_rows(cursor)
                 
+                extraction_ids = [str(extraction_id) for extraction_id in extraction_ids]
                 logger.info("complete_extraction_data_loaded_successfully",
-                           extraction_id=extraction_id,
-                           property_id=property_id)
+                           extraction_ids=extraction_ids,
+                           property_ids=[str(property_id) for property_id in property_ids],
+                           fields_by_category={
+                               category: sum(len(buckets[category]) for _, _, buckets in batch)
+                               for category in BUCKET_CATEGORIES
+                           },
+                           misc_rows=len(misc_rows))
                 
-                return extraction_id
+                return extraction_ids
                 
         except Exception as e:
             logger.error("complete_extraction_data_load_failed",
                         error=str(e),
-                        property_name=extraction_data.get('PROPERTY_NAME'))
+                        property_names=[data.get('PROPERTY_NAME') for data in extractions])
             raise
     
-    def _load_property_data(self, cursor, extraction_id: str, data: Dict) -> str:
+    def _row_values(self, category: str, values: Dict[str, Any]) -> tuple:
+        """Return a bucket's values in column order, None for absent columns"""
+        defaults, getter = self._row_getters[category]
+        return getter({**defaults, **values})
+    
+    def _insert_rows(self, cursor, table: str, rows: List[tuple], use_copy: bool = False,
+                     staging: bool = False):
+        """
+        Insert rows with a single multi-row INSERT ... VALUES statement
+        
+        With use_copy the rows are streamed with binary COPY FROM STDIN instead,
+        which is faster for large batches of flat rows. A lone row (one
+        extraction loaded at a time) goes through a prepared statement so
+        repeated sequential loads skip parse and planning.
+        """
+        if not rows:
+            return
+        
+        if staging:
+            table += STAGE_SUFFIX
+        
+        if use_copy:
+            self._copy_rows(cursor, table, rows)
+        elif len(rows) == 1:
+            execute_prepared(cursor, f"edl_{table}_insert", self._single_insert_sql[table], rows[0])
+        else:
+            execute_values(cursor, self._insert_sql[table], rows, page_size=1000)
+    
+    def _copy_rows(self, cursor, table: str, rows: List[tuple]):
+        """Write flat rows to a table with binary-format COPY"""
+        copy_rows_binary(cursor, table, self._table_columns[table], self._copy_types[table], rows)
+    
+    def _copy_misc_rows(self, cursor, rows: List[tuple], staging: bool = False):
+        """Write (extraction_id, property_pk, field_data) rows to miscellaneous_data with binary COPY"""
+        if not rows:
+            return
+        
+        copy_rows_binary(
+            cursor, 'miscellaneous_data' + STAGE_SUFFIX if staging else 'miscellaneous_data',
+            MISC_COPY_COLUMNS, MISC_COPY_TYPES,
+            ((misc_id, extraction_id, property_pk, _dumps(field_data))
+             for misc_id, (extraction_id, property_pk, field_data) in zip(new_uuid7s(len(rows)), rows))
+        )
+        
+        logger.debug("miscellaneous_rows_copied", rows=len(rows))
+    
+    def _move_staged_rows(self, cursor):
+        """Move this transaction's staged rows into the real tables and empty the stage"""
+        cursor.execute("\n".join(
+            [f"INSERT INTO {table} SELECT * FROM {table}{STAGE_SUFFIX};" for table in STAGED_TABLES]
+            + [f"TRUNCATE {', '.join(table + STAGE_SUFFIX for table in STAGED_TABLES)};"]
+        ))
+    
+    def _reserve_property_pks(self, cursor, count: int) -> List[int]:
+        """Draw `count` property_pk values from the properties_expanded identity sequence"""
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence('properties_expanded', 'property_pk')) "
+            "FROM generate_series(1, %s)",
+            (count,)
+        )
+        return [row[0] for row in cursor.fetchall()]
+    
+    def _load_property_data(self, cursor, batch: List[tuple], property_ids: List[Any],
+                            use_copy: bool = False, staging: bool = False):
         """Load property information into properties_expanded table"""
-        property_id = str(uuid.uuid4())
-        
-        # Build property data with type validation
-        property_values = {}
-        for extract_field, db_field in self.property_fields.items():
-            value = data.get(extract_field)
-            if pd.isna(value) or value is None:
-                property_values[db_field] = None
-            else:
-                # Type validation for numeric fields
-                if db_field in ['property_latitude', 'property_longitude', 'year_built', 'year_renovated', 
-                               'building_height', 'number_of_buildings', 'land_area', 'units', 'avg_square_feet',
-                               'parking_spaces_covered', 'parking_spaces_uncovered', 'last_sale_date',
-                               'last_sale_price', 'last_sale_price_per_unit', 'last_sale_cap_rate']:
-                    # Try to convert to numeric, set to None if not possible
-                    try:
-                        if isinstance(value, str) and not value.replace('.', '').replace('-', '').isdigit():
-                            property_values[db_field] = None
-                        else:
-                            property_values[db_field] = float(value) if '.' in str(value) else int(value)
-                    except (ValueError, TypeError):
-                        property_values[db_field] = None
-                else:
-                    # Text fields - convert to string
-                    property_values[db_field] = str(value) if value is not None else None
+        frame = pd.DataFrame(
+            [self._row_values('property', buckets['property']) for _, _, buckets in batch],
+            columns=self._property_db_cols, dtype=object
+        )
+        
+        # Numeric fields: coerce the whole slice at once, unparseable values become null
+        numeric_columns = self._property_numeric_list
+        frame[numeric_columns] = frame[numeric_columns].apply(pd.to_numeric, errors='coerce').astype(object)
+        
+        # Date fields - Excel serial numbers or date strings
+        for column in self._property_date_cols:
+            frame[column] = [_as_date(value) for value in frame[column]]
+        
+        # Text fields - convert to string
+        text_columns = self._property_text_cols
+        text_frame = frame[text_columns]
+        frame[text_columns] = text_frame.where(text_frame.isna(), text_frame.astype(str))
+        
+        frame = frame.where(frame.notna(), None)
+        rows = [
+            (property_pk, property_id, extraction_id, *values)
+            for (extraction_id, property_pk, _), property_id, values
+            in zip(batch, property_ids, frame.itertuples(index=False, name=None))
+        ]
+        rows = self._replace_lookup_values(cursor, rows)
         
         # Insert property data
-        columns = ['property_id', 'extraction_id'] + list(property_values.keys())
-        values = [property_id, extraction_id] + list(property_values.values())
-        placeholders = ', '.join(['%s'] * len(values))
-        
-        cursor.execute(f"""
-            INSERT INTO properties_expanded ({', '.join(columns)})
-            VALUES ({placeholders})
-        """, values)
+        self._insert_rows(cursor, 'properties_expanded', rows, use_copy, staging)
         
-        logger.info("property_data_loaded", property_id=property_id)
-        return property_id
+        logger.debug("property_data_loaded", properties=len(rows))
     
-    def _load_unit_mix_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load unit mix data as JSONB"""
-        unit_mix_data = {}
-        
-        # Extract unit mix fields by pattern
-        for field_name, value in data.items():
-            for pattern in self.unit_mix_patterns:
-                if field_name.startswith(pattern):
-                    if pd.notna(value) and value is not None:
-                        unit_mix_data[field_name] = value
-        
-        if unit_mix_data:
-            cursor.execute("""
-                INSERT INTO unit_mix_data (unit_mix_id, extraction_id, property_id, unit_mix_data)
-                VALUES (%s, %s, %s, %s)
-            """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps(unit_mix_data)])
-            
-            logger.info("unit_mix_data_loaded", fields_count=len(unit_mix_data))
+    def _replace_lookup_values(self, cursor, rows: List[tuple]) -> List[tuple]:
+        """Swap lookup column text for property_lookup_values ids, with one upsert per batch"""
+        positions = self._property_lookup_positions
+        pairs = {(column, row[position]) for row in rows for position, column in positions
+                 if row[position] is not None}
+        if not pairs:
+            return rows
+        
+        attributes, names = zip(*sorted(pairs))
+        cursor.execute(_LOOKUP_UPSERT_SQL, (list(attributes), list(names)))
+        lookup_ids = {(attribute, name): lookup_id for attribute, name, lookup_id in cursor.fetchall()}
+        
+        replaced = []
+        for row in rows:
+            row = list(row)
+            for position, column in positions:
+                if row[position] is not None:
+                    row[position] = lookup_ids[(column, row[position])]
+            replaced.append(tuple(row))
+        return replaced
     
-    def _load_comparables_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load rent and sales comparables data"""
-        rent_comps = {}
-        sales_comps = {}
-        
-        # Categorize comparable fields
-        for field_name, value in data.items():
-            if 'RENT_COMP' in field_name and pd.notna(value) and value is not None:
-                rent_comps[field_name] = value
-            elif 'SALES_COMP' in field_name and pd.notna(value) and value is not None:
-                sales_comps[field_name] = value
-        
-        # Store as JSONB for now due to the large number of comparable fields (543)
-        # This can be normalized later if needed
-        if rent_comps or sales_comps:
-            misc_data = {
-                'rent_comparables': rent_comps,
-                'sales_comparables': sales_comps
-            }
+    def _load_unit_mix_data(self, cursor, batch: List[tuple], staging: bool = False):
+        """Load unit mix data as JSONB"""
+        rows = []
+        for (extraction_id, property_pk, buckets), row_id in zip(batch, new_uuid7s(len(batch))):
+            if not buckets['unit_mix']:
+                continue
             
-            cursor.execute("""
-                INSERT INTO miscellaneous_data (misc_id, extraction_id, property_id, field_data)
-                VALUES (%s, %s, %s, %s)
-            """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps(misc_data)])
+            # Promote the hot fields to columns; the rest stays as JSONB
+            unit_mix_data = dict(buckets['unit_mix'])
+            total_beds = [_as_number(unit_mix_data.pop(field, None)) for field in UNIT_MIX_TOTAL_BEDS_FIELDS]
+            rents = [_as_number(unit_mix_data.pop(field, None)) for field in UNIT_MIX_RENT_FIELDS]
             
-            logger.info("comparables_data_loaded", 
-                       rent_comps=len(rent_comps), 
-                       sales_comps=len(sales_comps))
-    
-    def _load_projections_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load annual projections data"""
-        projections = {}
+            rows.append((row_id, extraction_id, property_pk, *total_beds,
+                         rents if any(rent is not None for rent in rents) else None,
+                         Json(unit_mix_data, dumps=_dumps)))
         
-        for field_name, value in data.items():
-            if 'ANNUAL_CF' in field_name or 'YEAR_' in field_name:
-                if pd.notna(value) and value is not None:
-                    projections[field_name] = value
-        
-        if projections:
-            cursor.execute("""
-                INSERT INTO miscellaneous_data (misc_id, extraction_id, property_id, field_data)
-                VALUES (%s, %s, %s, %s)
-            """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps({'projections': projections})])
+        if rows:
+            self._insert_rows(cursor, 'unit_mix_data', rows, staging=staging)
             
-            logger.info("projections_data_loaded", fields_count=len(projections))
+            logger.debug("unit_mix_data_loaded", rows=len(rows))
     
-    def _load_financing_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load financing data"""
-        financing_values = {}
-        
-        for extract_field, db_field in self.financing_fields.items():
-            value = data.get(extract_field)
-            if pd.notna(value) and value is not None:
-                financing_values[db_field] = value
-        
-        # Add equity cash-on-cash fields
-        equity_fields = {}
-        for field_name, value in data.items():
-            if 'EQUITY_CASH_ON_CASH' in field_name and pd.notna(value) and value is not None:
-                equity_fields[field_name] = value
-        
-        if financing_values or equity_fields:
-            financing_values.update(equity_fields)
-            columns = ['financing_id', 'extraction_id', 'property_id'] + list(financing_values.keys())
-            values = [str(uuid.uuid4()), extraction_id, property_id] + list(financing_values.values())
-            placeholders = ', '.join(['%s'] * len(values))
-            
-            # For now, store in miscellaneous due to field complexity
-            cursor.execute("""
-                INSERT INTO miscellaneous_data (misc_id, extraction_id, property_id, field_data)
-                VALUES (%s, %s, %s, %s)
-            """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps({'financing': financing_values})])
+    def _load_comparables_data(self, batch: List[tuple], misc_rows: List[tuple]):
+        """Load rent and sales comparables data"""
+        rows = []
+        for extraction_id, property_pk, buckets in batch:
+            rent_comps = buckets['rent_comps']
+            sales_comps = buckets['sales_comps']
             
-            logger.info("financing_data_loaded", fields_count=len(financing_values))
+            # Store as JSONB for now due to the large number of comparable fields (543)
+            # This can be normalized later if needed
+            if rent_comps or sales_comps:
+                rows.append((extraction_id, property_pk, {
+                    'rent_comparables': rent_comps,
+                    'sales_comparables': sales_comps
+                }))
+        
+        misc_rows.extend(rows)
+        logger.debug("comparables_data_loaded", rows=len(rows))
     
-    def _load_returns_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load investment returns data"""
-        returns_values = {}
-        
-        for extract_field, db_field in self.returns_fields.items():
-            value = data.get(extract_field)
-            if pd.notna(value) and value is not None:
-                returns_values[db_field] = value
-        
-        if returns_values:
-            columns = ['returns_id', 'extraction_id', 'property_id'] + list(returns_values.keys())
-            values = [str(uuid.uuid4()), extraction_id, property_id] + list(returns_values.values())
-            placeholders = ', '.join(['%s'] * len(values))
-            
-            cursor.execute(f"""
-                INSERT INTO investment_returns ({', '.join(columns)})
-                VALUES ({placeholders})
-            """, values)
-            
-            logger.info("returns_data_loaded", fields_count=len(returns_values))
+    def _load_projections_data(self, batch: List[tuple], misc_rows: List[tuple]):
+        """Load annual projections data"""
+        rows = []
+        for extraction_id, property_pk, buckets in batch:
+            projections = buckets['projections']
+            if projections:
+                rows.append((extraction_id, property_pk, {'projections': projections}))
+        
+        misc_rows.extend(rows)
+        logger.debug("projections_data_loaded", rows=len(rows))
     
-    def _load_expenses_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load operating expenses data"""
-        expense_values = {}
-        
-        for extract_field, db_field in self.expense_fields.items():
-            value = data.get(extract_field)
-            if pd.notna(value) and value is not None:
-                expense_values[db_field] = value
-        
-        # Add CAPEX fields
-        capex_fields = {}
-        for field_name, value in data.items():
-            if 'CAPEX' in field_name and pd.notna(value) and value is not None:
-                capex_fields[field_name] = value
-        
-        if expense_values or capex_fields:
-            all_expenses = {**expense_values, **capex_fields}
-            columns = ['expenses_id', 'extraction_id', 'property_id'] + list(expense_values.keys())
-            values = [str(uuid.uuid4()), extraction_id, property_id] + list(expense_values.values())
-            placeholders = ', '.join(['%s'] * len(values))
+    def _load_category(self, cursor, spec: CategorySpec, batch: List[tuple],
+                       misc_rows: List[tuple], use_copy: bool = False, staging: bool = False):
+        """Load one mapped field category and its pattern-matched extras"""
+        rows = []
+        extra_rows = []
+        row_ids = new_uuid7s(len(batch)) if spec.table else [None] * len(batch)
+        for (extraction_id, property_pk, buckets), row_id in zip(batch, row_ids):
+            values = buckets[spec.bucket]
+            extra_fields = buckets[spec.extra_bucket] if spec.extra_bucket else {}
+            if not (values or extra_fields):
+                continue
             
-            cursor.execute(f"""
-                INSERT INTO operating_expenses ({', '.join(columns)})
-                VALUES ({placeholders})
-            """, values)
+            if spec.table is None:
+                # No flat table yet; the whole category is stored in miscellaneous
+                extra_rows.append((extraction_id, property_pk, {spec.misc_key: {**values, **extra_fields}}))
+                continue
             
-            # Store CAPEX in miscellaneous if any
-            if capex_fields:
-                cursor.execute("""
-                    INSERT INTO miscellaneous_data (misc_id, extraction_id, property_id, field_data)
-                    VALUES (%s, %s, %s, %s)
-                """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps({'capex': capex_fields})])
-            
-            logger.info("expenses_data_loaded", 
-                       operating_fields=len(expense_values),
-                       capex_fields=len(capex_fields))
-    
-    def _load_income_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
-        """Load income data"""
-        income_values = {}
+            rows.append((row_id, extraction_id, property_pk, *self._row_values(spec.bucket, values)))
+            if extra_fields:
+                extra_rows.append((extraction_id, property_pk, {spec.misc_key: extra_fields}))
         
-        for extract_field, db_field in self.income_fields.items():
-            value = data.get(extract_field)
-            if pd.notna(value) and value is not None:
-                income_values[db_field] = value
+        self._insert_rows(cursor, spec.table, rows, use_copy, staging)
+        misc_rows.extend(extra_rows)
         
-        # Add rent-related fields
-        rent_fields = {}
-        for field_name, value in data.items():
-            if ('RENT' in field_name and 'COMP' not in field_name) and pd.notna(value) and value is not None:
-                rent_fields[field_name] = value
-        
-        if income_values or rent_fields:
-            all_income = {**income_values, **rent_fields}
-            columns = ['income_id', 'extraction_id', 'property_id'] + list(income_values.keys())
-            values = [str(uuid.uuid4()), extraction_id, property_id] + list(income_values.values())
-            placeholders = ', '.join(['%s'] * len(values))
-            
-            cursor.execute(f"""
-                INSERT INTO income_data ({', '.join(columns)})
-                VALUES ({placeholders})
-            """, values)
-            
-            # Store additional rent fields in miscellaneous if any
-            if rent_fields:
-                cursor.execute("""
-                    INSERT INTO miscellaneous_data (misc_id, extraction_id, property_id, field_data)
-                    VALUES (%s, %s, %s, %s)
-                """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps({'additional_rent_data': rent_fields})])
-            
-            logger.info("income_data_loaded", 
-                       core_fields=len(income_values),
-                       additional_rent_fields=len(rent_fields))
+        logger.debug("category_data_loaded",
+                    category=spec.bucket,
+                    rows=len(rows),
+                    misc_rows=len(extra_rows))
     
-    def _load_miscellaneous_data(self, cursor, extraction_id: str, property_id: str, data: Dict):
+    def _load_miscellaneous_data(self, batch: List[tuple], misc_rows: List[tuple]):
         """Load all remaining miscellaneous fields"""
-        # Collect all fields not handled by other methods
-        processed_fields = set()
-        processed_fields.update(self.property_fields.keys())
-        processed_fields.update(self.income_fields.keys())
-        processed_fields.update(self.expense_fields.keys())
-        processed_fields.update(self.financing_fields.keys())
-        processed_fields.update(self.returns_fields.keys())
-        
-        # Add pattern-based fields
-        for field_name in data.keys():
-            for pattern in self.unit_mix_patterns:
-                if field_name.startswith(pattern):
-                    processed_fields.add(field_name)
-            if any(x in field_name for x in ['RENT_COMP', 'SALES_COMP', 'ANNUAL_CF', 'YEAR_', 'CAPEX', 'EQUITY_CASH_ON_CASH']):
-                processed_fields.add(field_name)
-            if 'RENT' in field_name and 'COMP' not in field_name:
-                processed_fields.add(field_name)
-        
-        # Get remaining fields
-        remaining_fields = {}
-        for field_name, value in data.items():
-            if field_name not in processed_fields and pd.notna(value) and value is not None:
-                remaining_fields[field_name] = value
-        
-        if remaining_fields:
-            cursor.execute("""
-                INSERT INTO miscellaneous_data (misc_id, extraction_id, property_id, field_data)
-                VALUES (%s, %s, %s, %s)
-            """, [str(uuid.uuid4()), extraction_id, property_id, json.dumps({'other_fields': remaining_fields})])
-            
-            logger.info("miscellaneous_data_loaded", fields_count=len(remaining_fields))
+        rows = []
+        for extraction_id, property_pk, buckets in batch:
+            remaining_fields = buckets['misc']
+            if remaining_fields:
+                rows.append((extraction_id, property_pk, {'other_fields': remaining_fields}))
+        
+        misc_rows.extend(rows)
+        logger.debug("miscellaneous_data_loaded", rows=len(rows))
 
 def main():
     """Test function"""
@@ -3,52 +3,280 @@ Expanded Database Schema for Complete 1,140 Field Storage
 Handles all extracted underwriting data with proper categorization
 """
 
+import functools
 import structlog
 from typing import Dict, List, Any
 from .connection import get_cursor
 
-logger = structlog.get_logger().bind(component="ExpandedSchema")
+@functools.lru_cache(maxsize=None)
+def logger():
+    """Component logger, bound on first use rather than at import"""
+    return structlog.get_logger().bind(component="ExpandedSchema")
+
+# Tables with an UNLOGGED <table>_stage copy for bulk backfills, parents first
+STAGED_TABLES = (
+    'properties_expanded', 'unit_mix_data', 'investment_returns',
+    'operating_expenses', 'income_data', 'miscellaneous_data'
+)
+STAGE_SUFFIX = '_stage'
+
+# Unpartitioned child tables kept physically ordered by property (see
+# cluster_expanded_tables); PostgreSQL cannot mark a clustering index on a
+# partitioned table
+CLUSTERED_TABLES = {
+    'unit_mix': 'unit_mix_data',
+    'financing': 'financing_data',
+    'returns': 'investment_returns',
+    'expenses': 'operating_expenses',
+    'income': 'income_data',
+}
+
+# Child tables referencing properties_expanded, keyed by index name prefix
+CHILD_TABLES = {
+    'unit_mix': 'unit_mix_data',
+    'rent_comps': 'rent_comparables',
+    'sales_comps': 'sales_comparables',
+    'projections': 'annual_projections',
+    'financing': 'financing_data',
+    'returns': 'investment_returns',
+    'expenses': 'operating_expenses',
+    'income': 'income_data',
+    'misc': 'miscellaneous_data',
+}
+
+# rent_comparables and sales_comparables share their names with the main
+# schema's comparables tables. Upgrade steps recognise the expanded ones by
+# their comparable_number column and leave the main schema's alone; the
+# condition below filters information_schema.columns rows aliased c
+SHARED_NAME_TABLES = ('rent_comparables', 'sales_comparables')
+_EXPANDED_TABLE_CONDITION = f"""(
+                        c.table_name NOT IN ({', '.join(f"'{table}'" for table in SHARED_NAME_TABLES)})
+                        OR EXISTS (
+                            SELECT 1 FROM information_schema.columns m
+                            WHERE m.table_schema = 'public' AND m.table_name = c.table_name
+                            AND m.column_name = 'comparable_number'
+                        )
+                    )"""
+
+# Low-cardinality property text columns stored as SMALLINT <column>_id
+# references into property_lookup_values; databases created before schema
+# 2.6.0 hold the text until _convert_lookup_columns replaces it
+PROPERTY_LOOKUP_COLUMNS = (
+    'building_type', 'building_quality', 'location_quality',
+    'individually_metered', 'building_zoning', 'project_type'
+)
+
+# Unit mix fields promoted to real unit_mix_data columns, per bedroom type
+# (studio, 1-4 bed); every other unit mix field stays in the JSONB column.
+# Databases created before schema 2.4.0 keep them in the JSONB until
+# _add_unit_mix_columns moves them out
+UNIT_MIX_BEDROOM_PREFIXES = ('STUDIO_', '1_BED_', '2_BED_', '3_BED_', '4_BED_')
+UNIT_MIX_TOTAL_BEDS_COLUMNS = (
+    'studio_total_beds', 'one_br_total_beds', 'two_br_total_beds',
+    'three_br_total_beds', 'four_br_total_beds'
+)
+UNIT_MIX_TOTAL_BEDS_FIELDS = tuple(f'{prefix}TOTAL_BEDS' for prefix in UNIT_MIX_BEDROOM_PREFIXES)
+UNIT_MIX_RENT_FIELDS = tuple(f'{prefix}RENT_PER_UNIT_INPLACE' for prefix in UNIT_MIX_BEDROOM_PREFIXES)
+
+# Prefix of the schema_migrations rows recording expanded schema versions
+EXPANDED_SCHEMA_PREFIX = 'expanded_schema_'
+
+# Tables whose rows are revised in place as figures are refined, and their
+# storage parameters: page room for HOT updates and early autovacuum. Set at
+# creation and re-applied to existing tables by _apply_storage_parameters
+REVISED_TABLES = (
+    'properties_expanded', 'financing_data', 'investment_returns',
+    'operating_expenses', 'income_data'
+)
+REVISED_TABLE_STORAGE = (
+    "fillfactor = 90, autovacuum_vacuum_scale_factor = 0.02, autovacuum_analyze_scale_factor = 0.01"
+)
+
+# Hash partitions per high-volume child table (rows per extraction grow without
+# bound), and each table's row id, which the primary key pairs with extraction_id
+EXPANDED_HASH_PARTITIONS = 16
+HASH_PARTITIONED_TABLES = {
+    'rent_comparables': 'rent_comp_id',
+    'sales_comparables': 'sales_comp_id',
+    'annual_projections': 'projection_id',
+    'miscellaneous_data': 'misc_id',
+}
+
+# Ratio and multiple columns declared REAL since schema 2.1.0; databases
+# created earlier hold them as NUMERIC until _retype_real_columns runs
+REAL_COLUMNS_BY_TABLE = {
+    'properties_expanded': ('last_sale_cap_rate',),
+    'sales_comparables': ('cap_rate',),
+    'annual_projections': ('vacancy_rate', 'rent_growth', 'expense_ratio'),
+    'financing_data': (
+        'loan_to_cost', 'loan_to_value', 'interest_rate',
+        *(f'equity_cash_on_cash_year_{year}' for year in range(1, 6)),
+        *(f'equity_coc_excl_fees_year_{year}' for year in range(1, 6)),
+    ),
+    'investment_returns': (
+        'levered_returns_irr', 'levered_returns_moic', 'unlevered_returns_irr',
+        'unlevered_returns_moic', 't12_return_on_pp', 't12_return_on_cost',
+        'exit_cap_rate', 'sales_transaction_costs',
+    ),
+    'operating_expenses': ('expense_ratio', 'management_fee_percentage'),
+    'income_data': ('concessions', 'loss_to_lease', 'vacancy_loss', 'bad_debts', 'other_loss'),
+}
 
 class ExpandedSchemaManager:
     """Creates expanded database schema for all 1,140 fields"""
     
     def __init__(self):
-        self.schema_version = "2.0.0"
+        # Bump when the DDL changes, so databases recorded at an older
+        # version re-run it. Every statement must therefore be safe to re-run
+        # on an existing schema, and changes CREATE ... IF NOT EXISTS skips
+        # need their own upgrade statement (see _retype_real_columns)
+        self.schema_version = "2.7.0"
         
     def create_expanded_schema(self):
-        """Create the complete expanded database schema"""
-        logger.info("creating_expanded_schema", version=self.schema_version)
+        """Create the complete expanded database schema, skipped if this version is recorded"""
+        logger().info("creating_expanded_schema", version=self.schema_version)
         
         try:
             with get_cursor() as cursor:
-                # Create all expanded tables
-                self._create_core_tables(cursor)
-                self._create_unit_mix_table(cursor)
-                self._create_comparables_tables(cursor)
-                self._create_projections_table(cursor)
-                self._create_financing_table(cursor)
-                self._create_returns_table(cursor)
-                self._create_operating_expenses_table(cursor)
-                self._create_income_table(cursor)
-                self._create_miscellaneous_table(cursor)
-                
-                # Create indexes for performance
-                self._create_expanded_indexes(cursor)
-                
-                logger.info("expanded_schema_created_successfully")
+                if self._schema_exists(cursor):
+                    logger().info("expanded_schema_already_exists", version=self.schema_version)
+                    return
+                
+                ddl = [
+                    # Primary key default used by every expanded table
+                    self._create_uuid_v7_function(),
+                    
+                    # Create all expanded tables
+                    self._create_lookup_table(),
+                    self._create_core_tables(),
+                    self._create_unit_mix_table(),
+                    self._create_comparables_tables(),
+                    self._create_projections_table(),
+                    self._create_financing_table(),
+                    self._create_returns_table(),
+                    self._create_operating_expenses_table(),
+                    self._create_income_table(),
+                    self._create_miscellaneous_table(),
+                    
+                    # Bring tables created by older versions up to date
+                    self._add_property_pk(),
+                    self._add_unit_mix_columns(),
+                    self._convert_lookup_columns(),
+                    self._retype_last_sale_date(),
+                    self._partition_child_tables(),
+                    self._retype_real_columns(),
+                    self._apply_storage_parameters(),
+                    self._create_staging_tables(),
+                    
+                    # Create indexes for performance
+                    self._create_expanded_indexes(),
+                ]
+                
+                # One round trip: psycopg2 sends the whole script as a single
+                # simple-query message, run inside get_cursor's transaction
+                cursor.execute("\n".join(ddl))
+                self._record_schema_version(cursor)
+                
+                logger().info("expanded_schema_created_successfully")
                 
         except Exception as e:
-            logger.error("expanded_schema_creation_failed", error=str(e))
+            logger().error("expanded_schema_creation_failed", error=str(e))
             raise
     
-    def _create_core_tables(self, cursor):
-        """Create core tables with expanded property information"""
-        logger.info("creating_core_expanded_tables")
+    def cluster_expanded_tables(self):
+        """
+        Rewrite the clustered child tables in property order
+        
+        CLUSTER takes an ACCESS EXCLUSIVE lock while it rewrites each table,
+        so run it after ingest (e.g. nightly) rather than alongside loads.
+        Rows written since the last run are appended unordered.
+        """
+        logger().info("clustering_expanded_tables", tables=list(CLUSTERED_TABLES.values()))
+        
+        with get_cursor() as cursor:
+            cursor.execute("\n".join(f"CLUSTER {table};" for table in CLUSTERED_TABLES.values()))
+        
+        logger().info("expanded_tables_clustered")
+    
+    @property
+    def _migration_name(self) -> str:
+        """schema_migrations row recording that this schema version was created"""
+        return f"{EXPANDED_SCHEMA_PREFIX}{self.schema_version}"
+    
+    def _schema_exists(self, cursor) -> bool:
+        """Check schema_migrations for this schema version, without probing each table"""
+        cursor.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            return False
+        
+        cursor.execute(
+            "SELECT 1 FROM schema_migrations WHERE migration_name = %s",
+            (self._migration_name,)
+        )
+        return cursor.fetchone() is not None
+    
+    def _record_schema_version(self, cursor):
+        """Record this schema version in schema_migrations, if migration tracking is set up"""
+        cursor.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            logger().warning("schema_migrations_missing", version=self.schema_version)
+            return
         
-        # Expanded properties table
         cursor.execute("""
+            INSERT INTO schema_migrations (migration_name, description)
+            VALUES (%s, %s)
+            ON CONFLICT (migration_name) DO NOTHING
+        """, (self._migration_name, f"Expanded schema {self.schema_version}"))
+    
+    def _create_uuid_v7_function(self) -> str:
+        """Return DDL for gen_uuid_v7(), a time-ordered UUID generator for primary keys"""
+        logger().info("creating_uuid_v7_function")
+        
+        # UUIDv7: 48-bit Unix millisecond timestamp followed by random bits, so
+        # new keys land on the rightmost B-tree leaf instead of a random page.
+        # Built from gen_random_uuid() (PostgreSQL 13+) by overwriting the first
+        # six bytes with the timestamp and turning version 4 into version 7.
+        return """
+            CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS UUID AS $$
+                SELECT encode(
+                    set_bit(
+                        set_bit(
+                            overlay(uuid_send(gen_random_uuid())
+                                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::BIGINT) FROM 3)
+                                    FROM 1 FOR 6),
+                            52, 1),
+                        53, 1),
+                    'hex')::UUID;
+            $$ LANGUAGE SQL VOLATILE;
+        """
+    
+    def _create_lookup_table(self) -> str:
+        """Return DDL for the lookup table behind low-cardinality property attributes"""
+        logger().info("creating_lookup_table")
+        
+        # One row per distinct (attribute, value), e.g. ('building_quality', 'A');
+        # properties_expanded stores the 2-byte id instead of repeating the text
+        return """
+            CREATE TABLE IF NOT EXISTS property_lookup_values (
+                lookup_id SMALLINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                attribute VARCHAR(50) NOT NULL,
+                name TEXT NOT NULL,
+                UNIQUE (attribute, name)
+            );
+        """
+    
+    def _create_core_tables(self) -> str:
+        """Return DDL for core tables with expanded property information"""
+        logger().info("creating_core_expanded_tables")
+        
+        # Expanded properties table. Property and metric rows are revised in
+        # place, so leave page room for HOT updates and vacuum them early.
+        return f"""
             CREATE TABLE IF NOT EXISTS properties_expanded (
-                property_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                -- BIGINT surrogate key referenced by every child table; the
+                -- UUID stays as the external business key
+                property_pk BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                property_id UUID NOT NULL UNIQUE DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
                 
                 -- Basic Property Info (47 fields)
@@ -63,12 +291,12 @@ class ExpandedSchemaManager:
                 -- Physical Characteristics
                 year_built INTEGER,
                 year_renovated INTEGER,
-                building_type VARCHAR(100),
-                building_quality VARCHAR(50),
-                location_quality VARCHAR(50),
+                building_type_id SMALLINT REFERENCES property_lookup_values(lookup_id),
+                building_quality_id SMALLINT REFERENCES property_lookup_values(lookup_id),
+                location_quality_id SMALLINT REFERENCES property_lookup_values(lookup_id),
                 building_height NUMERIC(5,1),
                 number_of_buildings NUMERIC(5,1),
-                building_zoning VARCHAR(100),
+                building_zoning_id SMALLINT REFERENCES property_lookup_values(lookup_id),
                 land_area NUMERIC(10,2),
                 parcel_number VARCHAR(100),
                 
@@ -77,7 +305,7 @@ class ExpandedSchemaManager:
                 avg_square_feet NUMERIC(10,2),
                 parking_spaces_covered INTEGER,
                 parking_spaces_uncovered INTEGER,
-                individually_metered VARCHAR(50),
+                individually_metered_id SMALLINT REFERENCES property_lookup_values(lookup_id),
                 
                 -- Market Information
                 market VARCHAR(100),
@@ -86,50 +314,59 @@ class ExpandedSchemaManager:
                 
                 -- Current Ownership
                 current_owner TEXT,
-                last_sale_date NUMERIC(20,10),
+                last_sale_date DATE,
                 last_sale_price NUMERIC(15,2),
                 last_sale_price_per_unit NUMERIC(10,2),
-                last_sale_cap_rate NUMERIC(8,6),
+                last_sale_cap_rate REAL,
                 
                 -- Investment Strategy
-                project_type VARCHAR(100),
+                project_type_id SMALLINT REFERENCES property_lookup_values(lookup_id),
                 
                 -- Timestamps
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+            ) WITH ({REVISED_TABLE_STORAGE});
+        """
     
-    def _create_unit_mix_table(self, cursor):
-        """Create detailed unit mix table (52 fields)"""
-        logger.info("creating_unit_mix_table")
+    def _create_unit_mix_table(self) -> str:
+        """Return DDL for detailed unit mix table (52 fields)"""
+        logger().info("creating_unit_mix_table")
         
-        cursor.execute("""
+        return """
             CREATE TABLE IF NOT EXISTS unit_mix_data (
-                unit_mix_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                unit_mix_id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
-                
-                -- Store unit mix data as JSONB for flexibility
-                -- This handles the complex unit mix structure with 1-4+ bedroom types
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
+                
+                -- Hot unit mix fields as real columns so dashboard aggregations
+                -- don't have to fetch and parse the JSONB document
+                studio_total_beds INTEGER,
+                one_br_total_beds INTEGER,
+                two_br_total_beds INTEGER,
+                three_br_total_beds INTEGER,
+                four_br_total_beds INTEGER,
+                avg_rent_by_br NUMERIC[], -- in-place rent per unit: studio, 1-4 bed
+                
+                -- Remaining unit mix fields as JSONB for flexibility
+                -- This handles the complex unit mix structure with studio-4+ bedroom types
                 unit_mix_data JSONB,
                 
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+            ) WITH (fillfactor = 95);
+        """
     
-    def _create_comparables_tables(self, cursor):
-        """Create tables for rent and sales comparables (543 fields)"""
-        logger.info("creating_comparables_tables")
+    def _create_comparables_tables(self) -> str:
+        """Return DDL for the rent and sales comparables tables (543 fields)"""
+        logger().info("creating_comparables_tables")
         
         # Since there are 543 fields for comparables, we'll create a flexible structure
         # that can handle multiple comparables per property
         
-        cursor.execute("""
+        return """
             CREATE TABLE IF NOT EXISTS rent_comparables (
-                rent_comp_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                rent_comp_id UUID NOT NULL DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 comparable_number INTEGER NOT NULL, -- 1-10+ for multiple comparables
                 
                 -- Comparable Property Details
@@ -144,15 +381,16 @@ class ExpandedSchemaManager:
                 rent_per_sf NUMERIC(8,2),
                 year_built INTEGER,
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
-        
-        cursor.execute("""
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                
+                -- The partition key has to be part of the primary key
+                PRIMARY KEY (rent_comp_id, extraction_id)
+            ) PARTITION BY HASH (extraction_id);
+            
             CREATE TABLE IF NOT EXISTS sales_comparables (
-                sales_comp_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                sales_comp_id UUID NOT NULL DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 comparable_number INTEGER NOT NULL,
                 
                 -- Sales Comparable Details
@@ -160,7 +398,7 @@ class ExpandedSchemaManager:
                 building_class VARCHAR(50),
                 building_height NUMERIC(5,1),
                 building_type VARCHAR(100),
-                cap_rate NUMERIC(8,6),
+                cap_rate REAL,
                 city VARCHAR(100),
                 distance_to_subject NUMERIC(8,2),
                 latitude NUMERIC(10,8),
@@ -175,19 +413,22 @@ class ExpandedSchemaManager:
                 units INTEGER,
                 year_built INTEGER,
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                
+                -- The partition key has to be part of the primary key
+                PRIMARY KEY (sales_comp_id, extraction_id)
+            ) PARTITION BY HASH (extraction_id);
+        """
     
-    def _create_projections_table(self, cursor):
-        """Create multi-year projections table"""
-        logger.info("creating_projections_table")
+    def _create_projections_table(self) -> str:
+        """Return DDL for multi-year projections table"""
+        logger().info("creating_projections_table")
         
-        cursor.execute("""
+        return """
             CREATE TABLE IF NOT EXISTS annual_projections (
-                projection_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                projection_id UUID NOT NULL DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 projection_year INTEGER NOT NULL, -- 1-10+ for multiple years
                 
                 -- Annual Cashflow Projections (15+ fields per year)
@@ -197,9 +438,9 @@ class ExpandedSchemaManager:
                 net_cashflow NUMERIC(15,2),
                 
                 -- Operating Metrics
-                vacancy_rate NUMERIC(8,6),
-                rent_growth NUMERIC(8,6),
-                expense_ratio NUMERIC(8,6),
+                vacancy_rate REAL,
+                rent_growth REAL,
+                expense_ratio REAL,
                 
                 -- Capital Expenditures
                 capex_deferred_maintenance NUMERIC(12,2),
@@ -208,25 +449,28 @@ class ExpandedSchemaManager:
                 capex_common_area_improvements NUMERIC(12,2),
                 capex_unit_renovations NUMERIC(12,2),
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                
+                -- The partition key has to be part of the primary key
+                PRIMARY KEY (projection_id, extraction_id)
+            ) PARTITION BY HASH (extraction_id);
+        """
     
-    def _create_financing_table(self, cursor):
-        """Create financing and equity tables (68 fields)"""
-        logger.info("creating_financing_table")
+    def _create_financing_table(self) -> str:
+        """Return DDL for financing and equity tables (68 fields)"""
+        logger().info("creating_financing_table")
         
-        cursor.execute("""
+        return f"""
             CREATE TABLE IF NOT EXISTS financing_data (
-                financing_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                financing_id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 
                 -- Debt Information
                 loan_amount NUMERIC(15,2),
-                loan_to_cost NUMERIC(8,6),
-                loan_to_value NUMERIC(8,6),
-                interest_rate NUMERIC(8,6),
+                loan_to_cost REAL,
+                loan_to_value REAL,
+                interest_rate REAL,
                 loan_term_years INTEGER,
                 amortization_years INTEGER,
                 
@@ -236,42 +480,42 @@ class ExpandedSchemaManager:
                 total_equity NUMERIC(15,2),
                 
                 -- Annual Equity Returns (5 years)
-                equity_cash_on_cash_year_1 NUMERIC(8,6),
-                equity_cash_on_cash_year_2 NUMERIC(8,6),
-                equity_cash_on_cash_year_3 NUMERIC(8,6),
-                equity_cash_on_cash_year_4 NUMERIC(8,6),
-                equity_cash_on_cash_year_5 NUMERIC(8,6),
+                equity_cash_on_cash_year_1 REAL,
+                equity_cash_on_cash_year_2 REAL,
+                equity_cash_on_cash_year_3 REAL,
+                equity_cash_on_cash_year_4 REAL,
+                equity_cash_on_cash_year_5 REAL,
                 
                 -- Excluding Project-Level Fees
-                equity_coc_excl_fees_year_1 NUMERIC(8,6),
-                equity_coc_excl_fees_year_2 NUMERIC(8,6),
-                equity_coc_excl_fees_year_3 NUMERIC(8,6),
-                equity_coc_excl_fees_year_4 NUMERIC(8,6),
-                equity_coc_excl_fees_year_5 NUMERIC(8,6),
+                equity_coc_excl_fees_year_1 REAL,
+                equity_coc_excl_fees_year_2 REAL,
+                equity_coc_excl_fees_year_3 REAL,
+                equity_coc_excl_fees_year_4 REAL,
+                equity_coc_excl_fees_year_5 REAL,
                 
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+            ) WITH ({REVISED_TABLE_STORAGE});
+        """
     
-    def _create_returns_table(self, cursor):
-        """Create investment returns table (19 fields)"""
-        logger.info("creating_returns_table")
+    def _create_returns_table(self) -> str:
+        """Return DDL for investment returns table (19 fields)"""
+        logger().info("creating_returns_table")
         
-        cursor.execute("""
+        return f"""
             CREATE TABLE IF NOT EXISTS investment_returns (
-                returns_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                returns_id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 
                 -- Core Return Metrics
-                levered_returns_irr NUMERIC(8,6),
-                levered_returns_moic NUMERIC(8,4),
-                unlevered_returns_irr NUMERIC(8,6),
-                unlevered_returns_moic NUMERIC(8,4),
+                levered_returns_irr REAL,
+                levered_returns_moic REAL,
+                unlevered_returns_irr REAL,
+                unlevered_returns_moic REAL,
                 
                 -- T12 Returns
-                t12_return_on_pp NUMERIC(8,6),
-                t12_return_on_cost NUMERIC(8,6),
+                t12_return_on_pp REAL,
+                t12_return_on_cost REAL,
                 
                 -- Basis Metrics
                 basis_unit_at_close NUMERIC(12,2),
@@ -279,22 +523,22 @@ class ExpandedSchemaManager:
                 
                 -- Exit Assumptions
                 exit_period_months NUMERIC(5,1),
-                exit_cap_rate NUMERIC(8,6),
-                sales_transaction_costs NUMERIC(8,6),
+                exit_cap_rate REAL,
+                sales_transaction_costs REAL,
                 
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+            ) WITH ({REVISED_TABLE_STORAGE});
+        """
     
-    def _create_operating_expenses_table(self, cursor):
-        """Create detailed operating expenses table (83 fields)"""
-        logger.info("creating_operating_expenses_table")
+    def _create_operating_expenses_table(self) -> str:
+        """Return DDL for detailed operating expenses table (83 fields)"""
+        logger().info("creating_operating_expenses_table")
         
-        cursor.execute("""
+        return f"""
             CREATE TABLE IF NOT EXISTS operating_expenses (
-                expenses_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                expenses_id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 
                 -- Annual Operating Expenses
                 advertising_marketing NUMERIC(12,2),
@@ -310,22 +554,22 @@ class ExpandedSchemaManager:
                 total_operating_expenses NUMERIC(12,2),
                 
                 -- Expense Ratios
-                expense_ratio NUMERIC(8,6),
-                management_fee_percentage NUMERIC(8,6),
+                expense_ratio REAL,
+                management_fee_percentage REAL,
                 
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+            ) WITH ({REVISED_TABLE_STORAGE});
+        """
     
-    def _create_income_table(self, cursor):
-        """Create detailed income table (108 fields)"""
-        logger.info("creating_income_table")
+    def _create_income_table(self) -> str:
+        """Return DDL for detailed income table (108 fields)"""
+        logger().info("creating_income_table")
         
-        cursor.execute("""
+        return f"""
             CREATE TABLE IF NOT EXISTS income_data (
-                income_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                income_id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 
                 -- Rental Income
                 gross_potential_rental_income NUMERIC(12,2),
@@ -333,11 +577,11 @@ class ExpandedSchemaManager:
                 effective_gross_income NUMERIC(12,2),
                 
                 -- Income Adjustments
-                concessions NUMERIC(8,6),
-                loss_to_lease NUMERIC(8,6),
-                vacancy_loss NUMERIC(8,6),
-                bad_debts NUMERIC(8,6),
-                other_loss NUMERIC(8,6),
+                concessions REAL,
+                loss_to_lease REAL,
+                vacancy_loss REAL,
+                bad_debts REAL,
+                other_loss REAL,
                 
                 -- Other Income Sources
                 parking_income NUMERIC(12,2),
@@ -351,48 +595,354 @@ class ExpandedSchemaManager:
                 average_rent_per_sf_market NUMERIC(8,2),
                 
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+            ) WITH ({REVISED_TABLE_STORAGE});
+        """
     
-    def _create_miscellaneous_table(self, cursor):
-        """Create table for miscellaneous fields (205 fields)"""
-        logger.info("creating_miscellaneous_table")
+    def _create_miscellaneous_table(self) -> str:
+        """Return DDL for the miscellaneous fields table (205 fields)"""
+        logger().info("creating_miscellaneous_table")
         
-        cursor.execute("""
+        return """
             CREATE TABLE IF NOT EXISTS miscellaneous_data (
-                misc_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                misc_id UUID NOT NULL DEFAULT gen_uuid_v7(),
                 extraction_id UUID NOT NULL,
-                property_id UUID NOT NULL,
+                property_pk BIGINT NOT NULL REFERENCES properties_expanded(property_pk),
                 
                 -- Store all miscellaneous fields as JSONB for flexibility
                 -- This handles the 205 "Other/Miscellaneous" fields
                 field_data JSONB,
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            );
-        """)
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                
+                -- The partition key has to be part of the primary key
+                PRIMARY KEY (misc_id, extraction_id)
+            ) PARTITION BY HASH (extraction_id);
+        """
+    
+    def _convert_lookup_columns(self) -> str:
+        """Return DDL replacing older PROPERTY_LOOKUP_COLUMNS text with lookup ids"""
+        logger().info("converting_lookup_columns")
+        
+        # Each distinct value becomes a property_lookup_values row, as the
+        # loader adds them. A no-op on databases created with the id columns
+        columns = ", ".join(f"'{column}'" for column in PROPERTY_LOOKUP_COLUMNS)
+        return f"""
+            DO $$
+            DECLARE
+                lookup_column TEXT;
+            BEGIN
+                FOREACH lookup_column IN ARRAY ARRAY[{columns}] LOOP
+                    IF EXISTS (
+                        SELECT 1 FROM information_schema.columns
+                        WHERE table_schema = 'public' AND table_name = 'properties_expanded'
+                        AND column_name = lookup_column
+                    ) THEN
+                        EXECUTE format(
+                            'INSERT INTO property_lookup_values (attribute, name) '
+                            'SELECT DISTINCT %L, %I FROM properties_expanded WHERE %I IS NOT NULL '
+                            'ON CONFLICT (attribute, name) DO NOTHING',
+                            lookup_column, lookup_column, lookup_column
+                        );
+                        EXECUTE format(
+                            'ALTER TABLE properties_expanded ADD COLUMN IF NOT EXISTS %I SMALLINT '
+                            'REFERENCES property_lookup_values(lookup_id)', lookup_column || '_id'
+                        );
+                        EXECUTE format(
+                            'UPDATE properties_expanded p SET %I = l.lookup_id FROM property_lookup_values l '
+                            'WHERE l.attribute = %L AND l.name = p.%I',
+                            lookup_column || '_id', lookup_column, lookup_column
+                        );
+                        EXECUTE format('ALTER TABLE properties_expanded DROP COLUMN %I', lookup_column);
+                    END IF;
+                END LOOP;
+            END $$;
+        """
     
-    def _create_expanded_indexes(self, cursor):
-        """Create indexes for performance"""
-        logger.info("creating_expanded_indexes")
-        
-        # Primary relationship indexes
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_unit_mix_extraction ON unit_mix_data(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_unit_mix_property ON unit_mix_data(property_id);",
-            "CREATE INDEX IF NOT EXISTS idx_rent_comps_extraction ON rent_comparables(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_sales_comps_extraction ON sales_comparables(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_projections_extraction ON annual_projections(extraction_id);",
+    def _retype_last_sale_date(self) -> str:
+        """Return DDL converting a last_sale_date still stored as an Excel serial number to DATE"""
+        logger().info("retyping_last_sale_date")
+        
+        # Whole days from Excel's day zero, as the loader converts them; serial
+        # numbers past 9999-12-31 become NULL. A no-op on databases created with DATE
+        return """
+            DO $$ BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_schema = 'public' AND table_name = 'properties_expanded'
+                    AND column_name = 'last_sale_date' AND data_type = 'numeric'
+                ) THEN
+                    ALTER TABLE properties_expanded ALTER COLUMN last_sale_date TYPE DATE USING
+                        CASE WHEN last_sale_date BETWEEN 0 AND 2958465
+                            THEN DATE '1899-12-30' + trunc(last_sale_date)::INTEGER END;
+                END IF;
+            END $$;
+        """
+    
+    def _partition_child_tables(self) -> str:
+        """Return DDL for the hash partitions of HASH_PARTITIONED_TABLES, rebuilding older plain tables"""
+        logger().info("partitioning_child_tables")
+        
+        # Tables created before schema 2.5.0 are plain: each is renamed aside,
+        # replaced by a partitioned copy of its columns and emptied into it.
+        # Storage parameters go on the partitions; a partitioned parent has no storage
+        targets = ", ".join(f"('{table}', '{key}')" for table, key in HASH_PARTITIONED_TABLES.items())
+        return f"""
+            DO $$
+            DECLARE
+                target RECORD;
+                key_constraint TEXT;
+                remainder INTEGER;
+            BEGIN
+                FOR target IN
+                    SELECT c.table_name::TEXT AS table_name, c.column_name::TEXT AS key_column
+                    FROM information_schema.columns c
+                    JOIN (VALUES {targets}) AS h(table_name, column_name)
+                    ON h.table_name = c.table_name AND h.column_name = c.column_name
+                    WHERE c.table_schema = 'public'
+                    AND {_EXPANDED_TABLE_CONDITION}
+                LOOP
+                    IF NOT EXISTS (
+                        SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(target.table_name)
+                    ) THEN
+                        SELECT conname INTO key_constraint FROM pg_constraint
+                        WHERE conrelid = to_regclass(target.table_name) AND contype = 'p';
+                        EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', target.table_name, key_constraint);
+                        EXECUTE format('ALTER TABLE %I RENAME TO %I', target.table_name, target.table_name || '_unpartitioned');
+                        EXECUTE format(
+                            'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS, PRIMARY KEY (%I, extraction_id)) '
+                            'PARTITION BY HASH (extraction_id)',
+                            target.table_name, target.table_name || '_unpartitioned', target.key_column
+                        );
+                    END IF;
+                    
+                    FOR remainder IN 0..{EXPANDED_HASH_PARTITIONS - 1} LOOP
+                        EXECUTE format(
+                            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I '
+                            'FOR VALUES WITH (MODULUS {EXPANDED_HASH_PARTITIONS}, REMAINDER %s) WITH (fillfactor = 95)',
+                            target.table_name || '_p' || remainder, target.table_name, remainder
+                        );
+                    END LOOP;
+                    
+                    IF to_regclass(target.table_name || '_unpartitioned') IS NOT NULL THEN
+                        EXECUTE format('INSERT INTO %I SELECT * FROM %I', target.table_name, target.table_name || '_unpartitioned');
+                        EXECUTE format('DROP TABLE %I', target.table_name || '_unpartitioned');
+                        EXECUTE format(
+                            'ALTER TABLE %I ADD FOREIGN KEY (property_pk) REFERENCES properties_expanded(property_pk)',
+                            target.table_name
+                        );
+                    END IF;
+                END LOOP;
+            END $$;
+        """
+    
+    def _retype_real_columns(self) -> str:
+        """Return DDL converting REAL_COLUMNS_BY_TABLE columns still stored as NUMERIC"""
+        logger().info("retyping_real_columns")
+        
+        # A no-op on databases created with REAL columns. Each table is
+        # rewritten once for all its columns; partitions follow their parent
+        targets = ",\n                        ".join(
+            f"('{table}', '{column}')"
+            for base_table, columns in REAL_COLUMNS_BY_TABLE.items()
+            for table in ((base_table, base_table + STAGE_SUFFIX) if base_table in STAGED_TABLES else (base_table,))
+            for column in columns
+        )
+        return f"""
+            DO $$
+            DECLARE
+                target RECORD;
+            BEGIN
+                FOR target IN
+                    SELECT c.table_name,
+                        string_agg(format('ALTER COLUMN %I TYPE REAL', c.column_name), ', ') AS alterations
+                    FROM information_schema.columns c
+                    JOIN (VALUES
+                        {targets}
+                    ) AS r(table_name, column_name)
+                    ON r.table_name = c.table_name AND r.column_name = c.column_name
+                    WHERE c.table_schema = 'public' AND c.data_type = 'numeric'
+                    GROUP BY c.table_name
+                LOOP
+                    EXECUTE format('ALTER TABLE %I %s', target.table_name, target.alterations);
+                END LOOP;
+            END $$;
+        """
+    
+    def _add_property_pk(self) -> str:
+        """Return DDL moving tables created before schema 2.3.0 onto the BIGINT property_pk"""
+        logger().info("adding_property_pk")
+        
+        # properties_expanded keeps property_id as a UNIQUE business key; the
+        # identity column numbers the existing rows as it is added. Children
+        # are backfilled through property_id, which they then drop. A no-op
+        # on databases created with property_pk
+        children = ", ".join(f"'{table}'" for table in CHILD_TABLES.values())
+        return f"""
+            DO $$
+            DECLARE
+                child TEXT;
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_schema = 'public' AND table_name = 'properties_expanded'
+                    AND column_name = 'property_pk'
+                ) THEN
+                    ALTER TABLE properties_expanded DROP CONSTRAINT properties_expanded_pkey;
+                    ALTER TABLE properties_expanded
+                        ADD COLUMN property_pk BIGINT GENERATED BY DEFAULT AS IDENTITY;
+                    ALTER TABLE properties_expanded
+                        ADD CONSTRAINT properties_expanded_pkey PRIMARY KEY (property_pk),
+                        ADD CONSTRAINT properties_expanded_property_id_key UNIQUE (property_id),
+                        ALTER COLUMN property_id SET DEFAULT gen_uuid_v7();
+                END IF;
+                
+                FOR child IN
+                    SELECT c.table_name FROM information_schema.columns c
+                    WHERE c.table_schema = 'public' AND c.column_name = 'property_id'
+                    AND c.table_name IN ({children})
+                    AND {_EXPANDED_TABLE_CONDITION}
+                    AND NOT EXISTS (
+                        SELECT 1 FROM information_schema.columns k
+                        WHERE k.table_schema = 'public' AND k.table_name = c.table_name
+                        AND k.column_name = 'property_pk'
+                    )
+                LOOP
+                    EXECUTE format('ALTER TABLE %I ADD COLUMN property_pk BIGINT', child);
+                    EXECUTE format(
+                        'UPDATE %I c SET property_pk = p.property_pk '
+                        'FROM properties_expanded p WHERE p.property_id = c.property_id', child
+                    );
+                    -- Nothing stopped rows outliving their property before the foreign key
+                    EXECUTE format('DELETE FROM %I WHERE property_pk IS NULL', child);
+                    EXECUTE format(
+                        'ALTER TABLE %I ALTER COLUMN property_pk SET NOT NULL, '
+                        'ADD FOREIGN KEY (property_pk) REFERENCES properties_expanded(property_pk), '
+                        'DROP COLUMN property_id', child
+                    );
+                END LOOP;
+            END $$;
+        """
+    
+    def _add_unit_mix_columns(self) -> str:
+        """Return DDL moving the promoted unit mix fields out of the JSONB of older tables"""
+        logger().info("adding_unit_mix_columns")
+        
+        def number(field: str) -> str:
+            # Values the loader could not read as numbers become NULL, as it stores them
+            return (
+                f"CASE WHEN unit_mix_data->>'{field}' ~ '^-?[0-9]+(\\.[0-9]+)?$' "
+                f"THEN (unit_mix_data->>'{field}')::NUMERIC END"
+            )
+        
+        rent_fields = ", ".join(f"'{field}'" for field in UNIT_MIX_RENT_FIELDS)
+        fields = ", ".join(f"'{field}'" for field in UNIT_MIX_TOTAL_BEDS_FIELDS) + ", " + rent_fields
+        total_beds = ",\n                            ".join(
+            f"{column} = round({number(field)})"
+            for column, field in zip(UNIT_MIX_TOTAL_BEDS_COLUMNS, UNIT_MIX_TOTAL_BEDS_FIELDS)
+        )
+        rents = ", ".join(number(field) for field in UNIT_MIX_RENT_FIELDS)
+        
+        # A no-op on databases created with the columns
+        return f"""
+            DO $$ BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_schema = 'public' AND table_name = 'unit_mix_data'
+                    AND column_name = '{UNIT_MIX_TOTAL_BEDS_COLUMNS[0]}'
+                ) THEN
+                    ALTER TABLE unit_mix_data
+                        {", ".join(f"ADD COLUMN {column} INTEGER" for column in UNIT_MIX_TOTAL_BEDS_COLUMNS)},
+                        ADD COLUMN avg_rent_by_br NUMERIC[];
+                    
+                    UPDATE unit_mix_data SET
+                            {total_beds},
+                            avg_rent_by_br = CASE WHEN unit_mix_data ?| ARRAY[{rent_fields}]
+                                THEN ARRAY[{rents}] END,
+                            unit_mix_data = unit_mix_data - ARRAY[{fields}]
+                        WHERE unit_mix_data ?| ARRAY[{fields}];
+                END IF;
+            END $$;
+        """
+    
+    def _apply_storage_parameters(self) -> str:
+        """Return DDL setting REVISED_TABLE_STORAGE on tables created before it"""
+        # Only affects pages written from now on; existing rows keep their layout
+        return "\n".join(
+            f"ALTER TABLE {table} SET ({REVISED_TABLE_STORAGE});" for table in REVISED_TABLES
+        ) + "\n"
+    
+    def _create_staging_tables(self) -> str:
+        """Return DDL for the UNLOGGED staging copies used by bulk backfills"""
+        logger().info("creating_staging_tables")
+        
+        # Same columns and defaults, but no WAL, indexes or constraints; rows
+        # are checked when they are moved into the real tables
+        return "\n".join(
+            f"CREATE UNLOGGED TABLE IF NOT EXISTS {table}{STAGE_SUFFIX} (LIKE {table} INCLUDING DEFAULTS);"
+            for table in STAGED_TABLES
+        ) + "\n"
+    
+    def _create_expanded_indexes(self) -> str:
+        """Return DDL for the performance indexes"""
+        logger().info("creating_expanded_indexes")
+        
+        # Child rows are looked up by extraction and property together, so one
+        # composite index per table serves both the leading-column scan and the
+        # combined lookup; created_at is included for latest-row index-only scans
+        indexes = []
+        for prefix, table in CHILD_TABLES.items():
+            index = (
+                f"CREATE INDEX IF NOT EXISTS idx_{prefix}_ep ON {table}(extraction_id, property_pk) "
+                f"INCLUDE (created_at);"
+            )
+            if table in SHARED_NAME_TABLES:
+                # The main schema's table of this name has no property_pk
+                index = f"""
+                    DO $$ BEGIN
+                        IF EXISTS (
+                            SELECT 1 FROM information_schema.columns
+                            WHERE table_schema = 'public' AND table_name = '{table}'
+                            AND column_name = 'property_pk'
+                        ) THEN
+                            {index}
+                        END IF;
+                    END $$;"""
+            indexes.append(index)
+            # Superseded single-column indexes
+            indexes.append(f"DROP INDEX IF EXISTS idx_{prefix}_extraction;")
+        
+        # Time-range filters on append-only created_at; BRIN keeps only
+        # per-block-range min/max, a tiny fraction of a B-tree's size
+        for table in ('properties_expanded', *CHILD_TABLES.values()):
+            indexes.append(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_created_brin ON {table} "
+                f"USING BRIN (created_at) WITH (pages_per_range = 32);"
+            )
+        
+        # Cluster keys grouping each property's rows onto adjacent heap pages
+        for prefix, table in CLUSTERED_TABLES.items():
+            indexes.append(
+                f"CREATE INDEX IF NOT EXISTS idx_{prefix}_cluster ON {table}(property_pk, extraction_id);"
+            )
+            indexes.append(f"ALTER TABLE {table} CLUSTER ON idx_{prefix}_cluster;")
+        
+        indexes += [
+            "DROP INDEX IF EXISTS idx_unit_mix_property;",
             "CREATE INDEX IF NOT EXISTS idx_projections_year ON annual_projections(projection_year);",
-            "CREATE INDEX IF NOT EXISTS idx_financing_extraction ON financing_data(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_returns_extraction ON investment_returns(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_expenses_extraction ON operating_expenses(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_income_extraction ON income_data(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_misc_extraction ON miscellaneous_data(extraction_id);",
+            
+            # Sale date range filters
+            "CREATE INDEX IF NOT EXISTS idx_properties_expanded_last_sale_date_brin ON properties_expanded USING BRIN (last_sale_date);",
+            
+            # Containment (@>) lookups into the JSONB payload
+            "CREATE INDEX IF NOT EXISTS idx_misc_field_gin ON miscellaneous_data USING GIN (field_data jsonb_path_ops);",
+            
+            # Financing has no flat table yet, so financing lookups always go
+            # through the JSONB; a partial index covers just those rows
+            "CREATE INDEX IF NOT EXISTS idx_misc_financing_gin ON miscellaneous_data "
+            "USING GIN (field_data jsonb_path_ops) WHERE field_data ? 'financing';",
         ]
         
-        for index_sql in indexes:
-            cursor.execute(index_sql)
+        return "\n".join(indexes)
 
 def main():
     """Test function"""
@@ -0,0 +1,40 @@
+"""
+Identifier generation for B&R Capital Dashboard database records
+
+Primary keys are passed to psycopg2 as uuid.UUID objects (see the
+register_uuid call in connection.py) so they are sent to PostgreSQL
+without being formatted to text first.
+"""
+
+import os
+import time
+import uuid
+from typing import List
+
+
+def new_uuids(count: int) -> List[uuid.UUID]:
+    """Generate a batch of random (version 4) UUIDs from a single urandom call"""
+    raw = os.urandom(16 * count)
+    return [
+        uuid.UUID(bytes=raw[offset:offset + 16], version=4)
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
+def new_uuid7s(count: int) -> List[uuid.UUID]:
+    """
+    Generate a batch of time-ordered (version 7) UUIDs, in ascending order
+
+    The first 48 bits are the current Unix time in milliseconds, so keys from
+    successive batches are appended to the right edge of a B-tree index.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    raw = os.urandom(10 * count)
+    # 74 random bits per id: 12 for rand_a, 62 for rand_b
+    randoms = sorted(int.from_bytes(raw[offset:offset + 10], 'big') >> 6
+                     for offset in range(0, 10 * count, 10))
+    return [
+        uuid.UUID(int=(unix_ms << 80) | (0x7 << 76) | ((rand >> 62) << 64)
+                  | (0b10 << 62) | (rand & ((1 << 62) - 1)))
+        for rand in randoms
+    ]
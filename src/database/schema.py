@@ -5,45 +5,516 @@ This module defines the PostgreSQL schema for storing comprehensive
 underwriting model data with historical tracking and partitioning.
 
 Schema Design:
-- Partitioned by deal_stage for performance
+- Partitioned by deal_stage, then by month of extraction_timestamp
 - Historical versioning with extraction timestamps
 - Optimized indexing for common queries
 - Data type optimization for 1140+ fields
 """
 
-from typing import Dict, List, Any
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, List, Any, Optional, Sequence, Set
+import psycopg2
 import structlog
-from .connection import get_cursor
+from .connection import get_connection, get_cursor
+from .schema_fields import UNDERWRITING_COLUMN_LIST, UNDERWRITING_COLUMNS
 
 logger = structlog.get_logger().bind(component="DatabaseSchema")
 
+# underwriting_data list partitions, one per deal_stage_enum value
+DEAL_STAGES = (
+    'dead_deals',
+    'initial_uw_review',
+    'active_uw_review',
+    'under_contract',
+    'closed_deals',
+    'realized_deals'
+)
+
+# Tables list-partitioned by deal_stage. Each has a {table}_default partition
+# holding rows of a stage without its own partition, until
+# attach_stage_partition adds one
+STAGE_PARTITIONED_TABLES = ('underwriting_data', 'annual_cashflows')
+
+# First month with its own extraction_timestamp sub-partition; earlier rows
+# land in each stage's DEFAULT partition
+UNDERWRITING_PARTITION_START = date(2025, 1, 1)
+
+# Months of sub-partitions created ahead of the current month
+PARTITION_MONTHS_AHEAD = 3
+
+# Hash partitions of rent_comparables and sales_comparables by extraction_id
+COMPARABLES_HASH_PARTITIONS = 16
+
+# Hash-partitioned comparables tables: (table, primary key column)
+COMPARABLES_TABLES = (
+    ('rent_comparables', 'rent_comp_id'),
+    ('sales_comparables', 'sales_comp_id'),
+)
+
+# annual_cashflows metrics; metric_id is the 1-based position
+CASHFLOW_METRICS = (
+    'gross_potential_income', 'vacancy_loss', 'effective_gross_income',
+    'operating_expenses', 'net_operating_income', 'debt_service',
+    'before_tax_cash_flow', 'capital_improvements', 'tenant_improvements',
+    'leasing_commissions'
+)
+
+# Tables whose rows belong to one extraction: (table, foreign key constraint).
+# Each carries the full underwriting_data primary key, since a foreign key to
+# a partitioned table must cover its partition keys
+UNDERWRITING_CHILD_TABLES = (
+    ('annual_cashflows', 'fk_cashflows_extraction'),
+    ('rent_comparables', 'fk_rent_comps_extraction'),
+    ('sales_comparables', 'fk_sales_comps_extraction'),
+    ('extraction_metadata', 'fk_extraction_metadata_extraction'),
+)
+
+# Materialized views in refresh order
+MATERIALIZED_VIEWS = ('latest_underwriting_data',)
+
+# Plain views
+VIEWS = ('portfolio_summary', 'property_history')
+
+# Statement-level triggers keeping portfolio_summary_rollup current:
+# (trigger, event, transition table holding the touched rows)
+PORTFOLIO_ROLLUP_TRIGGERS = (
+    ('portfolio_rollup_insert', 'INSERT', 'NEW'),
+    ('portfolio_rollup_update_new', 'UPDATE', 'NEW'),
+    ('portfolio_rollup_update_old', 'UPDATE', 'OLD'),
+    ('portfolio_rollup_delete', 'DELETE', 'OLD'),
+)
+
+# (name, table, definition) for every index created by SchemaManager
+INDEXES = (
+    # Properties table indexes
+    ('idx_properties_name', 'properties', '(property_name)'),
+    ('idx_properties_city_state', 'properties', '(property_city, property_state)'),
+    ('idx_properties_market', 'properties', '(market)'),
+    
+    # Underwriting data indexes. A property's history is read in index
+    # order, and cluster_underwriting_data orders each partition by it
+    ('idx_uw_property_ts', 'underwriting_data', '(property_id, extraction_timestamp DESC)'),
+    # Extractions are appended in time order, so BRIN's per-block-range
+    # min/max prunes timestamp ranges at a tiny fraction of a B-tree's size
+    ('idx_underwriting_ts_brin', 'underwriting_data',
+     'USING brin(extraction_timestamp) WITH (pages_per_range = 32)'),
+    ('idx_underwriting_latest_version', 'underwriting_data',
+     '(is_latest_version) WHERE is_latest_version = TRUE'),
+    # Covers the dashboard columns so latest-version reads are index-only scans
+    ('idx_uw_property_latest_cov', 'underwriting_data',
+     '(property_id) INCLUDE (purchase_price, units, levered_returns_irr, '
+     'net_operating_income, last_sale_cap_rate) WHERE is_latest_version = TRUE'),
+    ('idx_uw_fields_gin', 'underwriting_data', 'USING gin(fields jsonb_path_ops)'),
+    
+    # Text search indexes
+    ('idx_properties_name_gin', 'properties', 'USING gin(property_name gin_trgm_ops)'),
+    
+    # Cashflows indexes; extraction lookups use the primary key. Single-metric
+    # time series are index-only scans, and cluster_annual_cashflows
+    # orders each partition by this index
+    ('idx_cashflows_metric_prop_year', 'annual_cashflows',
+     '(metric_id, property_id, year_number) INCLUDE (value)'),
+    ('idx_cashflows_created_brin', 'annual_cashflows',
+     'USING brin(created_at) WITH (pages_per_range = 32)'),
+    
+    # Comparables indexes
+    ('idx_rent_comps_extraction_id', 'rent_comparables', '(extraction_id)'),
+    ('idx_sales_comps_extraction_id', 'sales_comparables', '(extraction_id)'),
+    ('idx_rent_comps_created_brin', 'rent_comparables',
+     'USING brin(created_at) WITH (pages_per_range = 32)'),
+    ('idx_sales_comps_created_brin', 'sales_comparables',
+     'USING brin(created_at) WITH (pages_per_range = 32)'),
+    
+    # Metadata indexes
+    ('idx_extraction_metadata_extraction_id', 'extraction_metadata', '(extraction_id)'),
+    ('idx_extraction_metadata_created_brin', 'extraction_metadata',
+     'USING brin(created_at) WITH (pages_per_range = 32)'),
+)
+
+# (name, table) of indexes superseded by an entry in INDEXES, dropped once
+# their replacement exists
+SUPERSEDED_INDEXES = (
+    ('idx_underwriting_property_latest', 'underwriting_data'),
+    ('idx_cashflows_property_year', 'annual_cashflows'),
+    ('idx_cashflows_prop_year_cov', 'annual_cashflows'),
+    ('idx_cashflows_extraction_id', 'annual_cashflows'),
+    ('idx_underwriting_extraction_timestamp', 'underwriting_data'),
+    ('idx_underwriting_property_id', 'underwriting_data'),
+)
+
+# Creates INDEXES and drops SUPERSEDED_INDEXES as one batch, shared with
+# MigrationManager
+INDEX_DDL = "\n".join(
+    [f"CREATE INDEX IF NOT EXISTS {name} ON {table} {definition};"
+     for name, table, definition in INDEXES]
+    + [f"DROP INDEX IF EXISTS {name};" for name, _ in SUPERSEDED_INDEXES]
+)
+
+# First server_version_num that can CLUSTER a partitioned table; older
+# servers cluster each leaf partition on its own index instead
+CLUSTER_PARTITIONED_MIN_VERSION = 150000
+
+# Longest create_indexes_online waits for a table lock before giving up on an index
+ONLINE_INDEX_LOCK_TIMEOUT = '2s'
+
+# Longest a schema creation step waits for a table lock before failing
+SCHEMA_LOCK_TIMEOUT = '5s'
+
+# Seconds a get_schema_info result is reused; the catalog walk, notably
+# pg_total_relation_size over every relation, is too slow to repeat on each
+# UI refresh
+SCHEMA_INFO_TTL = 60.0
+
+# Tables (largest first), views and indexes as one JSONB document. The sizes
+# are computed once per table in a materialized CTE and then only sorted on
+_SCHEMA_INFO_SQL = """
+    WITH table_sizes AS MATERIALIZED (
+        SELECT table_name, pg_total_relation_size(quote_ident(table_name)) AS bytes
+        FROM information_schema.tables 
+        WHERE table_schema = 'public' 
+        AND table_type = 'BASE TABLE'
+    ),
+    -- information_schema omits materialized views
+    view_names AS (
+        SELECT table_name::text AS name FROM information_schema.views 
+        WHERE table_schema = 'public'
+        UNION ALL
+        SELECT matviewname::text FROM pg_matviews
+        WHERE schemaname = 'public'
+    )
+    SELECT jsonb_build_object(
+        'tables', (
+            SELECT COALESCE(jsonb_agg(
+                jsonb_build_object('name', table_name, 'size', pg_size_pretty(bytes))
+                ORDER BY bytes DESC
+            ), '[]'::jsonb)
+            FROM table_sizes
+        ),
+        'views', (
+            SELECT COALESCE(jsonb_agg(name ORDER BY name), '[]'::jsonb) FROM view_names
+        ),
+        'indexes', (
+            SELECT COALESCE(jsonb_agg(
+                jsonb_build_object('table', tablename, 'name', indexname, 'definition', indexdef)
+                ORDER BY tablename, indexname
+            ), '[]'::jsonb)
+            FROM pg_indexes 
+            WHERE schemaname = 'public'
+        )
+    )
+"""
+
+# Migration tracking table shared with MigrationManager
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        migration_id SERIAL PRIMARY KEY,
+        migration_name VARCHAR(255) NOT NULL UNIQUE,
+        description TEXT,
+        applied_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+        rollback_sql TEXT,
+        checksum VARCHAR(64)
+    );
+    
+    -- Create index for fast lookups
+    CREATE INDEX IF NOT EXISTS idx_schema_migrations_name 
+    ON schema_migrations(migration_name);
+"""
+
+# Unlogged bulk-load staging table, shared with MigrationManager. It only
+# holds rows mid-load, so it is recreated to pick up underwriting_data
+# column changes
+STAGING_TABLE_DDL = """
+    DROP TABLE IF EXISTS underwriting_data_stage;
+    CREATE UNLOGGED TABLE underwriting_data_stage (
+        batch_id UUID NOT NULL,
+        LIKE underwriting_data INCLUDING DEFAULTS
+    );
+"""
+
+# Set-based version management for a batch of new extractions, shared with
+# MigrationManager: numbers every version of the touched properties by
+# extraction_timestamp and flags the newest as latest, only writing rows whose
+# values change. Replaces the per-row trigger older schemas installed
+FINALIZE_EXTRACTION_BATCH_DDL = """
+    DROP TRIGGER IF EXISTS manage_underwriting_versions ON underwriting_data;
+    DROP FUNCTION IF EXISTS manage_version_numbering();
+    
+    CREATE OR REPLACE FUNCTION finalize_extraction_batch(new_extraction_ids UUID[])
+    RETURNS INTEGER AS $$
+    DECLARE
+        updated_rows INTEGER;
+    BEGIN
+        WITH touched AS (
+            SELECT DISTINCT property_id FROM underwriting_data
+            WHERE extraction_id = ANY(new_extraction_ids)
+        ),
+        ranked AS (
+            SELECT 
+                u.extraction_id, u.deal_stage, u.extraction_timestamp,
+                row_number() OVER w AS version_number,
+                row_number() OVER w = COUNT(*) OVER (PARTITION BY u.property_id) AS is_latest
+            FROM underwriting_data u
+            JOIN touched t ON t.property_id = u.property_id
+            WINDOW w AS (
+                PARTITION BY u.property_id
+                ORDER BY u.extraction_timestamp, u.created_at, u.extraction_id
+            )
+        )
+        UPDATE underwriting_data u
+        SET version_number = r.version_number,
+            is_latest_version = r.is_latest
+        FROM ranked r
+        WHERE u.extraction_id = r.extraction_id
+        AND u.deal_stage = r.deal_stage
+        AND u.extraction_timestamp = r.extraction_timestamp
+        AND (u.version_number, u.is_latest_version) IS DISTINCT FROM (r.version_number, r.is_latest);
+        
+        GET DIAGNOSTICS updated_rows = ROW_COUNT;
+        RETURN updated_rows;
+    END;
+    $$ language 'plpgsql';
+"""
+
+# properties columns copied onto underwriting_data, so dashboard reads need
+# no join to properties. Writers copy them from the row's property as they
+# insert (see promote_staging and DataLoader)
+PROPERTY_GEOGRAPHY_COLUMNS = ('property_city', 'property_state', 'market', 'submarket', 'county')
+
+# Moves one staged batch into underwriting_data with a single
+# INSERT ... SELECT, taking the geography from each row's property, and
+# numbers the versions of the touched properties
+PROMOTE_STAGING_DDL = f"""
+    CREATE OR REPLACE FUNCTION promote_staging(stage_batch_id UUID)
+    RETURNS INTEGER AS $$
+    DECLARE
+        promoted_ids UUID[];
+    BEGIN
+        WITH staged AS (
+            DELETE FROM underwriting_data_stage
+            WHERE batch_id = stage_batch_id
+            RETURNING *
+        ),
+        promoted AS (
+            INSERT INTO underwriting_data ({UNDERWRITING_COLUMN_LIST}, {', '.join(PROPERTY_GEOGRAPHY_COLUMNS)})
+            SELECT {', '.join(f's.{column}' for column in UNDERWRITING_COLUMNS)},
+                {', '.join(f'p.{column}' for column in PROPERTY_GEOGRAPHY_COLUMNS)}
+            FROM staged s
+            LEFT JOIN properties p ON p.property_id = s.property_id
+            RETURNING extraction_id
+        )
+        SELECT array_agg(extraction_id) INTO promoted_ids FROM promoted;
+        
+        IF promoted_ids IS NULL THEN
+            RETURN 0;
+        END IF;
+        
+        PERFORM finalize_extraction_batch(promoted_ids);
+        RETURN cardinality(promoted_ids);
+    END;
+    $$ language 'plpgsql';
+"""
+
+# Keeps the PROPERTY_GEOGRAPHY_COLUMNS copies current, shared with
+# MigrationManager: the rare geography change on a property is cascaded to
+# its rows. New rows are written with their geography, so the per-row
+# BEFORE INSERT copy trigger older schemas installed is dropped
+PROPERTY_GEOGRAPHY_DDL = f"""
+    DROP TRIGGER IF EXISTS copy_underwriting_geography ON underwriting_data;
+    DROP FUNCTION IF EXISTS copy_property_geography();
+    
+    CREATE OR REPLACE FUNCTION cascade_property_geography()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        UPDATE underwriting_data
+        SET {', '.join(f'{column} = NEW.{column}' for column in PROPERTY_GEOGRAPHY_COLUMNS)}
+        WHERE property_id = NEW.property_id;
+        RETURN NULL;
+    END;
+    $$ language 'plpgsql';
+    
+    DO $$ BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger
+            WHERE tgname = 'cascade_properties_geography'
+            AND tgrelid = 'properties'::regclass
+        ) THEN
+        CREATE TRIGGER cascade_properties_geography
+            AFTER UPDATE OF {', '.join(PROPERTY_GEOGRAPHY_COLUMNS)} ON properties
+            FOR EACH ROW
+            WHEN (({', '.join(f'OLD.{column}' for column in PROPERTY_GEOGRAPHY_COLUMNS)})
+                  IS DISTINCT FROM ({', '.join(f'NEW.{column}' for column in PROPERTY_GEOGRAPHY_COLUMNS)}))
+            EXECUTE FUNCTION cascade_property_geography();
+        END IF;
+    END $$;
+"""
+
+# Per-stage aggregates read by the portfolio_summary view, shared with
+# MigrationManager
+PORTFOLIO_ROLLUP_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS portfolio_summary_rollup (
+        deal_stage deal_stage_enum PRIMARY KEY,
+        property_count INTEGER NOT NULL,
+        total_units BIGINT,
+        total_purchase_price NUMERIC,
+        avg_cap_rate DOUBLE PRECISION,
+        avg_irr DOUBLE PRECISION,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+    );
+"""
+
+# Keeps portfolio_summary_rollup current, shared with MigrationManager.
+# refresh_portfolio_rollup recomputes one stage's row, scanning only that
+# stage's partitions through the covering index; the PORTFOLIO_ROLLUP_TRIGGERS
+# run it once per statement for the stages its rows touched. Ends by filling
+# the rollup for rows that predate the triggers
+PORTFOLIO_ROLLUP_DDL = """
+    CREATE OR REPLACE FUNCTION refresh_portfolio_rollup(stage deal_stage_enum)
+    RETURNS VOID AS $$
+    BEGIN
+        INSERT INTO portfolio_summary_rollup (
+            deal_stage, property_count, total_units, total_purchase_price,
+            avg_cap_rate, avg_irr, updated_at
+        )
+        SELECT 
+            stage,
+            COUNT(*),
+            SUM(units),
+            SUM(purchase_price),
+            AVG(last_sale_cap_rate),
+            AVG(levered_returns_irr),
+            NOW()
+        FROM underwriting_data
+        WHERE deal_stage = stage
+        AND is_latest_version = TRUE
+        AND purchase_price IS NOT NULL
+        HAVING COUNT(*) > 0
+        ON CONFLICT (deal_stage) DO UPDATE SET
+            property_count = EXCLUDED.property_count,
+            total_units = EXCLUDED.total_units,
+            total_purchase_price = EXCLUDED.total_purchase_price,
+            avg_cap_rate = EXCLUDED.avg_cap_rate,
+            avg_irr = EXCLUDED.avg_irr,
+            updated_at = EXCLUDED.updated_at;
+        
+        -- No latest priced rows left for the stage
+        IF NOT FOUND THEN
+            DELETE FROM portfolio_summary_rollup WHERE deal_stage = stage;
+        END IF;
+    END;
+    $$ language 'plpgsql';
+    
+    CREATE OR REPLACE FUNCTION portfolio_rollup_trigger()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        stage deal_stage_enum;
+    BEGIN
+        FOR stage IN SELECT DISTINCT deal_stage FROM changed_rows LOOP
+            PERFORM refresh_portfolio_rollup(stage);
+        END LOOP;
+        RETURN NULL;
+    END;
+    $$ language 'plpgsql';
+""" + "".join(
+    f"""
+    DO $$ BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger
+            WHERE tgname = '{trigger}'
+            AND tgrelid = 'underwriting_data'::regclass
+        ) THEN
+        CREATE TRIGGER {trigger}
+            AFTER {event} ON underwriting_data
+            REFERENCING {transition} TABLE AS changed_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION portfolio_rollup_trigger();
+        END IF;
+    END $$;
+"""
+    for trigger, event, transition in PORTFOLIO_ROLLUP_TRIGGERS
+) + """
+    SELECT refresh_portfolio_rollup(stage) FROM unnest(enum_range(NULL::deal_stage_enum)) AS stage;
+"""
+
+# Prefix of the schema_migrations rows recording SchemaManager steps
+SCHEMA_STEP_PREFIX = 'schema_'
+
+# SchemaManager creation steps in apply order: (step, method name)
+SCHEMA_STEPS = (
+    ('extensions', '_create_extensions'),
+    ('enums', '_create_enums'),
+    ('main_tables', '_create_main_tables'),
+    ('partitions', '_create_partitions'),
+    ('staging', '_create_staging_tables'),
+    ('indexes', '_create_indexes'),
+    ('views', '_create_views'),
+    ('functions', '_create_functions'),
+)
+
+def _add_months(month: date, months: int) -> date:
+    """First day of the month `months` after `month`"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
 class SchemaManager:
     """Manages database schema creation and migration"""
     
     def __init__(self):
-        self.schema_version = "1.0.0"
+        # Bump when the DDL changes so existing databases re-run every step
+        self.schema_version = "1.11.0"
+        # Last get_schema_info result and its time.monotonic() timestamp
+        self._schema_info: Optional[Dict[str, Any]] = None
+        self._schema_info_at = 0.0
         
     def create_database_schema(self):
-        """Create the complete database schema"""
+        """
+        Create the complete database schema
+        
+        Each SCHEMA_STEPS step is recorded in schema_migrations as
+        schema_{version}_{step} and skipped once recorded, so repeated calls
+        do not re-run the DDL or replace tuned views. All pending steps run in
+        one transaction under SCHEMA_LOCK_TIMEOUT.
+        """
         logger.info("creating_database_schema", version=self.schema_version)
+        self._schema_info = None
         
         try:
             with get_cursor() as cursor:
+                cursor.execute(f"SET LOCAL lock_timeout = '{SCHEMA_LOCK_TIMEOUT}';")
+                cursor.execute(SCHEMA_MIGRATIONS_DDL)
+                
+                step_names = {step: self._step_migration_name(step) for step, _ in SCHEMA_STEPS}
+                cursor.execute(
+                    "SELECT migration_name FROM schema_migrations WHERE migration_name = ANY(%s)",
+                    (list(step_names.values()),)
+                )
+                applied = {row[0] for row in cursor.fetchall()}
+                
                 # Create schema
-                self._create_extensions(cursor)
-                self._create_enums(cursor)
-                self._create_main_tables(cursor)
-                self._create_partitions(cursor)
-                self._create_indexes(cursor)
-                self._create_views(cursor)
-                self._create_functions(cursor)
+                applied_now = []
+                for step, method in SCHEMA_STEPS:
+                    if step_names[step] in applied:
+                        continue
+                    getattr(self, method)(cursor)
+                    applied_now.append(step_names[step])
                 
-                logger.info("database_schema_created_successfully")
+                if applied_now:
+                    cursor.execute("""
+                        INSERT INTO schema_migrations (migration_name, description)
+                        SELECT name, 'Schema step ' || name FROM unnest(%s::text[]) AS name
+                        ON CONFLICT (migration_name) DO NOTHING
+                    """, (applied_now,))
+                
+                logger.info("database_schema_created_successfully", steps_applied=len(applied_now))
                 
         except Exception as e:
             logger.error("database_schema_creation_failed", error=str(e))
             raise
     
+    def _step_migration_name(self, step: str) -> str:
+        """schema_migrations row recording that a creation step ran for this schema version"""
+        return f"{SCHEMA_STEP_PREFIX}{self.schema_version}_{step}"
+    
     def _create_extensions(self, cursor):
         """Create required PostgreSQL extensions"""
         logger.info("creating_database_extensions")
@@ -54,8 +525,7 @@ class SchemaManager:
             "CREATE EXTENSION IF NOT EXISTS \"btree_gin\";",   # For GIN indexes
         ]
         
-        for extension in extensions:
-            cursor.execute(extension)
+        cursor.execute("\n".join(extensions))
     
     def _create_enums(self, cursor):
         """Create enumeration types"""
@@ -64,6 +534,7 @@ class SchemaManager:
         # Deal stages enum
         cursor.execute("""
             DO $$ BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'deal_stage_enum') THEN
                 CREATE TYPE deal_stage_enum AS ENUM (
                     'dead_deals',
                     'initial_uw_review',
@@ -72,14 +543,14 @@ class SchemaManager:
                     'closed_deals',
                     'realized_deals'
                 );
-            EXCEPTION
-                WHEN duplicate_object THEN null;
+                END IF;
             END $$;
         """)
         
         # Data categories enum
         cursor.execute("""
             DO $$ BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'data_category_enum') THEN
                 CREATE TYPE data_category_enum AS ENUM (
                     'general_assumptions',
                     'exit_assumptions',
@@ -93,8 +564,7 @@ class SchemaManager:
                     'sales_comps',
                     'annual_cashflows'
                 );
-            EXCEPTION
-                WHEN duplicate_object THEN null;
+                END IF;
             END $$;
         """)
     
@@ -130,135 +600,92 @@ class SchemaManager:
                 file_modified_date TIMESTAMP WITH TIME ZONE,
                 file_size_mb NUMERIC(10,2),
                 
+                -- PROPERTY_GEOGRAPHY_COLUMNS, copied from properties as rows
+                -- are inserted; property_state is as wide as
+                -- fix_schema_issues makes the properties column
+                property_city VARCHAR(100),
+                property_state VARCHAR(50),
+                market VARCHAR(100),
+                submarket VARCHAR(100),
+                county VARCHAR(100),
+                
                 -- Version tracking
                 version_number INTEGER NOT NULL DEFAULT 1,
                 is_latest_version BOOLEAN NOT NULL DEFAULT TRUE,
                 
-                -- General Assumptions (32 fields)
-                year_built INTEGER,
-                year_renovated INTEGER,
-                location_quality VARCHAR(10),
-                building_quality VARCHAR(10),
+                -- Hot fields: typed columns the dashboards filter and aggregate on
+                -- (schema_fields.HOT_COLUMNS). Prices stay exact NUMERIC; income
+                -- and expense totals are float8 and ratios float4, which hold
+                -- their precision in fixed-width, faster-to-aggregate columns
                 units INTEGER,
-                avg_square_feet NUMERIC(10,2),
-                parking_spaces_covered INTEGER,
-                parking_spaces_uncovered INTEGER,
-                individually_metered VARCHAR(10),
-                current_owner TEXT,
-                last_sale_date NUMERIC(20,10),
-                last_sale_price NUMERIC(15,2),
-                last_sale_price_per_unit NUMERIC(10,2),
-                last_sale_cap_rate NUMERIC(8,6),
-                building_height NUMERIC(5,1),
-                building_type VARCHAR(50),
-                project_type VARCHAR(50),
-                number_of_buildings NUMERIC(5,1),
-                building_zoning VARCHAR(20),
-                land_area NUMERIC(10,2),
-                parcel_number VARCHAR(100),
-                property_latitude VARCHAR(50),
-                property_longitude VARCHAR(50),
-                property_address_field NUMERIC(10,2),
-                property_zip VARCHAR(20),
-                
-                -- Exit Assumptions (3 fields)
-                exit_period_months NUMERIC(5,1),
-                exit_cap_rate NUMERIC(8,6),
-                sales_transaction_costs NUMERIC(8,6),
-                
-                -- NOI Assumptions (representative sample - we'll add more)
-                empirical_rent NUMERIC(10,2),
-                rent_psf NUMERIC(8,4),
-                gross_potential_rental_income NUMERIC(12,2),
-                concessions NUMERIC(8,6),
-                loss_to_lease NUMERIC(8,6),
-                vacancy_loss NUMERIC(8,6),
-                bad_debts NUMERIC(8,6),
-                other_loss NUMERIC(8,6),
-                property_management_fee NUMERIC(12,2),
-                net_rental_income NUMERIC(12,2),
-                parking_income NUMERIC(12,2),
-                laundry_income NUMERIC(12,2),
-                other_income NUMERIC(12,2),
-                effective_gross_income NUMERIC(12,2),
-                
-                -- Operating Expenses
-                advertising_marketing NUMERIC(12,2),
-                management_fee NUMERIC(12,2),
-                payroll NUMERIC(12,2),
-                repairs_maintenance NUMERIC(12,2),
-                contract_services NUMERIC(12,2),
-                turnover NUMERIC(12,2),
-                utilities NUMERIC(12,2),
-                insurance NUMERIC(12,2),
-                real_estate_taxes NUMERIC(12,2),
-                other_expenses NUMERIC(12,2),
-                total_operating_expenses NUMERIC(12,2),
-                net_operating_income NUMERIC(12,2),
-                
-                -- Debt and Equity Assumptions (representative sample)
+                year_built INTEGER,
                 purchase_price NUMERIC(15,2),
-                hard_costs_budget NUMERIC(15,2),
-                soft_costs_budget NUMERIC(15,2),
-                total_hard_costs NUMERIC(15,2),
-                total_soft_costs NUMERIC(15,2),
-                total_acquisition_budget NUMERIC(15,2),
                 loan_amount NUMERIC(15,2),
-                loan_to_cost NUMERIC(8,6),
-                loan_to_value NUMERIC(8,6),
-                equity_lp_capital NUMERIC(15,2),
-                equity_gp_capital NUMERIC(15,2),
+                effective_gross_income DOUBLE PRECISION,
+                total_operating_expenses DOUBLE PRECISION,
+                net_operating_income DOUBLE PRECISION,
+                last_sale_cap_rate REAL,
+                exit_cap_rate REAL,
+                levered_returns_irr REAL,
+                levered_returns_moic REAL,
                 
-                -- Return Metrics
-                t12_return_on_pp NUMERIC(8,6),
-                t12_return_on_cost NUMERIC(8,6),
-                levered_returns_irr NUMERIC(8,6),
-                levered_returns_moic NUMERIC(8,4),
-                basis_unit_at_close NUMERIC(10,2),
-                basis_unit_at_exit NUMERIC(10,2),
+                -- All other extracted fields, keyed by column name; only
+                -- non-null values are stored
+                fields JSONB NOT NULL DEFAULT '{}'::jsonb,
                 
                 -- Metadata
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 
-                -- Composite primary key including partition key
-                PRIMARY KEY (extraction_id, deal_stage)
-                -- Note: Foreign key constraint removed for partitioned table
+                -- Composite primary key including both partition keys; the
+                -- UNDERWRITING_CHILD_TABLES reference it
+                PRIMARY KEY (extraction_id, deal_stage, extraction_timestamp)
             ) PARTITION BY LIST (deal_stage);
         """)
         
-        # Annual cashflows table (for time series data)
+        # Cashflow metric lookup, seeded from CASHFLOW_METRICS
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS cashflow_metric (
+                metric_id SMALLINT PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            );
+            
+            INSERT INTO cashflow_metric (metric_id, name) VALUES
+            {', '.join(f"({metric_id}, '{name}')" for metric_id, name in enumerate(CASHFLOW_METRICS, 1))}
+            ON CONFLICT (metric_id) DO NOTHING;
+        """)
+        
+        # Annual cashflows table (for time series data): one row per metric
+        # and year, so a single metric's series is read without the others.
+        # Partitioned by deal_stage like underwriting_data, so joins between
+        # the two run partition by partition
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS annual_cashflows (
-                cashflow_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
                 extraction_id UUID NOT NULL,
+                deal_stage deal_stage_enum NOT NULL,
+                extraction_timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
                 property_id UUID NOT NULL,
                 year_number INTEGER NOT NULL,
+                metric_id SMALLINT NOT NULL REFERENCES cashflow_metric(metric_id),
+                value DOUBLE PRECISION NOT NULL,
                 
-                -- Cashflow fields
-                gross_potential_income NUMERIC(15,2),
-                vacancy_loss NUMERIC(15,2),
-                effective_gross_income NUMERIC(15,2),
-                operating_expenses NUMERIC(15,2),
-                net_operating_income NUMERIC(15,2),
-                debt_service NUMERIC(15,2),
-                before_tax_cash_flow NUMERIC(15,2),
-                
-                -- Capital items
-                capital_improvements NUMERIC(15,2),
-                tenant_improvements NUMERIC(15,2),
-                leasing_commissions NUMERIC(15,2),
-                
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 
-                -- Note: Cannot reference partitioned table directly
-            );
+                PRIMARY KEY (extraction_id, deal_stage, year_number, metric_id),
+                CONSTRAINT fk_cashflows_extraction
+                    FOREIGN KEY (extraction_id, deal_stage, extraction_timestamp)
+                    REFERENCES underwriting_data ON DELETE CASCADE
+            ) PARTITION BY LIST (deal_stage);
         """)
         
-        # Rent comparables table
+        # Rent comparables table. Both comparables tables are hash-partitioned
+        # by extraction_id, so an extraction's comparables sit in one small
+        # partition with a small index
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS rent_comparables (
-                rent_comp_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                rent_comp_id UUID NOT NULL DEFAULT uuid_generate_v4(),
                 extraction_id UUID NOT NULL,
+                deal_stage deal_stage_enum NOT NULL,
+                extraction_timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
                 property_id UUID NOT NULL,
                 comp_number INTEGER NOT NULL,
                 
@@ -272,17 +699,22 @@ class SchemaManager:
                 comp_rent_psf NUMERIC(8,2),
                 comp_total_rent NUMERIC(10,2),
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 
-                -- Note: Cannot reference partitioned table directly
-            );
+                PRIMARY KEY (rent_comp_id, extraction_id),
+                CONSTRAINT fk_rent_comps_extraction
+                    FOREIGN KEY (extraction_id, deal_stage, extraction_timestamp)
+                    REFERENCES underwriting_data ON DELETE CASCADE
+            ) PARTITION BY HASH (extraction_id);
         """)
         
         # Sales comparables table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS sales_comparables (
-                sales_comp_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+                sales_comp_id UUID NOT NULL DEFAULT uuid_generate_v4(),
                 extraction_id UUID NOT NULL,
+                deal_stage deal_stage_enum NOT NULL,
+                extraction_timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
                 property_id UUID NOT NULL,
                 comp_number INTEGER NOT NULL,
                 
@@ -297,122 +729,477 @@ class SchemaManager:
                 comp_cap_rate NUMERIC(8,6),
                 comp_sale_date DATE,
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 
-                -- Note: Cannot reference partitioned table directly
-            );
+                PRIMARY KEY (sales_comp_id, extraction_id),
+                CONSTRAINT fk_sales_comps_extraction
+                    FOREIGN KEY (extraction_id, deal_stage, extraction_timestamp)
+                    REFERENCES underwriting_data ON DELETE CASCADE
+            ) PARTITION BY HASH (extraction_id);
         """)
         
-        # Extraction metadata table
+        # Extraction metadata table; the free space fillfactor leaves lets
+        # counter fixups be HOT updates that skip the indexes
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS extraction_metadata (
                 metadata_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
                 extraction_id UUID NOT NULL,
-                total_fields_attempted INTEGER NOT NULL,
+                deal_stage deal_stage_enum NOT NULL,
+                extraction_timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
                 successful_extractions INTEGER NOT NULL,
                 failed_extractions INTEGER NOT NULL,
-                extraction_duration_seconds NUMERIC(8,2),
+                -- Derived, so it cannot drift from the two counters
+                total_fields_attempted INTEGER
+                    GENERATED ALWAYS AS (successful_extractions + failed_extractions) STORED,
+                extraction_duration_ms INTEGER,
                 error_count INTEGER DEFAULT 0,
                 warnings_count INTEGER DEFAULT 0,
                 
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 
-                -- Note: Cannot reference partitioned table directly
-            );
+                CONSTRAINT fk_extraction_metadata_extraction
+                    FOREIGN KEY (extraction_id, deal_stage, extraction_timestamp)
+                    REFERENCES underwriting_data ON DELETE CASCADE
+            ) WITH (fillfactor = 90);
         """)
     
+    def _create_staging_tables(self, cursor):
+        """
+        Create the unlogged staging table bulk loads COPY into
+        
+        underwriting_data_stage has underwriting_data's columns plus the
+        load's batch_id, but no partitions, indexes or triggers, and skips
+        the WAL; promote_staging moves a batch into underwriting_data.
+        """
+        logger.info("creating_staging_tables")
+        
+        cursor.execute(STAGING_TABLE_DDL)
+    
     def _create_partitions(self, cursor):
-        """Create table partitions by deal stage"""
-        logger.info("creating_table_partitions")
+        """
+        Create table partitions by deal stage, each range-partitioned by month
         
-        partitions = [
-            ("dead_deals", "dead_deals"),
-            ("initial_uw_review", "initial_uw_review"),
-            ("active_uw_review", "active_uw_review"),
-            ("under_contract", "under_contract"),
-            ("closed_deals", "closed_deals"),
-            ("realized_deals", "realized_deals")
-        ]
+        Every stage gets a DEFAULT sub-partition plus one per month from
+        UNDERWRITING_PARTITION_START through PARTITION_MONTHS_AHEAD months
+        ahead of now, so date-bounded queries prune to single-month tables.
+        """
+        logger.info("creating_table_partitions")
         
-        for partition_name, stage_value in partitions:
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS underwriting_data_{partition_name}
+        cursor.execute("\n".join(
+            f"""
+                CREATE TABLE IF NOT EXISTS underwriting_data_{stage}
                 PARTITION OF underwriting_data
-                FOR VALUES IN ('{stage_value}');
+                FOR VALUES IN ('{stage}')
+                PARTITION BY RANGE (extraction_timestamp);
+            """
+            for stage in DEAL_STAGES
+        ) + "CREATE TABLE IF NOT EXISTS underwriting_data_default PARTITION OF underwriting_data DEFAULT;")
+        
+        current_month = datetime.now(timezone.utc).date().replace(day=1)
+        self._create_monthly_partitions(
+            cursor, UNDERWRITING_PARTITION_START,
+            _add_months(current_month, PARTITION_MONTHS_AHEAD)
+        )
+        
+        # Unpartitioned tables from older schemas are converted by
+        # migrations 016 (underwriting_data stages), 007 (annual_cashflows)
+        # and 009 (comparables)
+        cursor.execute("""
+            SELECT c.relname FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = ANY(%s)
+        """, (['annual_cashflows'] + [table for table, _ in COMPARABLES_TABLES],))
+        partitioned = {row[0] for row in cursor.fetchall()}
+        
+        # Matching stage partitions for annual_cashflows
+        statements = []
+        if 'annual_cashflows' in partitioned:
+            statements.extend(
+                f"CREATE TABLE IF NOT EXISTS annual_cashflows_{stage} "
+                f"PARTITION OF annual_cashflows FOR VALUES IN ('{stage}');"
+                for stage in DEAL_STAGES
+            )
+            statements.append(
+                "CREATE TABLE IF NOT EXISTS annual_cashflows_default PARTITION OF annual_cashflows DEFAULT;"
+            )
+        
+        for table, _ in COMPARABLES_TABLES:
+            if table in partitioned:
+                statements.extend(
+                    f"CREATE TABLE IF NOT EXISTS {table}_p{remainder} PARTITION OF {table} "
+                    f"FOR VALUES WITH (MODULUS {COMPARABLES_HASH_PARTITIONS}, REMAINDER {remainder});"
+                    for remainder in range(COMPARABLES_HASH_PARTITIONS)
+                )
+        
+        if statements:
+            cursor.execute("\n".join(statements))
+    
+    def _create_monthly_partitions(self, cursor, first_month: date, last_month: date,
+                                   parents: Optional[Sequence[str]] = None):
+        """
+        Create the DEFAULT and monthly extraction_timestamp sub-partitions of
+        every stage partition for first_month through last_month
+        
+        Stage partitions created before monthly sub-partitioning are plain
+        tables and are skipped until migration
+        016_underwriting_timestamp_partitions converts them.
+        
+        Args:
+            parents: Stage partitions to sub-partition; defaults to every one
+                attached to underwriting_data, including attached stages
+                beyond DEAL_STAGES
+        """
+        if parents is None:
+            cursor.execute("""
+                SELECT c.relname, pt.partrelid IS NOT NULL FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                LEFT JOIN pg_partitioned_table pt ON pt.partrelid = c.oid
+                WHERE i.inhparent = 'underwriting_data'::regclass
+                AND c.relname <> 'underwriting_data_default'
+                ORDER BY c.relname
             """)
+            stage_partitions = cursor.fetchall()
+            parents = [name for name, is_partitioned in stage_partitions if is_partitioned]
+            
+            if len(parents) < len(stage_partitions):
+                logger.warning("stage_partitions_not_subpartitioned",
+                               count=len(stage_partitions) - len(parents))
+        
+        months = []
+        month = first_month
+        while month <= last_month:
+            months.append(month)
+            month = _add_months(month, 1)
+        
+        statements = []
+        for parent in parents:
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {parent}_default PARTITION OF {parent} DEFAULT;"
+            )
+        if statements:
+            cursor.execute("\n".join(statements))
+        
+        statements = []
+        for parent in parents:
+            # A month cannot be created while the DEFAULT partition holds rows
+            # for it, so those months are created by moving the rows out
+            occupied = self._default_partition_months(cursor, parent, months[0], months[-1])
+            for month in months:
+                if month in occupied:
+                    self._create_month_from_default(cursor, parent, month)
+                    continue
+                statements.append(
+                    f"CREATE TABLE IF NOT EXISTS {parent}_{month:%Y_%m} PARTITION OF {parent} "
+                    f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') "
+                    f"TO ('{_add_months(month, 1):%Y-%m-%d} 00:00:00+00');"
+                )
+        
+        if statements:
+            cursor.execute("\n".join(statements))
+    
+    def _default_partition_months(self, cursor, parent: str, first_month: date,
+                                  last_month: date) -> Set[date]:
+        """Months from first_month through last_month with rows in parent's DEFAULT partition"""
+        cursor.execute(f"""
+            SELECT DISTINCT date_trunc('month', extraction_timestamp AT TIME ZONE 'UTC')::date
+            FROM {parent}_default
+            WHERE extraction_timestamp >= %s AND extraction_timestamp < %s
+        """, (f"{first_month:%Y-%m-%d} 00:00:00+00",
+              f"{_add_months(last_month, 1):%Y-%m-%d} 00:00:00+00"))
+        return {row[0] for row in cursor.fetchall()}
+    
+    def _create_month_from_default(self, cursor, parent: str, month: date):
+        """
+        Create a monthly sub-partition of parent whose rows sit in its DEFAULT partition
+        
+        The month's rows and their UNDERWRITING_CHILD_TABLES rows are copied
+        aside, deleted (the child rows through ON DELETE CASCADE) and
+        re-inserted once the partition exists, all in the caller's
+        transaction. Generated columns are left for the server to recompute.
+        """
+        bounds = {
+            'lower': f"{month:%Y-%m-%d} 00:00:00+00",
+            'upper': f"{_add_months(month, 1):%Y-%m-%d} 00:00:00+00",
+        }
+        in_month = "extraction_timestamp >= %(lower)s AND extraction_timestamp < %(upper)s"
+        tables = ['underwriting_data'] + [table for table, _ in UNDERWRITING_CHILD_TABLES]
+        
+        cursor.execute("""
+            SELECT attrelid::regclass::text, string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+            FROM pg_attribute
+            WHERE attrelid = ANY(%s::regclass[]) AND attnum > 0
+            AND NOT attisdropped AND attgenerated = ''
+            GROUP BY attrelid
+        """, (tables,))
+        columns = dict(cursor.fetchall())
+        
+        statements = [
+            f"CREATE TEMP TABLE moved_underwriting_data AS "
+            f"SELECT * FROM {parent}_default WHERE {in_month};"
+        ]
+        statements.extend(
+            f"CREATE TEMP TABLE moved_{table} AS SELECT c.* FROM {table} c "
+            f"JOIN moved_underwriting_data USING (extraction_id, deal_stage, extraction_timestamp);"
+            for table in tables[1:]
+        )
+        statements.append(f"DELETE FROM {parent}_default WHERE {in_month};")
+        statements.append(
+            f"CREATE TABLE {parent}_{month:%Y_%m} PARTITION OF {parent} "
+            f"FOR VALUES FROM (%(lower)s) TO (%(upper)s);"
+        )
+        statements.extend(
+            f"INSERT INTO {table} ({columns[table]}) SELECT {columns[table]} FROM moved_{table};"
+            for table in tables
+        )
+        statements.append(f"DROP TABLE {', '.join(f'moved_{table}' for table in tables)};")
+        
+        cursor.execute("\n".join(statements), bounds)
+        logger.info("default_partition_rows_moved", partition=f"{parent}_{month:%Y_%m}")
+    
+    def ensure_future_partitions(self, months_ahead: int = PARTITION_MONTHS_AHEAD):
+        """
+        Create upcoming monthly sub-partitions before rows arrive for them
+        
+        Called by DataLoader before loading; months whose rows already
+        landed in the DEFAULT partition are created by moving them out.
+        
+        Args:
+            months_ahead: Months after the current one to create
+        """
+        current_month = datetime.now(timezone.utc).date().replace(day=1)
+        logger.info("ensuring_future_partitions", months_ahead=months_ahead)
+        
+        with get_cursor() as cursor:
+            self._create_monthly_partitions(
+                cursor, current_month, _add_months(current_month, months_ahead)
+            )
+    
+    def attach_stage_partition(self, stage: str):
+        """
+        Add a deal stage and its partitions without blocking readers
+        
+        Adds the value to deal_stage_enum, then builds each
+        STAGE_PARTITIONED_TABLES partition as a standalone table and attaches
+        it. A CHECK constraint matching the partition bound lets ATTACH skip
+        validating the new table, so it only briefly locks the parent and
+        scans the DEFAULT partition.
+        
+        Rows already in a DEFAULT partition are not moved, since deleting
+        them would cascade to their comparables and metadata; attach the
+        stage before loading data for it.
+        
+        Args:
+            stage: New deal_stage_enum value, e.g. 'on_hold'
+        
+        Raises:
+            ValueError: If the stage is not a plain identifier or a DEFAULT
+                partition already holds rows for it
+        """
+        if not stage.isidentifier() or stage != stage.lower():
+            raise ValueError(f"Invalid deal stage name: {stage!r}")
+        
+        logger.info("attaching_stage_partition", stage=stage)
+        
+        # A new enum value cannot be used in the transaction that adds it
+        with get_connection(autocommit=True) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("ALTER TYPE deal_stage_enum ADD VALUE IF NOT EXISTS %s;", (stage,))
+        
+        current_month = datetime.now(timezone.utc).date().replace(day=1)
+        
+        with get_cursor() as cursor:
+            cursor.execute(f"SET LOCAL lock_timeout = '{SCHEMA_LOCK_TIMEOUT}';")
+            
+            for table in STAGE_PARTITIONED_TABLES:
+                partition = f"{table}_{stage}"
+                cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (partition,))
+                if cursor.fetchone()[0]:
+                    continue
+                
+                cursor.execute(f"SELECT 1 FROM {table}_default WHERE deal_stage = %s LIMIT 1;", (stage,))
+                if cursor.fetchone():
+                    raise ValueError(f"{table}_default already holds rows for stage {stage!r}")
+                
+                subpartition = " PARTITION BY RANGE (extraction_timestamp)" if table == 'underwriting_data' else ""
+                cursor.execute(f"""
+                    CREATE TABLE {partition} (
+                        LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+                        CONSTRAINT {partition}_stage_check CHECK (deal_stage = '{stage}')
+                    ){subpartition};
+                """)
+                if subpartition:
+                    self._create_monthly_partitions(
+                        cursor, UNDERWRITING_PARTITION_START,
+                        _add_months(current_month, PARTITION_MONTHS_AHEAD),
+                        parents=[partition]
+                    )
+                
+                cursor.execute(f"""
+                    ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES IN ('{stage}');
+                    ALTER TABLE {partition} DROP CONSTRAINT {partition}_stage_check;
+                """)
+        
+        logger.info("stage_partition_attached", stage=stage)
     
     def _create_indexes(self, cursor):
-        """Create database indexes for performance"""
+        """
+        Create database indexes for performance
+        
+        Used while bootstrapping a new, empty schema inside its transaction;
+        use create_indexes_online to add indexes to a populated database.
+        The statements go out as one batch; a failing one aborts the
+        surrounding transaction either way.
+        """
         logger.info("creating_database_indexes")
         
-        indexes = [
-            # Properties table indexes
-            "CREATE INDEX IF NOT EXISTS idx_properties_name ON properties(property_name);",
-            "CREATE INDEX IF NOT EXISTS idx_properties_city_state ON properties(property_city, property_state);",
-            "CREATE INDEX IF NOT EXISTS idx_properties_market ON properties(market);",
-            
-            # Underwriting data indexes
-            "CREATE INDEX IF NOT EXISTS idx_underwriting_property_id ON underwriting_data(property_id);",
-            "CREATE INDEX IF NOT EXISTS idx_underwriting_extraction_timestamp ON underwriting_data(extraction_timestamp);",
-            "CREATE INDEX IF NOT EXISTS idx_underwriting_latest_version ON underwriting_data(is_latest_version) WHERE is_latest_version = TRUE;",
-            "CREATE INDEX IF NOT EXISTS idx_underwriting_property_latest ON underwriting_data(property_id, is_latest_version) WHERE is_latest_version = TRUE;",
-            
-            # Text search indexes
-            "CREATE INDEX IF NOT EXISTS idx_properties_name_gin ON properties USING gin(property_name gin_trgm_ops);",
-            
-            # Cashflows indexes
-            "CREATE INDEX IF NOT EXISTS idx_cashflows_extraction_id ON annual_cashflows(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_cashflows_property_year ON annual_cashflows(property_id, year_number);",
-            
-            # Comparables indexes
-            "CREATE INDEX IF NOT EXISTS idx_rent_comps_extraction_id ON rent_comparables(extraction_id);",
-            "CREATE INDEX IF NOT EXISTS idx_sales_comps_extraction_id ON sales_comparables(extraction_id);",
-            
-            # Metadata indexes
-            "CREATE INDEX IF NOT EXISTS idx_extraction_metadata_extraction_id ON extraction_metadata(extraction_id);"
-        ]
+        cursor.execute(INDEX_DDL)
+    
+    def create_indexes_online(self) -> List[str]:
+        """
+        Create missing indexes without blocking writers
+        
+        Runs on an autocommit connection with CREATE INDEX CONCURRENTLY.
+        Partitioned tables cannot be indexed concurrently, so their index is
+        created ON ONLY the parent and each leaf partition's index is built
+        concurrently and attached. Invalid indexes left by an interrupted
+        concurrent build are rebuilt first.
+        
+        Returns:
+            Names of indexes that could not be created, e.g. on lock timeout
+        """
+        logger.info("creating_database_indexes_online")
+        failed = []
         
-        for index_sql in indexes:
+        with get_connection(autocommit=True) as connection:
+            cursor = connection.cursor()
             try:
-                cursor.execute(index_sql)
-            except Exception as e:
-                logger.warning("index_creation_warning", sql=index_sql, error=str(e))
+                cursor.execute(f"SET statement_timeout = 0; SET lock_timeout = '{ONLINE_INDEX_LOCK_TIMEOUT}';")
+                
+                # IF NOT EXISTS would skip these, so rebuild them in place
+                cursor.execute("""
+                    SELECT c.relname FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public' AND c.relkind = 'i' AND NOT i.indisvalid
+                """)
+                for (index_name,) in cursor.fetchall():
+                    logger.warning("rebuilding_invalid_index", index=index_name)
+                    cursor.execute(f"REINDEX INDEX CONCURRENTLY {index_name};")
+                
+                cursor.execute("SELECT relname FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid")
+                partitioned = {row[0] for row in cursor.fetchall()}
+                
+                for name, table, definition in INDEXES:
+                    try:
+                        if table in partitioned:
+                            self._create_partitioned_index_online(cursor, name, table, definition)
+                        else:
+                            cursor.execute(
+                                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition};"
+                            )
+                    except psycopg2.Error as e:
+                        logger.warning("online_index_creation_failed", index=name, error=str(e))
+                        failed.append(name)
+                
+                # Partitioned indexes cannot be dropped concurrently
+                for name, table in SUPERSEDED_INDEXES:
+                    concurrently = "" if table in partitioned else " CONCURRENTLY"
+                    try:
+                        cursor.execute(f"DROP INDEX{concurrently} IF EXISTS {name};")
+                    except psycopg2.Error as e:
+                        logger.warning("superseded_index_drop_failed", index=name, error=str(e))
+            finally:
+                cursor.close()
+        
+        logger.info("database_indexes_created_online", failed=failed)
+        return failed
+    
+    def _create_partitioned_index_online(self, cursor, name: str, table: str, definition: str):
+        """Build a partitioned table's index leaf by leaf, then attach it up the tree"""
+        # A valid parent index already covers every partition, including ones
+        # created since, which inherit it automatically
+        cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", (name,))
+        existing = cursor.fetchone()
+        if existing and existing[0]:
+            return
+        
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} {definition};")
+        
+        # Parents come before their children (ordered by level)
+        cursor.execute("""
+            SELECT relid::regclass::text, parentrelid::regclass::text, isleaf, relid::oid
+            FROM pg_partition_tree(%s::regclass)
+            WHERE level > 0
+            ORDER BY level
+        """, (table,))
+        
+        index_names = {table: name}
+        for relation, parent, is_leaf, oid in cursor.fetchall():
+            # Partition names are long; the OID keeps the index name unique and short
+            index_name = index_names[relation] = f"{name}_{oid}"
+            if is_leaf:
+                cursor.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {relation} {definition};"
+                )
+            else:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON ONLY {relation} {definition};")
+            cursor.execute(f"ALTER INDEX {index_names[parent]} ATTACH PARTITION {index_name};")
     
     def _create_views(self, cursor):
-        """Create database views for common queries"""
+        """
+        Create database views for common queries
+        
+        latest_underwriting_data is materialized, so dashboard reads do not
+        rescan every partition; call refresh_materialized_views after loading
+        data. portfolio_summary reads the trigger-maintained
+        portfolio_summary_rollup table.
+        """
         logger.info("creating_database_views")
         
-        # Latest data view
+        # Older schemas may have a name as the other kind of view
         cursor.execute("""
-            CREATE OR REPLACE VIEW latest_underwriting_data AS
-            SELECT 
-                u.*,
-                p.property_city,
-                p.property_state,
-                p.market,
-                p.submarket,
-                p.county
+            SELECT c.relname, c.relkind FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = 'public'
+            AND ((c.relkind = 'v' AND c.relname = ANY(%s)) OR (c.relkind = 'm' AND c.relname = ANY(%s)))
+        """, (list(MATERIALIZED_VIEWS), list(VIEWS)))
+        for view, relkind in cursor.fetchall():
+            kind = "MATERIALIZED VIEW" if relkind == 'm' else "VIEW"
+            cursor.execute(f"DROP {kind} IF EXISTS {view} CASCADE;")
+        
+        # Latest data view; the unique index lets it refresh CONCURRENTLY.
+        # Geography is denormalized onto underwriting_data, so no join
+        cursor.execute("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS latest_underwriting_data AS
+            SELECT u.*
             FROM underwriting_data u
-            JOIN properties p ON u.property_id = p.property_id
             WHERE u.is_latest_version = TRUE;
+            
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_latest_underwriting_extraction
+            ON latest_underwriting_data(extraction_id);
+            
+            CREATE INDEX IF NOT EXISTS idx_latest_underwriting_property
+            ON latest_underwriting_data(property_id);
         """)
         
-        # Portfolio summary view
-        cursor.execute("""
+        # Portfolio summary view over per-stage aggregates kept current by
+        # refresh_portfolio_rollup; the table is created here so the view can
+        # be recreated on its own (e.g. by run_migrations)
+        cursor.execute(PORTFOLIO_ROLLUP_TABLE_DDL + """
             CREATE OR REPLACE VIEW portfolio_summary AS
             SELECT 
                 deal_stage,
-                COUNT(*) as property_count,
-                SUM(units) as total_units,
-                SUM(purchase_price) as total_purchase_price,
-                AVG(last_sale_cap_rate) as avg_cap_rate,
-                AVG(levered_returns_irr) as avg_irr
-            FROM latest_underwriting_data
-            WHERE purchase_price IS NOT NULL
-            GROUP BY deal_stage;
+                property_count,
+                total_units,
+                total_purchase_price,
+                avg_cap_rate,
+                avg_irr
+            FROM portfolio_summary_rollup;
         """)
         
-        # Property history view
+        # Property history view. Unordered, so callers that filter or sort
+        # do not pay for a sort; ORDER BY property_id, extraction_timestamp
+        # DESC reads straight from idx_uw_property_ts
         cursor.execute("""
             CREATE OR REPLACE VIEW property_history AS
             SELECT 
@@ -423,11 +1210,84 @@ class SchemaManager:
                 purchase_price,
                 levered_returns_irr,
                 net_operating_income,
-                file_path
-            FROM underwriting_data
-            ORDER BY property_name, extraction_timestamp DESC;
+                file_path,
+                property_id
+            FROM underwriting_data;
         """)
     
+    def _drop_views(self, cursor):
+        """Drop the materialized and plain views, whichever kind each one is"""
+        cursor.execute("""
+            SELECT c.relname, c.relkind FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = 'public' AND c.relkind IN ('v', 'm') AND c.relname = ANY(%s)
+        """, (list(MATERIALIZED_VIEWS + VIEWS),))
+        for view, relkind in cursor.fetchall():
+            kind = "MATERIALIZED VIEW" if relkind == 'm' else "VIEW"
+            cursor.execute(f"DROP {kind} IF EXISTS {view} CASCADE;")
+    
+    def cluster_annual_cashflows(self):
+        """
+        Rewrite annual_cashflows in (metric, property, year) order
+        
+        CLUSTER takes an ACCESS EXCLUSIVE lock while it rewrites the table,
+        so run it after ingest rather than alongside loads.
+        """
+        logger.info("clustering_annual_cashflows")
+        self._cluster_partitioned('annual_cashflows', 'idx_cashflows_metric_prop_year')
+        logger.info("annual_cashflows_clustered")
+    
+    def _cluster_partitioned(self, table: str, index: str):
+        """
+        CLUSTER a partitioned table on one of its partitioned indexes
+        
+        PostgreSQL refuses CLUSTER on a partitioned table inside a
+        transaction block, so this runs on an autocommit connection. Servers
+        before CLUSTER_PARTITIONED_MIN_VERSION cannot cluster a partitioned
+        table at all; there each leaf partition is clustered on its own
+        partition of the index, one transaction per leaf.
+        """
+        with get_connection(autocommit=True) as connection:
+            with connection.cursor() as cursor:
+                if connection.server_version >= CLUSTER_PARTITIONED_MIN_VERSION:
+                    cursor.execute(f"CLUSTER {table} USING {index};")
+                    return
+                
+                cursor.execute("""
+                    SELECT i.indrelid::regclass::text, i.indexrelid::regclass::text
+                    FROM pg_partition_tree(%s::regclass) t
+                    JOIN pg_index i ON i.indexrelid = t.relid
+                    WHERE t.isleaf
+                """, (index,))
+                for leaf_table, leaf_index in cursor.fetchall():
+                    cursor.execute(f"CLUSTER {leaf_table} USING {leaf_index};")
+    
+    def cluster_underwriting_data(self):
+        """
+        Rewrite each underwriting_data partition in (property, newest first) order
+        
+        Keeps a property's versions on adjacent pages for property_history
+        reads. Takes an ACCESS EXCLUSIVE lock like cluster_annual_cashflows.
+        """
+        logger.info("clustering_underwriting_data")
+        self._cluster_partitioned('underwriting_data', 'idx_uw_property_ts')
+        logger.info("underwriting_data_clustered")
+    
+    def refresh_materialized_views(self):
+        """
+        Refresh the materialized views after underwriting data has changed
+        
+        Uses REFRESH ... CONCURRENTLY so dashboard reads are not blocked
+        while the views are rebuilt.
+        """
+        logger.info("refreshing_materialized_views")
+        
+        with get_cursor() as cursor:
+            for view in MATERIALIZED_VIEWS:
+                cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view};")
+        
+        logger.info("materialized_views_refreshed", views=list(MATERIALIZED_VIEWS))
+    
     def _create_functions(self, cursor):
         """Create database functions and triggers"""
         logger.info("creating_database_functions")
@@ -446,126 +1306,90 @@ class SchemaManager:
         # Trigger for properties table
         cursor.execute("""
             DO $$ BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_trigger
+                    WHERE tgname = 'update_properties_updated_at'
+                    AND tgrelid = 'properties'::regclass
+                ) THEN
                 CREATE TRIGGER update_properties_updated_at 
                     BEFORE UPDATE ON properties 
                     FOR EACH ROW 
                     EXECUTE FUNCTION update_updated_at_column();
-            EXCEPTION
-                WHEN duplicate_object THEN null;
+                END IF;
             END $$;
         """)
         
-        # Function to manage version numbering
-        cursor.execute("""
-            CREATE OR REPLACE FUNCTION manage_version_numbering()
-            RETURNS TRIGGER AS $$
-            BEGIN
-                -- Set all previous versions to not latest
-                UPDATE underwriting_data 
-                SET is_latest_version = FALSE 
-                WHERE property_id = NEW.property_id 
-                AND extraction_id != NEW.extraction_id;
-                
-                -- Set version number
-                SELECT COALESCE(MAX(version_number), 0) + 1 
-                INTO NEW.version_number
-                FROM underwriting_data 
-                WHERE property_id = NEW.property_id;
-                
-                -- Ensure this is marked as latest
-                NEW.is_latest_version = TRUE;
-                
-                RETURN NEW;
-            END;
-            $$ language 'plpgsql';
-        """)
+        # Versions are assigned per load batch by finalize_extraction_batch
+        cursor.execute(FINALIZE_EXTRACTION_BATCH_DDL)
         
-        # Trigger for version management
-        cursor.execute("""
-            DO $$ BEGIN
-                CREATE TRIGGER manage_underwriting_versions
-                    BEFORE INSERT ON underwriting_data
-                    FOR EACH ROW
-                    EXECUTE FUNCTION manage_version_numbering();
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """)
+        cursor.execute(PROMOTE_STAGING_DDL)
+        cursor.execute(PROPERTY_GEOGRAPHY_DDL)
+        
+        # Per-stage rollup maintained by statement-level triggers
+        cursor.execute(PORTFOLIO_ROLLUP_DDL)
     
     def drop_schema(self):
         """Drop the entire schema (use with caution)"""
         logger.warning("dropping_database_schema")
+        self._schema_info = None
         
         with get_cursor() as cursor:
             # Drop tables in reverse dependency order
             tables = [
+                'underwriting_data_stage',
+                'portfolio_summary_rollup',
                 'extraction_metadata',
                 'sales_comparables',
                 'rent_comparables',
                 'annual_cashflows',
+                'cashflow_metric',
                 'underwriting_data',
                 'properties'
             ]
             
-            for table in tables:
-                cursor.execute(f"DROP TABLE IF EXISTS {table} CASCADE;")
+            cursor.execute(f"DROP TABLE IF EXISTS {', '.join(tables)} CASCADE;")
             
             # Drop views
-            views = [
-                'latest_underwriting_data',
-                'portfolio_summary',
-                'property_history'
-            ]
-            
-            for view in views:
-                cursor.execute(f"DROP VIEW IF EXISTS {view} CASCADE;")
+            self._drop_views(cursor)
             
             # Drop functions
             cursor.execute("DROP FUNCTION IF EXISTS update_updated_at_column() CASCADE;")
             cursor.execute("DROP FUNCTION IF EXISTS manage_version_numbering() CASCADE;")
+            cursor.execute("DROP FUNCTION IF EXISTS finalize_extraction_batch(UUID[]) CASCADE;")
+            cursor.execute("DROP FUNCTION IF EXISTS promote_staging(UUID) CASCADE;")
+            cursor.execute("DROP FUNCTION IF EXISTS copy_property_geography() CASCADE;")
+            cursor.execute("DROP FUNCTION IF EXISTS cascade_property_geography() CASCADE;")
+            cursor.execute("DROP FUNCTION IF EXISTS portfolio_rollup_trigger() CASCADE;")
+            cursor.execute("DROP FUNCTION IF EXISTS refresh_portfolio_rollup(deal_stage_enum) CASCADE;")
             
             # Drop enums
             cursor.execute("DROP TYPE IF EXISTS deal_stage_enum CASCADE;")
             cursor.execute("DROP TYPE IF EXISTS data_category_enum CASCADE;")
             
+            # Drop tracking tables, so the schema steps and migrations are
+            # applied again when the schema is recreated
+            cursor.execute("DROP TABLE IF EXISTS schema_integrity_snapshot, schema_migrations;")
+            
             logger.info("database_schema_dropped")
     
-    def get_schema_info(self) -> Dict[str, Any]:
-        """Get information about the current schema"""
+    def get_schema_info(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get information about the current schema
+        
+        The result is reused for SCHEMA_INFO_TTL seconds, and dropped when
+        this manager creates or drops the schema.
+        
+        Args:
+            refresh: Query the catalogs even if a cached result is fresh
+        """
+        now = time.monotonic()
+        if not refresh and self._schema_info is not None and now - self._schema_info_at < SCHEMA_INFO_TTL:
+            return dict(self._schema_info)
+        
         with get_cursor() as cursor:
-            # Get table information
-            cursor.execute("""
-                SELECT table_name, 
-                       pg_size_pretty(pg_total_relation_size(quote_ident(table_name))) as size
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_type = 'BASE TABLE'
-                ORDER BY pg_total_relation_size(quote_ident(table_name)) DESC;
-            """)
-            tables = cursor.fetchall()
-            
-            # Get view information
-            cursor.execute("""
-                SELECT table_name 
-                FROM information_schema.views 
-                WHERE table_schema = 'public'
-                ORDER BY table_name;
-            """)
-            views = [row[0] for row in cursor.fetchall()]
-            
-            # Get index information
-            cursor.execute("""
-                SELECT schemaname, tablename, indexname, indexdef
-                FROM pg_indexes 
-                WHERE schemaname = 'public'
-                ORDER BY tablename, indexname;
-            """)
-            indexes = cursor.fetchall()
-            
-            return {
-                'schema_version': self.schema_version,
-                'tables': [{'name': name, 'size': size} for name, size in tables],
-                'views': views,
-                'indexes': [{'table': table, 'name': name, 'definition': definition} 
-                           for schema, table, name, definition in indexes]
-            }
\ No newline at end of file
+            cursor.execute(_SCHEMA_INFO_SQL)
+            info = cursor.fetchone()[0]
+        
+        self._schema_info = {'schema_version': self.schema_version, **info}
+        self._schema_info_at = now
+        return dict(self._schema_info)
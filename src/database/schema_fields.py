@@ -0,0 +1,131 @@
+"""
+Underwriting Field Specification for B&R Capital Dashboard
+
+Single source of truth for the underwriting_data columns loaded from an
+extraction and the extraction field feeding each one. Column lists and
+SQL fragments are derived from FIELD_SPEC once at import time, so the
+INSERT placeholders and the value order can never drift apart.
+
+Only the HOT_COLUMNS that dashboards filter and aggregate on are typed
+underwriting_data columns; every other field is stored as a key of the
+sparse `fields` JSONB column.
+"""
+
+from typing import FrozenSet, Tuple
+
+# Per-extraction metadata columns, filled by the loader rather than from extracted fields
+UNDERWRITING_METADATA_COLUMNS = (
+    'extraction_id', 'property_id', 'property_name', 'deal_stage',
+    'file_path', 'extraction_timestamp', 'file_modified_date', 'file_size_mb'
+)
+
+# (underwriting_data column, extraction field) in parameter order
+FIELD_SPEC: Tuple[Tuple[str, str], ...] = (
+    # General Assumptions
+    ('year_built', 'YEAR_BUILT'),
+    ('year_renovated', 'YEAR_RENOVATED'),
+    ('location_quality', 'LOCATION_QUALITY'),
+    ('building_quality', 'BUILDING_QUALITY'),
+    ('units', 'UNITS'),
+    ('avg_square_feet', 'AVG_SQUARE_FEET'),
+    ('parking_spaces_covered', 'NUMBER_OF_PARKING_SPACES_COVERED'),
+    ('parking_spaces_uncovered', 'NUMBER_OF_PARKING_SPACES_UNCOVERED'),
+    ('individually_metered', 'INDIVIDUALLY_METERED'),
+    ('current_owner', 'CURRENT_OWNER'),
+    ('last_sale_date', 'LAST_SALE_DATE'),
+    ('last_sale_price', 'LAST_SALE_PRICE'),
+    ('last_sale_price_per_unit', 'LAST_SALE_PRICE_PER_UNIT'),
+    ('last_sale_cap_rate', 'LAST_SALE_CAP_RATE'),
+    ('building_height', 'BUILDING_HEIGHT'),
+    ('building_type', 'BUILDING_TYPE'),
+    ('project_type', 'PROJECT_TYPE'),
+    ('number_of_buildings', 'NUMBER_OF_BUILDINGS'),
+    ('building_zoning', 'BUILDING_ZONING'),
+    ('land_area', 'LAND_AREA'),
+    ('parcel_number', 'PARCEL_NUMBER'),
+    ('property_latitude', 'PROPERTY_LATITUDE'),
+    ('property_longitude', 'PROPERTY_LONGITUDE'),
+    ('property_address_field', 'PROPERTY_ADDRESS'),
+    ('property_zip', 'PROPERTY_ZIP'),
+    
+    # Exit Assumptions
+    ('exit_period_months', 'EXIT_PERIOD_MONTHS'),
+    ('exit_cap_rate', 'EXIT_CAP_RATE'),
+    ('sales_transaction_costs', 'SALES_TRANSACTION_COSTS'),
+    
+    # NOI Assumptions
+    ('empirical_rent', 'EMPIRICAL_RENT'),
+    ('rent_psf', 'RENT_PSF'),
+    ('gross_potential_rental_income', 'GROSS_POTENTIAL_RENTAL_INCOME'),
+    ('concessions', 'CONCESSIONS'),
+    ('loss_to_lease', 'LOSS_TO_LEASE'),
+    ('vacancy_loss', 'VACANCY_LOSS'),
+    ('bad_debts', 'BAD_DEBTS'),
+    ('other_loss', 'OTHER_LOSS'),
+    ('property_management_fee', 'PROPERTY_MANAGEMENT_FEE'),
+    ('net_rental_income', 'NET_RENTAL_INCOME'),
+    ('parking_income', 'PARKING_INCOME'),
+    ('laundry_income', 'LAUNDRY_INCOME'),
+    ('other_income', 'OTHER_INCOME'),
+    ('effective_gross_income', 'EFFECTIVE_GROSS_INCOME'),
+    
+    # Operating Expenses
+    ('advertising_marketing', 'ADVERTISING_MARKETING'),
+    ('management_fee', 'MANAGEMENT_FEE'),
+    ('payroll', 'PAYROLL'),
+    ('repairs_maintenance', 'REPAIRS_MAINTENANCE'),
+    ('contract_services', 'CONTRACT_SERVICES'),
+    ('turnover', 'TURNOVER'),
+    ('utilities', 'UTILITIES'),
+    ('insurance', 'INSURANCE'),
+    ('real_estate_taxes', 'REAL_ESTATE_TAXES'),
+    ('other_expenses', 'OTHER_EXPENSES'),
+    ('total_operating_expenses', 'TOTAL_OPERATING_EXPENSES'),
+    ('net_operating_income', 'NET_OPERATING_INCOME'),
+    
+    # Debt and Equity
+    ('purchase_price', 'PURCHASE_PRICE'),
+    ('hard_costs_budget', 'HARD_COSTS_BUDGET'),
+    ('soft_costs_budget', 'SOFT_COSTS_BUDGET'),
+    ('total_hard_costs', 'TOTAL_HARD_COSTS'),
+    ('total_soft_costs', 'TOTAL_SOFT_COSTS'),
+    ('total_acquisition_budget', 'TOTAL_ACQUISITION_BUDGET'),
+    ('loan_amount', 'LOAN_AMOUNT'),
+    ('loan_to_cost', 'LOAN_TO_COST'),
+    ('loan_to_value', 'LOAN_TO_VALUE'),
+    ('equity_lp_capital', 'EQUITY_LP_CAPITAL'),
+    ('equity_gp_capital', 'EQUITY_GP_CAPITAL'),
+    
+    # Return Metrics
+    ('t12_return_on_pp', 'T12_RETURN_ON_PP'),
+    ('t12_return_on_cost', 'T12_RETURN_ON_COST'),
+    ('levered_returns_irr', 'LEVERED_RETURNS_IRR'),
+    ('levered_returns_moic', 'LEVERED_RETURNS_MOIC'),
+    ('basis_unit_at_close', 'BASIS_UNIT_AT_CLOSE'),
+    ('basis_unit_at_exit', 'BASIS_UNIT_AT_EXIT'),
+)
+
+# Fields kept as typed underwriting_data columns
+HOT_COLUMNS: FrozenSet[str] = frozenset({
+    'units', 'year_built', 'purchase_price', 'loan_amount',
+    'effective_gross_income', 'total_operating_expenses', 'net_operating_income',
+    'last_sale_cap_rate', 'exit_cap_rate', 'levered_returns_irr', 'levered_returns_moic',
+})
+
+# FIELD_SPEC split into typed columns and `fields` JSONB keys, each in FIELD_SPEC order
+HOT_FIELD_SPEC = tuple((column, field) for column, field in FIELD_SPEC if column in HOT_COLUMNS)
+JSONB_FIELD_SPEC = tuple((column, field) for column, field in FIELD_SPEC if column not in HOT_COLUMNS)
+
+# `fields` JSONB key for each extraction field after the hot fields
+JSONB_FIELD_KEYS = tuple(column for column, _ in JSONB_FIELD_SPEC)
+
+# underwriting_data columns in parameter order; `fields` takes one JSON document
+UNDERWRITING_COLUMNS = (
+    UNDERWRITING_METADATA_COLUMNS + tuple(column for column, _ in HOT_FIELD_SPEC) + ('fields',)
+)
+
+# Extraction fields in value order: hot columns first, then the JSONB keys
+UNDERWRITING_FIELD_MAPPING = tuple(field for _, field in HOT_FIELD_SPEC + JSONB_FIELD_SPEC)
+
+# Comma-separated column list for INSERT statements
+UNDERWRITING_COLUMN_LIST = ', '.join(UNDERWRITING_COLUMNS)
@@ -174,6 +174,10 @@ class CompleteExtractionToDatabase:
                     print(f"\n📊 Progress: {i}/{len(discovered_files)} files")
                     print(f"   Successful: {successful}, Failed: {failed}")
         
+        # Refresh the dashboard views once for the whole run
+        if successful:
+            self.data_loader.schema_manager.refresh_materialized_views()
+        
         # Step 3: Final summary
         print("\n" + "=" * 70)
         print("🏁 WORKFLOW COMPLETE")
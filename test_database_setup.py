@@ -110,7 +110,7 @@ def test_data_loader_structure():
         
         # Test that key methods exist
         assert hasattr(loader, 'load_extraction_data')
-        assert hasattr(loader, '_register_property')
+        assert hasattr(loader, '_property_params')
         assert hasattr(loader, '_insert_underwriting_data')
         assert hasattr(loader, '_convert_deal_stage')
         assert hasattr(loader, 'load_batch_extraction_results')
@@ -0,0 +1,111 @@
+"""
+Tests for the PostgreSQL binary COPY encoders
+"""
+
+import io
+import sys
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.binary_copy import (
+    ENCODERS, PGCOPY_HEADER, PGCOPY_TRAILER, write_binary_rows
+)
+
+
+def test_numeric_base_10000_digits():
+    """Digit groups are aligned on the decimal point, with weight and dscale"""
+    # 1 2345 . 6780: ndigits 3, weight 1, positive, dscale 3
+    assert ENCODERS['numeric'](Decimal('12345.678')) == (
+        b'\x00\x03\x00\x01\x00\x00\x00\x03' + b'\x00\x01\x09\x29\x1a\x7c'
+    )
+    # Trailing zero groups are dropped: 1 0000 -> one digit of weight 1
+    assert ENCODERS['numeric'](10000) == b'\x00\x01\x00\x01\x00\x00\x00\x00' + b'\x00\x01'
+    # Floats go through their shortest repr, not their binary expansion
+    assert ENCODERS['numeric'](0.1) == b'\x00\x01\xff\xff\x00\x00\x00\x01' + b'\x03\xe8'
+
+
+def test_numeric_negative_and_fraction_only():
+    """Negative values set the sign word; leading fractional zeros lower the weight"""
+    # -0.05 -> 0500 at weight -1, dscale 2
+    assert ENCODERS['numeric'](Decimal('-0.05')) == b'\x00\x01\xff\xff\x40\x00\x00\x02' + b'\x01\xf4'
+
+
+def test_numeric_zero_and_nan():
+    """Zero has no digit groups but keeps its scale; NaN has the NaN sign word"""
+    assert ENCODERS['numeric'](Decimal('0.00')) == b'\x00\x00\x00\x00\x00\x00\x00\x02'
+    assert ENCODERS['numeric'](float('nan')) == b'\x00\x00\x00\x00\xc0\x00\x00\x00'
+    assert ENCODERS['numeric'](Decimal('NaN')) == b'\x00\x00\x00\x00\xc0\x00\x00\x00'
+
+
+def test_numeric_rejects_infinity():
+    """NUMERIC has no infinity in the binary format this writer targets"""
+    with pytest.raises(ValueError):
+        ENCODERS['numeric'](float('inf'))
+
+
+def test_dates_count_days_from_2000():
+    """Dates are int32 days from 2000-01-01, from dates, datetimes or ISO strings"""
+    assert ENCODERS['date'](date(2000, 1, 2)) == b'\x00\x00\x00\x01'
+    assert ENCODERS['date'](date(1999, 12, 31)) == b'\xff\xff\xff\xff'
+    assert ENCODERS['date'](datetime(2000, 1, 2, 23, 59)) == b'\x00\x00\x00\x01'
+    assert ENCODERS['date']('2000-01-02T12:00:00') == b'\x00\x00\x00\x01'
+
+
+def test_timestamps_count_microseconds_from_2000_utc():
+    """Timestamps are int64 microseconds from 2000-01-01 UTC; naive values are UTC"""
+    assert ENCODERS['timestamptz'](datetime(2000, 1, 1, 0, 0, 1, tzinfo=timezone.utc)) == (
+        b'\x00\x00\x00\x00\x00\x0f\x42\x40'
+    )
+    assert ENCODERS['timestamptz'](datetime(2000, 1, 1, 0, 0, 0, 1)) == b'\x00\x00\x00\x00\x00\x00\x00\x01'
+    assert ENCODERS['timestamptz']('2000-01-01T00:00:00Z') == b'\x00' * 8
+    # 01:00 at UTC+1 is midnight UTC
+    plus_one = timezone(timedelta(hours=1))
+    assert ENCODERS['timestamptz'](datetime(2000, 1, 1, 1, tzinfo=plus_one)) == b'\x00' * 8
+    assert ENCODERS['timestamptz'](datetime(1999, 12, 31, 23, 59, 59, tzinfo=timezone.utc)) == (
+        b'\xff\xff\xff\xff\xff\xf0\xbd\xc0'
+    )
+
+
+def test_fixed_width_and_text_encoders():
+    """Integers and floats are big-endian; text, jsonb and uuid are raw bytes"""
+    assert ENCODERS['int2'](-2) == b'\xff\xfe'
+    assert ENCODERS['int4'](1) == b'\x00\x00\x00\x01'
+    assert ENCODERS['int8'](1) == b'\x00\x00\x00\x00\x00\x00\x00\x01'
+    assert ENCODERS['float4'](1.0) == b'\x3f\x80\x00\x00'
+    assert ENCODERS['float8'](-2.0) == b'\xc0\x00\x00\x00\x00\x00\x00\x00'
+    assert ENCODERS['text']('Café') == b'Caf\xc3\xa9'
+    assert ENCODERS['jsonb']('{"a": 1}') == b'\x01{"a": 1}'
+
+    value = uuid.UUID('01890a5d-ac96-774b-bcce-b302099a8057')
+    assert ENCODERS['uuid'](value) == value.bytes
+    assert ENCODERS['uuid'](str(value)) == value.bytes
+
+
+def test_rows_have_field_count_lengths_and_nulls():
+    """Each row is a field count then length-prefixed fields; None is length -1"""
+    buffer = io.BytesIO()
+    row_count = write_binary_rows(buffer, ('int4', 'text'), [(None, 'ab'), (7, None)])
+
+    assert row_count == 2
+    assert PGCOPY_HEADER == b'PGCOPY\n\xff\r\n\x00' + b'\x00' * 8
+    assert buffer.getvalue() == (
+        PGCOPY_HEADER
+        + b'\x00\x02' + b'\xff\xff\xff\xff' + b'\x00\x00\x00\x02ab'
+        + b'\x00\x02' + b'\x00\x00\x00\x04\x00\x00\x00\x07' + b'\xff\xff\xff\xff'
+        + PGCOPY_TRAILER
+    )
+    assert PGCOPY_TRAILER == b'\xff\xff'
+
+
+def test_empty_input_is_header_and_trailer():
+    """No rows still produces a complete (empty) COPY stream"""
+    buffer = io.BytesIO()
+    assert write_binary_rows(buffer, ('int4',), []) == 0
+    assert buffer.getvalue() == PGCOPY_HEADER + PGCOPY_TRAILER
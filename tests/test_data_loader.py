@@ -0,0 +1,52 @@
+"""
+Tests for DataLoader's missing value normalization
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("pandas")
+pytest.importorskip("psycopg2")
+pytest.importorskip("structlog")
+
+from src.database.data_loader import _NULL_STRING_VARIANTS, DataLoader
+from src.database.schema_fields import UNDERWRITING_FIELD_MAPPING
+
+
+def test_null_string_variants_cover_every_capitalization():
+    """'N/A', 'nA' and 'NuLL' are all listed, so the replace needs no lowercasing"""
+    assert {'', 'n/a', 'N/A', 'n/A', 'na', 'NA', 'nA', 'null', 'NULL', 'NuLL'} <= set(_NULL_STRING_VARIANTS)
+    assert len(_NULL_STRING_VARIANTS) == 1 + 4 + 4 + 16
+    assert 'none' not in {variant.lower() for variant in _NULL_STRING_VARIANTS}
+
+
+def test_batch_normalization_matches_per_extraction():
+    """The vectorized batch path gives the same values as _prepare_field_values"""
+    fields = list(UNDERWRITING_FIELD_MAPPING)
+    results = [
+        {fields[0]: 'N/A', fields[1]: 12, fields[2]: 'Phoenix', fields[3]: float('nan')},
+        {fields[0]: 'nUlL', fields[1]: '', fields[2]: 'na ', fields[4]: 0},
+        {},
+    ]
+    loader = DataLoader()
+    
+    batch = loader._prepare_underwriting_batch(results)
+    
+    assert batch == [tuple(loader._prepare_field_values(result)) for result in results]
+    assert batch[0][:4] == (None, 12, 'Phoenix', None)
+    # Whitespace is not trimmed, and 0 is a value rather than a missing one
+    assert batch[1][:5] == (None, None, 'na ', None, 0)
+    assert batch[2] == (None,) * len(fields)
+
+
+def test_batch_normalization_keeps_integers_as_integers():
+    """dtype=object stops pandas from upcasting an int column with gaps to float"""
+    field = UNDERWRITING_FIELD_MAPPING[0]
+    batch = DataLoader()._prepare_underwriting_batch([{field: 7}, {field: None}])
+    assert batch[0][0] == 7 and isinstance(batch[0][0], int)
+    assert batch[1][0] is None
@@ -0,0 +1,44 @@
+"""
+Tests for batched identifier generation
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.ids import new_uuid7s, new_uuids
+
+
+def test_new_uuids_are_random_version_4():
+    """One urandom call still yields distinct, valid version 4 UUIDs"""
+    ids = new_uuids(100)
+    assert len(set(ids)) == 100
+    assert all(value.version == 4 and value.variant == 'specified in RFC 4122' for value in ids)
+
+
+def test_new_uuid7s_are_version_7_in_ascending_order():
+    """A batch is sorted, so its keys land on the right edge of the index in order"""
+    ids = new_uuid7s(1000)
+    assert len(set(ids)) == 1000
+    assert ids == sorted(ids)
+    assert all(value.version == 7 and value.variant == 'specified in RFC 4122' for value in ids)
+
+
+def test_new_uuid7s_lead_with_the_unix_millisecond_timestamp():
+    """The first 48 bits are the generation time, so later batches sort after earlier ones"""
+    before = time.time_ns() // 1_000_000
+    first = new_uuid7s(3)
+    after = time.time_ns() // 1_000_000
+    for value in first:
+        assert before <= value.int >> 80 <= after
+    
+    time.sleep(0.002)
+    assert min(new_uuid7s(3)) > max(first)
+
+
+def test_new_uuid7s_empty_batch():
+    """Zero ids is an empty list, not an error"""
+    assert new_uuid7s(0) == []
@@ -0,0 +1,57 @@
+"""
+Tests for migration ordering
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("psycopg2")
+pytest.importorskip("structlog")
+
+from src.database.migrations import _AVAILABLE_MIGRATIONS, _topological_order
+
+
+def _migration(name, *depends_on):
+    return {'name': name, 'depends_on': depends_on}
+
+
+def _names(migrations):
+    return [migration['name'] for migration in migrations]
+
+
+def test_ordered_list_is_unchanged():
+    """Migrations already in dependency order keep their order"""
+    migrations = (_migration('a'), _migration('b', 'a'), _migration('c'), _migration('d', 'b', 'c'))
+    assert _names(_topological_order(migrations)) == ['a', 'b', 'c', 'd']
+
+
+def test_dependencies_move_ahead_of_dependents():
+    """A migration listed before its dependency is placed right after it"""
+    migrations = (_migration('a'), _migration('c', 'b'), _migration('b', 'a'), _migration('d'))
+    assert _names(_topological_order(migrations)) == ['a', 'b', 'c', 'd']
+
+
+def test_unknown_dependency_is_rejected():
+    """Depending on a migration that does not exist is a definition error"""
+    with pytest.raises(ValueError, match="unknown migration missing"):
+        _topological_order((_migration('a', 'missing'),))
+
+
+def test_cycle_is_rejected():
+    """Migrations that depend on each other cannot be ordered"""
+    migrations = (_migration('a'), _migration('b', 'c'), _migration('c', 'b'))
+    with pytest.raises(ValueError, match="cycle among b, c"):
+        _topological_order(migrations)
+
+
+def test_available_migrations_follow_their_dependencies():
+    """Every shipped migration is applied after everything it depends on"""
+    position = {name: index for index, name in enumerate(_names(_AVAILABLE_MIGRATIONS))}
+    for migration in _AVAILABLE_MIGRATIONS:
+        for dependency in migration['depends_on']:
+            assert position[dependency] < position[migration['name']]
@@ -0,0 +1,36 @@
+"""
+Tests for the underwriting field specification
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.schema_fields import (
+    FIELD_SPEC, HOT_COLUMNS, HOT_FIELD_SPEC, JSONB_FIELD_KEYS, UNDERWRITING_COLUMNS,
+    UNDERWRITING_FIELD_MAPPING, UNDERWRITING_METADATA_COLUMNS
+)
+
+
+def test_field_spec_size():
+    """Every underwriting_data data column has exactly one extraction field"""
+    assert len(FIELD_SPEC) == 71
+    assert len(UNDERWRITING_FIELD_MAPPING) == len(FIELD_SPEC)
+    assert len(HOT_FIELD_SPEC) + len(JSONB_FIELD_KEYS) == len(FIELD_SPEC)
+
+
+def test_field_spec_has_no_duplicates():
+    """Columns and extraction fields are each used once"""
+    assert len(set(UNDERWRITING_COLUMNS)) == len(UNDERWRITING_COLUMNS)
+    assert len(set(UNDERWRITING_FIELD_MAPPING)) == len(UNDERWRITING_FIELD_MAPPING)
+
+
+def test_hot_columns_are_typed_and_the_rest_is_jsonb():
+    """Hot fields get their own column, everything else shares `fields`"""
+    assert HOT_COLUMNS <= {column for column, _ in FIELD_SPEC}
+    assert UNDERWRITING_COLUMNS == (
+        UNDERWRITING_METADATA_COLUMNS + tuple(column for column, _ in HOT_FIELD_SPEC) + ('fields',)
+    )
+    assert not HOT_COLUMNS & set(JSONB_FIELD_KEYS)